@@ -1,10 +1,13 @@
 import os
-import pickle
+import sys
 import logging
 import pandas as pd
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from RandomForest import RandomForestPredictor
+
+# Shared Modules of the Diabetes REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ModelRegistry import ModelRegistry, Get_Model_Registry
 
 # Set Up Logging
 logging.basicConfig(
@@ -19,31 +22,62 @@ load_dotenv(dotenv_path='.env')
 # Initialize SERVER PORT
 port = int(os.getenv('PORT', 5000))
 
+# "sklearn" serves the Pickled RandomForestPredictor, "compiled" its NumPy Export (CompiledForest.py) without scikit-learn
+engine = os.getenv("CHOLESTEROL_ENGINE", "sklearn")
+if engine == "compiled":
+    from CompiledForest import CompiledForest
+else:
+    # Unpickling the Model needs its Class
+    from RandomForest import RandomForestPredictor
+
 class CholesterolLevel:
     def __init__(self) -> None:
-        pass
+        """Loads the RandomForest Model once and keeps it Resident, Reloading it when the Artifact Changes."""
+        self.registry: ModelRegistry = Get_Model_Registry()
+        if engine == "compiled":
+            self.registry.Register("Cholesterol", os.getenv("CHOLESTEROL_MODEL_PATH", "model.npz"), CompiledForest.from_bytes)
+        else:
+            self.registry.Register("Cholesterol", os.getenv("CHOLESTEROL_MODEL_PATH", "model.pkl"))
     
     def Cholesterol_Predict(self, users_data: dict) -> tuple:
-        """Predicts the Cholesterol Level based on User's General Data."""
+        """Predicts the Cholesterol Level based on User's General Data, with the Version of the Model used."""
         try:
-            X_new = pd.DataFrame([users_data])
-            with open('model.pkl', 'rb') as file:
-                predictor = pickle.load(file)
+            # The Compiled Engine reads the Rows directly, without the DataFrame Overhead
+            X_new = [users_data] if engine == "compiled" else pd.DataFrame([users_data])
+            predictor, version = self.registry.Get("Cholesterol")
             
             users_data["Cholesterol Level"] = predictor.predict(X_new)
-            return users_data
+            return users_data, version
         except Exception as e:
             logging.error("Error Occurred in Cholesterol Level Prediction: ", exc_info=e)
             raise e
 
+    def Cholesterol_Predict_Batch(self, users_data) -> tuple:
+        """Predicts the Cholesterol Level of every User of a Batch with one vectorized predict.
+
+        users_data is either a list of user dicts (rows) or a dict of equally long lists (columns).
+        Returns the per-row predictions, in input order, with the Version of the Model used.
+        """
+        try:
+            X_new = users_data if engine == "compiled" else pd.DataFrame(users_data)
+            predictor, version = self.registry.Get("Cholesterol")
+            
+            return predictor.predict_batch(X_new).tolist(), version
+        except Exception as e:
+            logging.error("Error Occurred in Batch Cholesterol Level Prediction: ", exc_info=e)
+            raise e
+
 class CholesterolPredictionAPI:
     
     def __init__(self) -> None:
         """Initializes the Flask App and sets up the Blueprint."""
         self.app = Flask(__name__)
         self.cholesterol_level = CholesterolLevel()
+        self.max_batch_rows = int(os.getenv("CHOLESTEROL_BATCH_MAX_ROWS", 100000))
         self.blueprint = Blueprint('cholesterol_level', __name__)
         self.blueprint.add_url_rule('/cholesterol_level', 'cholesterol_level', self.Cholesterol_Level, methods=['POST'])
+        self.blueprint.add_url_rule('/cholesterol_level/batch', 'cholesterol_level_batch', self.Cholesterol_Level_Batch, methods=['POST'])
+        self.blueprint.add_url_rule('/cholesterol_level/metrics', 'cholesterol_level_metrics', self.Cholesterol_Level_Metrics, methods=['POST'])
         self.app.register_blueprint(self.blueprint)
         
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -68,11 +102,12 @@ class CholesterolPredictionAPI:
                 }), 403
 
             request_data = request_data["data"]
-            users_data = self.cholesterol_level.Cholesterol_Predict(request_data)
+            users_data, model_version = self.cholesterol_level.Cholesterol_Predict(request_data)
 
             response = {
                 "success": True,
                 "data": users_data,
+                "model_version": model_version,
                 "message": "Cholesterol Level Predicted!"
             }
             return jsonify(response), 200
@@ -85,6 +120,96 @@ class CholesterolPredictionAPI:
                 "message": "Failed to Predict Cholesterol"
             }), 500
 
+    def Cholesterol_Level_Batch(self) -> Response:
+        """Predicts the Cholesterol Level of a Batch of Users, given as a List of Rows or as Columns."""
+        try:
+            request_data = request.get_json()
+
+            if not self.Authenticate_Request(request_data):
+                logging.warning("Request Authentication Failed.")
+                return jsonify({
+                    "success": False,
+                    "data": {},
+                    "message": "Authentication Failed."
+                }), 403
+
+            users_data = request_data.get("data")
+            if isinstance(users_data, list) and all(isinstance(row, dict) for row in users_data):
+                rows = len(users_data)
+            elif isinstance(users_data, dict) and all(isinstance(column, list) for column in users_data.values()):
+                lengths = {len(column) for column in users_data.values()}
+                if len(lengths) > 1:
+                    return jsonify({
+                        "success": False,
+                        "data": {},
+                        "message": "All Columns must have the Same Length."
+                    }), 400
+                rows = lengths.pop() if lengths else 0
+            else:
+                return jsonify({
+                    "success": False,
+                    "data": {},
+                    "message": "data must be a List of Users or a Dict of Columns."
+                }), 400
+
+            if rows == 0:
+                return jsonify({
+                    "success": False,
+                    "data": {},
+                    "message": "No Users to Predict."
+                }), 400
+            if rows > self.max_batch_rows:
+                return jsonify({
+                    "success": False,
+                    "data": {},
+                    "message": f"At most {self.max_batch_rows} Users per Batch."
+                }), 413
+
+            predictions, model_version = self.cholesterol_level.Cholesterol_Predict_Batch(users_data)
+
+            response = {
+                "success": True,
+                "data": {"rows": rows, "Cholesterol Level": predictions},
+                "model_version": model_version,
+                "message": "Cholesterol Levels Predicted!"
+            }
+            return jsonify(response), 200
+
+        except Exception as e:
+            logging.error('An Error Occurred while Batch Cholesterol Level Prediction: ', exc_info=e)
+            return jsonify({
+                "success": False,
+                "data": {},
+                "message": "Failed to Predict Cholesterol"
+            }), 500
+
+    def Cholesterol_Level_Metrics(self) -> Response:
+        """Returns the Active Model Version and Load Metrics."""
+        try:
+            request_data = request.get_json()
+
+            if not self.Authenticate_Request(request_data):
+                logging.warning("Request Authentication Failed.")
+                return jsonify({
+                    "success": False,
+                    "data": {},
+                    "message": "Authentication Failed."
+                }), 403
+
+            return jsonify({
+                "success": True,
+                "data": self.cholesterol_level.registry.Metrics(),
+                "message": "Model Metrics Fetched!"
+            }), 200
+
+        except Exception as e:
+            logging.error('An Error Occurred while Fetching the Model Metrics: ', exc_info=e)
+            return jsonify({
+                "success": False,
+                "data": {},
+                "message": "Failed to Fetch Model Metrics"
+            }), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
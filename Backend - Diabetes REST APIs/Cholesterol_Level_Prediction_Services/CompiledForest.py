@@ -0,0 +1,305 @@
+import io
+import os
+import sys
+import json
+import logging
+import argparse
+import numpy as np
+from typing import Any, Dict, List, Tuple
+
+# Configure Logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+class CompiledForest:
+    """
+    A scikit-learn-free Inference Engine for a fitted RandomForestPredictor.
+
+    The preprocessing (imputer statistics, one-hot vocabularies, scaler parameters) and every tree
+    of the forest are compiled into flat, contiguous NumPy arrays by export_model(). All trees are
+    traversed at once, one level per step over the node indices of every (row, tree) pair; leaves
+    point to themselves, and the pairs that reached one are dropped from the following steps. The arithmetic follows scikit-learn's own
+    (float64 preprocessing, features rounded to float32 before the splits, leaf probabilities summed
+    in tree order and then divided), so the predictions are bit-exact; see verify_parity().
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Initializes the Engine from the Arrays of an Exported Model.
+
+        Parameters:
+            arrays (Dict[str, np.ndarray]): The arrays written by export_model().
+        """
+        header = json.loads(arrays["header"].tobytes().decode("utf-8"))
+        self.categorical_features: List[str] = header["categorical_features"]
+        self.numeric_features: List[str] = header["numeric_features"]
+        self.categorical_fill: List[Any] = header["categorical_fill"]
+        self.vocabularies: List[Dict[Any, int]] = [
+            {category: code for code, category in enumerate(categories)} for categories in header["categories"]
+        ]
+        self.offsets = np.cumsum([0] + [len(categories) for categories in header["categories"]])
+        self.classes = np.asarray(header["classes"])
+
+        self.numeric_fill = np.ascontiguousarray(arrays["numeric_fill"], dtype=np.float64)
+        self.scaler_mean = np.ascontiguousarray(arrays["scaler_mean"], dtype=np.float64)
+        self.scaler_scale = np.ascontiguousarray(arrays["scaler_scale"], dtype=np.float64)
+        self.roots = np.ascontiguousarray(arrays["roots"], dtype=np.int32)
+        # Child of node i is children[2*i + went_left], so a step is a single gather.
+        self.children = np.ascontiguousarray(np.stack([arrays["right"], arrays["left"]], axis=1).ravel(), dtype=np.int32)
+        self.feature = np.ascontiguousarray(arrays["feature"], dtype=np.int32)
+        self.threshold = np.ascontiguousarray(arrays["threshold"], dtype=np.float64)
+        self.values = np.ascontiguousarray(arrays["values"], dtype=np.float64)
+        self.max_depth = int(arrays["max_depth"])
+        self.n_features = int(self.offsets[-1]) + len(self.numeric_features)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CompiledForest":
+        """
+        Loads an Exported Model from the Bytes of its .npz Artifact, as a ModelRegistry loader.
+        """
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            return cls({name: arrays[name] for name in arrays.files})
+
+    def _column(self, X: Any, column: str, rows: int) -> np.ndarray:
+        """Returns a Column of a DataFrame, a Dict of Columns or a List of Rows as an Object Array."""
+        if isinstance(X, list):
+            return np.array([row.get(column) for row in X], dtype=object)
+        if column in X:
+            return np.asarray(X[column], dtype=object)
+        # Columns left out are imputed like missing values.
+        return np.full(rows, None, dtype=object)
+
+    def transform(self, X: Any) -> np.ndarray:
+        """
+        Applies the Compiled Preprocessing, returning the Features the Trees split on.
+
+        Parameters:
+            X (Any): A DataFrame, a dict of columns or a list of row dicts.
+
+        Returns:
+            np.ndarray: float32 feature matrix, one-hot columns first, then the scaled numeric columns.
+        """
+        rows = len(next(iter(X.values()), [])) if isinstance(X, dict) else len(X)
+        features = np.zeros((rows, self.n_features), dtype=np.float64)
+
+        for position, column in enumerate(self.categorical_features):
+            fill, vocabulary = self.categorical_fill[position], self.vocabularies[position]
+            codes = np.fromiter(
+                (vocabulary.get(fill if value is None or value != value else value, -1) for value in self._column(X, column, rows)),
+                dtype=np.intp, count=rows
+            )
+            # Unknown categories are ignored, leaving their one-hot block all zeros.
+            known = codes >= 0
+            features[np.flatnonzero(known), self.offsets[position] + codes[known]] = 1.0
+
+        numeric = np.empty((rows, len(self.numeric_features)), dtype=np.float64)
+        for position, column in enumerate(self.numeric_features):
+            numeric[:, position] = self._column(X, column, rows).astype(np.float64)
+        missing = np.isnan(numeric)
+        numeric[missing] = np.broadcast_to(self.numeric_fill, numeric.shape)[missing]
+        numeric -= self.scaler_mean
+        numeric /= self.scaler_scale
+        features[:, int(self.offsets[-1]):] = numeric
+        return features.astype(np.float32)
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """
+        Predicts the Class Probabilities of every Row, evaluating all Trees at once.
+
+        Parameters:
+            X (Any): A DataFrame, a dict of columns or a list of row dicts.
+
+        Returns:
+            np.ndarray: Probabilities of shape (rows, classes), in the order of the classes.
+        """
+        features = self.transform(X)
+        rows, trees = features.shape[0], len(self.roots)
+        flat = features.ravel()
+
+        # One (row, tree) pair per element, row-major; pairs that reached a leaf are dropped.
+        nodes = np.tile(self.roots, rows)
+        active = np.arange(nodes.size)
+        current = nodes.copy()
+        row_offsets = np.repeat(np.arange(rows, dtype=np.int64) * features.shape[1], trees)
+        for _ in range(self.max_depth):
+            went_left = flat.take(row_offsets + self.feature.take(current)) <= self.threshold.take(current)
+            following = self.children.take(2 * current + went_left)
+            nodes[active] = following
+            moved = following != current
+            if not moved.all():
+                active, following, row_offsets = active[moved], following[moved], row_offsets[moved]
+                if not active.size:
+                    break
+            current = following
+
+        # Sum the leaf probabilities in tree order, as scikit-learn does.
+        leaves = nodes.reshape(rows, trees)
+        proba = np.zeros((rows, self.values.shape[1]), dtype=np.float64)
+        for tree in range(trees):
+            proba += self.values.take(leaves[:, tree], axis=0)
+        proba /= trees
+        return proba
+
+    def predict_batch(self, X: Any) -> np.ndarray:
+        """
+        Predicts the Target Value of every Row of the provided Input Data.
+
+        Returns:
+            np.ndarray: One Prediction per Row, in Input Order.
+        """
+        return self.classes.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def predict(self, X: Any) -> float:
+        """
+        Predicts the Target Value for the provided Input Data and returns the Mean of Predictions, like RandomForestPredictor.
+        """
+        return np.mean(self.predict_batch(X))
+
+
+def export_model(predictor: Any) -> Dict[str, np.ndarray]:
+    """
+    Compiles a fitted RandomForestPredictor into the Flat Arrays of a CompiledForest.
+
+    Parameters:
+        predictor (RandomForestPredictor): The fitted predictor.
+
+    Returns:
+        Dict[str, np.ndarray]: The arrays, to be saved with save_model().
+    """
+    preprocessor = predictor.model.named_steps['preprocessor']
+    classifier = predictor.model.named_steps['classifier']
+    categorical = preprocessor.named_transformers_['cat']
+    numeric = preprocessor.named_transformers_['num']
+    encoder = categorical.named_steps['onehot']
+    scaler = numeric.named_steps['scaler']
+
+    if [name for name, _, _ in preprocessor.transformers_ if name != 'remainder'] != ['cat', 'num']:
+        raise ValueError("Unsupported Preprocessor Layout.")
+    if encoder.drop_idx_ is not None or getattr(encoder, '_infrequent_enabled', False):
+        raise ValueError("Dropped or Infrequent One-Hot Categories are not Supported.")
+    if classifier.n_outputs_ != 1:
+        raise ValueError("Multi-Output Forests are not Supported.")
+
+    import sklearn
+    legacy_counts = tuple(int(part) for part in sklearn.__version__.split('.')[:2]) < (1, 4)
+
+    # Concatenate the Trees, re-basing Child Indices; Leaves point to Themselves.
+    roots, left, right, feature, threshold, values = [], [], [], [], [], []
+    offset = 0
+    for estimator in classifier.estimators_:
+        tree = estimator.tree_
+        node_ids = np.arange(tree.node_count)
+        leaf = tree.children_left == -1
+        roots.append(offset)
+        left.append(np.where(leaf, node_ids, tree.children_left) + offset)
+        right.append(np.where(leaf, node_ids, tree.children_right) + offset)
+        feature.append(np.where(leaf, 0, tree.feature))
+        threshold.append(np.where(leaf, 0.0, tree.threshold))
+        value = np.array(tree.value[:, 0, :classifier.n_classes_], dtype=np.float64)
+        if legacy_counts:
+            # Older scikit-learn stores class counts and normalizes them at predict time.
+            normalizer = value.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            value /= normalizer
+        values.append(value)
+        offset += tree.node_count
+
+    header = {
+        "categorical_features": list(predictor.categorical_features),
+        "numeric_features": list(predictor.numeric_features),
+        "categorical_fill": categorical.named_steps['imputer'].statistics_.tolist(),
+        "categories": [categories.tolist() for categories in encoder.categories_],
+        "classes": classifier.classes_.tolist()
+    }
+    scale = scaler.scale_ if scaler.scale_ is not None else np.ones(len(predictor.numeric_features))
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(len(predictor.numeric_features))
+    return {
+        "header": np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8),
+        "numeric_fill": np.asarray(numeric.named_steps['imputer'].statistics_, dtype=np.float64),
+        "scaler_mean": np.asarray(mean, dtype=np.float64),
+        "scaler_scale": np.asarray(scale, dtype=np.float64),
+        "roots": np.asarray(roots, dtype=np.int64),
+        "left": np.concatenate(left).astype(np.int64),
+        "right": np.concatenate(right).astype(np.int64),
+        "feature": np.concatenate(feature).astype(np.int64),
+        "threshold": np.concatenate(threshold).astype(np.float64),
+        "values": np.ascontiguousarray(np.concatenate(values)),
+        "max_depth": np.asarray(max(estimator.tree_.max_depth for estimator in classifier.estimators_))
+    }
+
+
+def save_model(arrays: Dict[str, np.ndarray], path: str) -> None:
+    """
+    Writes the Exported Arrays as an .npz Artifact, replacing the File atomically for hot reload.
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        np.savez(file, **arrays)
+    os.replace(temporary, path)
+
+
+def sample_rows(engine: CompiledForest, rows: int, random_state: int = 24) -> Dict[str, list]:
+    """
+    Draws Verification Rows covering known, unknown and missing Categories and Numeric Values
+    spread around and beyond the Training Distribution.
+    """
+    rng = np.random.default_rng(random_state)
+    data: Dict[str, list] = {}
+    for position, column in enumerate(engine.categorical_features):
+        choices = list(engine.vocabularies[position]) + ["Unknown Category", None]
+        data[column] = [choices[index] for index in rng.integers(0, len(choices), rows)]
+    for position, column in enumerate(engine.numeric_features):
+        spread = engine.scaler_mean[position] + engine.scaler_scale[position] * rng.normal(0, 2, rows)
+        data[column] = [None if missing else float(value) for value, missing in zip(spread, rng.random(rows) < 0.05)]
+    return data
+
+
+def verify_parity(predictor: Any, engine: CompiledForest, X: Any) -> Tuple[bool, Dict[str, int]]:
+    """
+    Checks that the Compiled Engine reproduces the scikit-learn Pipeline Bit for Bit.
+
+    Parameters:
+        predictor (RandomForestPredictor): The fitted predictor the engine was exported from.
+        engine (CompiledForest): The compiled engine.
+        X (pd.DataFrame): Rows to compare on.
+
+    Returns:
+        Tuple[bool, Dict[str, int]]: Whether probabilities and predictions are identical, and the mismatch counts.
+    """
+    expected_proba = predictor.model.predict_proba(X)
+    expected = predictor.model.predict(X)
+    proba = engine.predict_proba(X)
+    predictions = engine.predict_batch(X)
+    mismatches = {
+        "rows": len(X),
+        "probability_rows": int(np.sum(np.any(proba != expected_proba, axis=1))),
+        "predictions": int(np.sum(predictions != expected))
+    }
+    return mismatches["probability_rows"] == 0 and mismatches["predictions"] == 0, mismatches
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Compile a Pickled RandomForestPredictor into a NumPy Inference Artifact.")
+    parser.add_argument("model", help="Path of the pickled RandomForestPredictor, e.g. model.pkl.")
+    parser.add_argument("output", help="Path of the .npz artifact to write, e.g. model.npz.")
+    parser.add_argument("--verify-rows", type=int, default=10000, help="Rows the parity check compares on.")
+    args = parser.parse_args()
+
+    # Exporting and Verifying need the Pickled Class, and with it scikit-learn; serving does not.
+    import pickle
+    import pandas as pd
+    from RandomForest import RandomForestPredictor
+
+    with open(args.model, 'rb') as file:
+        predictor = pickle.load(file)
+    arrays = export_model(predictor)
+    engine = CompiledForest(arrays)
+
+    X = pd.DataFrame(sample_rows(engine, args.verify_rows))
+    identical, mismatches = verify_parity(predictor, engine, X)
+    if not identical:
+        logging.error(f"Compiled Model does not Match the scikit-learn Pipeline: {mismatches}")
+        sys.exit(1)
+
+    save_model(arrays, args.output)
+    logging.info(f"Compiled {len(arrays['roots'])} Trees, {len(arrays['left'])} Nodes into {args.output}; Parity Verified on {mismatches['rows']} Rows.")
@@ -118,4 +118,24 @@ class RandomForestPredictor:
             return mean_prediction
         except Exception as e:
             logging.error('An Error Occurred during Prediction.', exc_info=True)
-            raise e
\ No newline at end of file
+            raise e
+
+    def predict_batch(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Predicts the Target Value of every Row of the provided Input Data in one vectorized Call.
+        
+        Parameters:
+            X (pd.DataFrame): The Input features for Prediction, one row per user.
+        
+        Returns:
+            np.ndarray: One Prediction per Row, in Input Order.
+        """
+        try:
+            # Columns left out of the payload are imputed like missing values.
+            missing = [column for column in self.categorical_features + self.numeric_features if column not in X.columns]
+            if missing:
+                X = X.assign(**{column: np.nan for column in missing})
+            return self.model.predict(X)
+        except Exception as e:
+            logging.error('An Error Occurred during Batch Prediction.', exc_info=True)
+            raise e
@@ -0,0 +1,157 @@
+import os
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ResidentModel:
+    """A Model Artifact loaded once and kept in Memory, Reloaded when the File Changes.
+
+    The loaded model and its version are published together as one tuple, so a reload swaps
+    them atomically: requests already holding the previous model finish with it, and new
+    requests get the new one. The version is the start of the SHA-256 of the artifact bytes.
+    """
+
+    def __init__(self, name: str, path: str, loader: Callable[[bytes], Any]) -> None:
+        """Loads the Artifact; the Service fails to start if it cannot be loaded.
+
+        Args:
+            name (str): Name of the model, used for logs and metrics.
+            path (str): Path of the model artifact.
+            loader (Callable[[bytes], Any]): Builds the model from the artifact bytes.
+        """
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self._signature: Optional[Tuple[int, int]] = None
+        self._current: Tuple[Any, str] = (None, "")
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {
+            "loads": 0,
+            "failed_reloads": 0,
+            "loaded_at": None,
+            "load_seconds": 0.0,
+            "last_error": None
+        }
+        self.Reload()
+
+    def _Signature(self) -> Tuple[int, int]:
+        status = os.stat(self.path)
+        return status.st_mtime_ns, status.st_size
+
+    def Get(self) -> Tuple[Any, str]:
+        """Returns the Active Model and its Version."""
+        return self._current
+
+    def Reload(self, force: bool = True) -> bool:
+        """Loads the Artifact again if its mtime or size changed (always if force) and its Hash differs.
+
+        Returns:
+            bool: True if a new version was swapped in.
+        """
+        with self._lock:
+            signature = self._Signature()
+            if not force and signature == self._signature:
+                return False
+
+            start = time.monotonic()
+            with open(self.path, "rb") as file:
+                data = file.read()
+            version = hashlib.sha256(data).hexdigest()[:12]
+            self._signature = signature
+            if version == self._current[1]:
+                # Touched or rewritten with the same bytes.
+                return False
+
+            model = self.loader(data)
+            self._current = (model, version)
+            self._metrics["loads"] += 1
+            self._metrics["loaded_at"] = time.time()
+            self._metrics["load_seconds"] = time.monotonic() - start
+            logging.info(f"Loaded {self.name} Model Version {version} in {self._metrics['load_seconds']:.3f}s.")
+            return True
+
+    def Check(self) -> None:
+        """Reloads a Changed Artifact, keeping the Active Model if the New One fails to Load."""
+        try:
+            self.Reload(force=False)
+        except Exception as error:
+            with self._lock:
+                self._metrics["failed_reloads"] += 1
+                self._metrics["last_error"] = repr(error)
+            logging.error(f"Failed to Reload the {self.name} Model, Keeping Version {self._current[1]}", exc_info=True)
+
+    def Metrics(self) -> Dict[str, Any]:
+        """Returns the Active Version and the Load Metrics."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics.update({"name": self.name, "path": self.path, "version": self._current[1]})
+        return metrics
+
+
+class ModelRegistry:
+    """Process-Wide Registry of Resident Models, with a Watcher Thread that Hot-Reloads Changed Artifacts."""
+
+    def __init__(self, check_interval: float = 5.0) -> None:
+        """Initializes the Empty Registry.
+
+        Args:
+            check_interval (float): Seconds between checks of the artifacts; 0 disables hot reload.
+        """
+        self.check_interval = check_interval
+        self._models: Dict[str, ResidentModel] = {}
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+
+    def Register(self, name: str, path: str, loader: Callable[[bytes], Any] = pickle.loads) -> ResidentModel:
+        """Loads a Model Artifact once, or returns the Model already Registered under the Name.
+
+        Args:
+            name (str): Name of the model.
+            path (str): Path of the model artifact.
+            loader (Callable[[bytes], Any]): Builds the model from the artifact bytes, unpickling by default.
+
+        Returns:
+            ResidentModel: The resident model.
+        """
+        with self._lock:
+            if name not in self._models:
+                self._models[name] = ResidentModel(name, path, loader)
+            if self.check_interval > 0 and self._watcher is None:
+                self._watcher = threading.Thread(target=self._Watch_Loop, name="ModelRegistry", daemon=True)
+                self._watcher.start()
+            return self._models[name]
+
+    def Get(self, name: str) -> Tuple[Any, str]:
+        """Returns the Active Model and Version Registered under a Name."""
+        return self._models[name].Get()
+
+    def _Watch_Loop(self) -> None:
+        while True:
+            time.sleep(self.check_interval)
+            with self._lock:
+                models = list(self._models.values())
+            for model in models:
+                model.Check()
+
+    def Metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the Metrics of every Registered Model."""
+        with self._lock:
+            models = list(self._models.values())
+        return {model.name: model.Metrics() for model in models}
+
+
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def Get_Model_Registry() -> ModelRegistry:
+    """Returns the Process-Wide Model Registry, configured by MODEL_CHECK_INTERVAL."""
+    global _model_registry
+    with _model_registry_lock:
+        if _model_registry is None:
+            _model_registry = ModelRegistry(check_interval=float(os.getenv("MODEL_CHECK_INTERVAL", 5)))
+        return _model_registry
@@ -1,11 +1,15 @@
 import os
-import pickle
+import sys
 import logging
 import pandas as pd
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
 from LogisticRegression import LogisticRegressionPredictor
 
+# Shared Modules of the Diabetes REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ModelRegistry import ModelRegistry, Get_Model_Registry
+
 # Set Up Logging
 logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s",
@@ -21,14 +25,15 @@ port = int(os.getenv('PORT', 5000))
 
 class DiabetesCategory:
     def __init__(self) -> None:
-        pass
+        """Loads the Logistic Regression Model once and keeps it Resident, Reloading it when the Artifact Changes."""
+        self.registry: ModelRegistry = Get_Model_Registry()
+        self.registry.Register("Diabetes Category", os.getenv("DIABETES_MODEL_PATH", "lr_model.pkl"))
     
     def Diabetes_Predict(self, users_data: dict) -> tuple:
-        """Predicts the Diabetes Category based on User's General Data."""
+        """Predicts the Diabetes Category based on User's General Data, with the Version of the Model used."""
         try:
             X_new = pd.DataFrame([users_data])
-            with open('lr_model.pkl', 'rb') as file:
-                predictor = pickle.load(file)
+            predictor, version = self.registry.Get("Diabetes Category")
                 
             users_data["Diabetes"] = predictor.predict(X_new)[0]
             
@@ -41,7 +46,7 @@ class DiabetesCategory:
             elif users_data["Diabetes"] > 0.75 and users_data["Diabetes"] <= 1.0:
                 users_data["Diabetes Category"] = "Type-3 Diabetes"
             
-            return users_data
+            return users_data, version
         except Exception as e:
             logging.error("Error Occurred in Diabetes Category Prediction: ", exc_info=e)
             raise e
@@ -54,6 +59,7 @@ class DiabetesPredictionAPI:
         self.diabetes_category = DiabetesCategory()
         self.blueprint = Blueprint('diabetes_category', __name__)
         self.blueprint.add_url_rule('/diabetes_category', 'diabetes_category', self.Diabetes_Category, methods=['POST'])
+        self.blueprint.add_url_rule('/diabetes_category/metrics', 'diabetes_category_metrics', self.Diabetes_Category_Metrics, methods=['POST'])
         self.app.register_blueprint(self.blueprint)
         
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -78,11 +84,12 @@ class DiabetesPredictionAPI:
                 }), 403
 
             request_data = request_data["data"]
-            users_data = self.diabetes_category.Diabetes_Predict(request_data)
+            users_data, model_version = self.diabetes_category.Diabetes_Predict(request_data)
 
             response = {
                 "success": True,
                 "data": users_data,
+                "model_version": model_version,
                 "message": "Diabetes Category Predicted!"
             }
             return jsonify(response), 200
@@ -95,6 +102,33 @@ class DiabetesPredictionAPI:
                 "message": "Failed to Predict Diabetes"
             }), 500
 
+    def Diabetes_Category_Metrics(self) -> Response:
+        """Returns the Active Model Version and Load Metrics."""
+        try:
+            request_data = request.get_json()
+
+            if not self.Authenticate_Request(request_data):
+                logging.warning("Request Authentication Failed.")
+                return jsonify({
+                    "success": False,
+                    "data": {},
+                    "message": "Authentication Failed."
+                }), 403
+
+            return jsonify({
+                "success": True,
+                "data": self.diabetes_category.registry.Metrics(),
+                "message": "Model Metrics Fetched!"
+            }), 200
+
+        except Exception as e:
+            logging.error('An Error Occurred while Fetching the Model Metrics: ', exc_info=e)
+            return jsonify({
+                "success": False,
+                "data": {},
+                "message": "Failed to Fetch Model Metrics"
+            }), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
@@ -0,0 +1,477 @@
+import os
+import sys
+import asyncio
+import logging
+import aiomysql
+from typing import Any, Dict, List, Tuple
+from dotenv import load_dotenv
+from quart import Blueprint, Quart, jsonify, request, Response
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.AsyncConnectionPool import (
+    AsyncConnectionPool, Close_Async_Pools, Get_Async_Pool, Start_Async_Pools
+)
+from Common_Services.FeatureCharts import PieChart_Result, Percentile_Of_Async
+from Common_Services.FeatureQuery import Diagnosis_Params, Diagnosis_Query
+from Common_Services.FeatureRegistry import Enabled_Features
+from Common_Services.PasswordHasher import PasswordHasher, Get_Password_Hasher
+
+# Set Up Logging
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()]
+)
+
+# Load Environment Variables
+load_dotenv(dotenv_path='.env')
+
+# Initialize SERVER PORT
+port = int(os.getenv('PORT', 5000))
+
+
+class AsyncLogin:
+    """Handles Non-Blocking Database Interaction for User Login."""
+
+    def __init__(self) -> None:
+        """Initializes the Shared Async Database Connection Pool and Password Hasher of the Service."""
+        self.pool: AsyncConnectionPool = Get_Async_Pool("Login")
+        self.hasher: PasswordHasher = Get_Password_Hasher()
+
+    async def Rehash_Password(self, email: str, password: str, stored_password: str) -> None:
+        """Replaces a Legacy or Outdated Stored Password with a Fresh KDF Hash.
+
+        Args:
+            email (str): The user's email.
+            password (str): The verified plaintext password.
+            stored_password (str): The stored value that was verified.
+        """
+        try:
+            new_hash = await asyncio.wrap_future(self.hasher.Submit_Hash(password))
+            async with self.pool.Get_Connection() as connection:
+                async with connection.cursor() as cursor:
+                    rehash_query = "UPDATE UsersData SET `Password` = %s WHERE Email = %s AND `Password` = %s"
+                    await cursor.execute(rehash_query, (new_hash, email, stored_password))
+                    await connection.commit()
+        except Exception:
+            logging.error("An Error Occurred while Rehashing the User's Password", exc_info=True)
+
+    async def Users_Data_Table(self, email: str, password: str) -> Tuple[bool, str]:
+        """Validates the User's Email and Password against the Database.
+
+        Args:
+            email (str): The user's email.
+            password (str): The user's password.
+
+        Returns:
+            Tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        try:
+            async with self.pool.Get_Connection() as connection:
+                async with connection.cursor() as cursor:
+                    # Fetch the Stored Credential, no Row means the Email does not Exist
+                    login_query = "SELECT `Password` FROM UsersData WHERE Email = %s LIMIT 1"
+                    await cursor.execute(login_query, (email,))
+                    row = await cursor.fetchone()
+
+            if row is None:
+                return False, "Invalid Email"
+
+            # Validate Password on the Hasher Worker Pool
+            stored_password = row[0]
+            matches, needs_rehash = await asyncio.wrap_future(self.hasher.Submit_Verify(password, stored_password))
+            if not matches:
+                return False, "Invalid Password"
+
+            if needs_rehash:
+                await self.Rehash_Password(email, password, stored_password)
+            return True, "Login Success!"
+        except Exception:
+            logging.error("An Error Occurred during user validation", exc_info=True)
+            return False, "An Error Occurred. Please try again later."
+
+
+class AsyncSignUp:
+    """Handles Non-Blocking Database Interaction for User Sign-Up."""
+
+    def __init__(self) -> None:
+        """Initializes the Shared Async Database Connection Pool and Password Hasher of the Service."""
+        self.pool: AsyncConnectionPool = Get_Async_Pool("SignUp")
+        self.hasher: PasswordHasher = Get_Password_Hasher()
+
+    async def Users_Data_Table(self, full_name: str, user_name: str, email: str, password: str,
+                               country: str, country_code: str, phone_number: str, address: str) -> Tuple[bool, str]:
+        """Registers a New User in the Database after Validating Input.
+
+        Args:
+            full_name (str): User's full name.
+            user_name (str): Desired username.
+            email (str): User's email address.
+            password (str): User's password.
+            country (str): Country of residence.
+            country_code (str): Country code.
+            phone_number (str): User's phone number.
+            address (str): User's address.
+
+        Returns:
+            Tuple[bool, str]: A tuple containing a boolean indicating success and a message.
+        """
+        try:
+            password_hash = await asyncio.wrap_future(self.hasher.Submit_Hash(password))
+            async with self.pool.Get_Connection() as connection:
+                async with connection.cursor() as cursor:
+                    # Validate if the Email, Username, or Phone number Already Exists;
+                    # the Email of a Deleted Account stays Reserved until it is Purged
+                    validate_query = """
+                        SELECT Email, Username, MobileNumber
+                        FROM UsersData
+                        WHERE Email = %s OR Username = %s OR MobileNumber = %s
+                        UNION ALL
+                        SELECT Email, NULL, NULL
+                        FROM DeletedAccounts
+                        WHERE Email = %s AND PurgedAt IS NULL;
+                    """
+                    await cursor.execute(validate_query, (email, user_name, phone_number, email))
+                    existing_data = await cursor.fetchall()
+
+                    if any(row[0] == email for row in existing_data):
+                        return False, "Email Already Registered."
+                    if any(row[1] == user_name for row in existing_data):
+                        return False, "Username Already Registered."
+                    if any(row[2] == phone_number for row in existing_data):
+                        return False, "Phone Number Already Registered."
+
+                    # Insert New User into the Database
+                    insert_query = """
+                        INSERT INTO UsersData (
+                            FullName, Username, Email, `Password`, Country,
+                            CountryCode, MobileNumber, Address
+                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);
+                    """
+                    await cursor.execute(insert_query, (full_name, user_name, email, password_hash, country, country_code, phone_number, address))
+                    await connection.commit()
+                    return True, "User Registered Successfully"
+
+        except aiomysql.MySQLError:
+            logging.error("Database Error Occurred: ", exc_info=True)
+            return False, "Database Error Occurred. Please try again later."
+        except Exception:
+            logging.error("An Unexpected Error Occurred: ", exc_info=True)
+            return False, "An Unexpected Error Occurred. Please try again later."
+
+
+class AsyncPieChart:
+    """Handles Non-Blocking Database Interaction for Pie Charts."""
+
+    def __init__(self) -> None:
+        """Initializes the Shared Async Database Connection Pool of the Service."""
+        self.pool: AsyncConnectionPool = Get_Async_Pool("PieChart")
+
+    async def Users_Features_Table(self, email: str) -> Tuple[bool, Any]:
+        """Get the value of every enabled feature diagnosis report
+
+        Args:
+            email (str): User's email address.
+
+        Returns:
+            Tuple[bool, list]: A tuple containing a boolean indicating success and the per-feature results.
+        """
+        try:
+            # Read every enabled Feature's Diagnosis with One Statement, as the Flask Service does.
+            features = Enabled_Features()
+            diagnoses = {feature: None for feature in features}
+            if features:
+                async with self.pool.Get_Connection() as connection:
+                    async with connection.cursor() as cursor:
+                        await cursor.execute(Diagnosis_Query(features), Diagnosis_Params(email, features))
+                        diagnoses.update(await cursor.fetchall())
+
+            results = []
+            for key, value in diagnoses.items():
+                success, values, message = PieChart_Result(feature=key, value=value)
+                results.append([success, values, message])
+            return True, results
+        except aiomysql.MySQLError:
+            logging.error("Database Error Occurred: ", exc_info=True)
+            return False, "Database Error Occurred. Please try again later."
+        except Exception:
+            logging.error("An Unexpected Error Occurred: ", exc_info=True)
+            return False, "An Unexpected Error Occurred. Please try again later."
+
+
+class AsyncBarChart:
+    """Handles Non-Blocking Database Interaction for Bar Charts.
+
+    Ranks with the FeatureHistograms rows in "histogram" PERCENTILE_MODE, and otherwise with a
+    count in the database, as the service holds no in-memory percentile index.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the Shared Async Database Connection Pool and the Percentile Mode of the Service."""
+        self.pool: AsyncConnectionPool = Get_Async_Pool("BarChart")
+        self.percentile_mode: str = os.getenv("PERCENTILE_MODE", "exact").lower()
+
+    async def Users_Features_Table(self, email: str) -> Tuple[bool, Any, str]:
+        """Get the Percentile of the User across every enabled Feature
+
+        Args:
+            email (str): User's email address.
+
+        Returns:
+            Tuple[bool, float, str]: A tuple containing a boolean indicating success, the percentile and a message.
+        """
+        try:
+            percentile = 0
+            features = Enabled_Features()
+            if features:
+                async with self.pool.Get_Connection() as connection:
+                    async with connection.cursor() as cursor:
+                        await cursor.execute(Diagnosis_Query(features), Diagnosis_Params(email, features))
+                        diagnoses = dict(await cursor.fetchall())
+
+                        for key, (table, column) in features.items():
+                            value = diagnoses.get(key)
+                            if value is not None:
+                                percentile = await Percentile_Of_Async(cursor, key, table, column, value, self.percentile_mode)
+                            else:
+                                percentile = 0
+            return True, percentile/8, "Percentile of the User Successfully Calculated."
+        except Exception:
+            logging.error("An Unexpected Error Occurred: ", exc_info=True)
+            return False, None, "An Unexpected Error Occurred. Please try again later."
+
+
+class AsyncCountryCodes:
+    """Handles Non-Blocking Data Retrieval for Country Codes."""
+
+    def __init__(self) -> None:
+        """Initializes the Shared Async Database Connection Pool of the Service."""
+        self.pool: AsyncConnectionPool = Get_Async_Pool("CountryCodes")
+
+    async def Country_Codes_Table(self) -> List[Dict[str, Any]]:
+        """Fetches Country Codes from the Database.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries containing Country Names and Country Codes.
+
+        Raises:
+            Exception: If any Error Occurs during Database Access.
+        """
+        try:
+            async with self.pool.Get_Connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute("SELECT CountryName, CountryCode FROM CountryCodes")
+                    result = await cursor.fetchall()
+            return [{"CountryName": row[0], "CountryCode": row[1]} for row in result]
+        except Exception as e:
+            logging.error("An Error Occurred while Fetching Country Codes", exc_info=True)
+            raise e
+
+
+class AsyncUserQuery:
+    """Handles Non-Blocking Database Interaction for Storing User Queries."""
+
+    def __init__(self) -> None:
+        """Initializes the Shared Async Database Connection Pool of the Service."""
+        self.pool: AsyncConnectionPool = Get_Async_Pool("UserQuery")
+
+    async def Users_Query_Table(self, name: str, email: str, query: str) -> Tuple[bool, str]:
+        """Saves the User's Query to the Database.
+
+        Args:
+            name (str): The user's name.
+            email (str): The user's email.
+            query (str): The user's query.
+
+        Returns:
+            Tuple[bool, str]: A tuple containing a success flag and a message.
+        """
+        try:
+            async with self.pool.Get_Connection() as connection:
+                async with connection.cursor() as cursor:
+                    insert_query = """
+                        INSERT INTO UsersQueries (Name, Email, Query)
+                        VALUES (%s, %s, %s)
+                    """
+                    await cursor.execute(insert_query, (name, email, query))
+                    await connection.commit()
+                    logging.info("Query saved successfully for user: %s", name)
+                    return True, "Query Saved Successfully"
+        except aiomysql.MySQLError:
+            logging.error("Database Error Occurred: ", exc_info=True)
+            return False, "Database Error Occurred. Please try again later."
+        except Exception:
+            logging.error("An Unexpected Error Occurred: ", exc_info=True)
+            return False, "An Unexpected Error Occurred. Please try again later."
+
+
+class AsyncGeneralAPI:
+    """Quart (ASGI) API Class serving the Login, SignUp, PieChart, BarChart, CountryCodes and
+    UserQuery Endpoints with the same Request and Response Contracts as their Flask Services.
+
+    Serve with an ASGI server, e.g. ``hypercorn AsyncGeneralAPI:app``.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the Quart App and sets up the Blueprints."""
+        self.app = Quart(__name__)
+        self.login = AsyncLogin()
+        self.sign_up = AsyncSignUp()
+        self.pie_chart = AsyncPieChart()
+        self.bar_chart = AsyncBarChart()
+        self.country_codes = AsyncCountryCodes()
+        self.user_query = AsyncUserQuery()
+
+        routes = [
+            ('Login', '/Login', self.Users_Login_Data),
+            ('SignUp', '/SignUp', self.Sign_Up),
+            ('PieChart', '/PieChart', self.Pie_Chart),
+            ('BarChart', '/BarChart', self.Bar_Chart),
+            ('CountryCodes', '/CountryCodes', self.Country_Codes_Data),
+            ('UserQuery', '/UserQuery', self.User_Query)
+        ]
+        for name, rule, view_func in routes:
+            blueprint = Blueprint(name, __name__)
+            blueprint.add_url_rule(rule=rule, endpoint=name, view_func=view_func, methods=['POST'])
+            self.app.register_blueprint(blueprint)
+
+        self.app.before_serving(Start_Async_Pools)
+        self.app.after_serving(Close_Async_Pools)
+
+    def Authenticate_Request(self, req_data: dict, token_name: str) -> bool:
+        """Authenticates the Incoming Request based on Environment-Stored Credentials.
+
+        Args:
+            req_data (dict): The request data containing user, password, and token.
+            token_name (str): Environment variable holding the endpoint's token, the one its Flask service reads.
+
+        Returns:
+            bool: True if the request is authenticated, False otherwise.
+        """
+        return (
+            req_data.get("user") == os.getenv("AUTH_NAME") and
+            req_data.get("password") == os.getenv("AUTH_PASSWORD") and
+            req_data.get("token") == os.getenv(token_name)
+        )
+
+    async def Users_Login_Data(self) -> Response:
+        """Handles POST requests for User Login."""
+        try:
+            req_data = await request.get_json()
+
+            if not self.Authenticate_Request(req_data, "AUTH_TOKEN_LOGIN"):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            success, message = await self.login.Users_Data_Table(req_data["email"], req_data["userpassword"])
+            return jsonify({"success": success, "message": message}), 200
+
+        except Exception as e:
+            logging.error("An Error Cccurred during the Login Process", exc_info=True)
+            return jsonify({"success": False, "message": str(e)}), 400
+
+    async def Sign_Up(self) -> Response:
+        """Handles POST requests for User Sign-Up."""
+        try:
+            req_data = await request.get_json()
+
+            if not self.Authenticate_Request(req_data, "AUTH_TOKEN_SIGNUP"):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            success, message = await self.sign_up.Users_Data_Table(
+                req_data["fullname"], req_data["username"], req_data["email"], req_data["userpassword"],
+                req_data["country"], req_data["countrycode"], req_data["phone"], req_data["address"]
+            )
+            return jsonify({"success": success, "message": message}), 200
+
+        except Exception:
+            logging.error("An Error Occurred during the Sign-Up Process", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
+    async def Pie_Chart(self) -> Response:
+        """Handles POST requests for Pie Chart."""
+        try:
+            req_data = await request.get_json()
+
+            if not self.Authenticate_Request(req_data, "AUTH_TOKEN_PIECHART"):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            success, result = await self.pie_chart.Users_Features_Table(req_data["email"])
+            response = {"success": success, "data": result, "message": "Successfully Fetched the Feature Diagnosis."}
+            return jsonify(response), 200
+        except Exception:
+            logging.error("An Error Occurred during the Fetching Pie Charts Data.", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
+    async def Bar_Chart(self) -> Response:
+        """Handles POST requests for Bar Chart."""
+        try:
+            req_data = await request.get_json()
+
+            if not self.Authenticate_Request(req_data, "AUTH_TOKEN_BARCHART"):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            success, percentile, message = await self.bar_chart.Users_Features_Table(req_data["email"])
+            response = {"success": success, "data": percentile, "message": message}
+            return jsonify(response), 200
+        except Exception:
+            logging.error("An Error Occurred during the Fetching Bar Charts Data.", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
+    async def Country_Codes_Data(self) -> Response:
+        """Handles POST requests to fetch Country Codes, with Authentication."""
+        try:
+            req_data = await request.get_json()
+
+            if not self.Authenticate_Request(req_data, "AUTH_TOKEN"):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            data = await self.country_codes.Country_Codes_Table()
+            response = {
+                "success": True,
+                "data": data,
+                "message": "Country codes successfully fetched."
+            }
+            return jsonify(response), 200
+
+        except Exception as e:
+            logging.error("An Error Occurred during the API Call", exc_info=True)
+            return jsonify({"success": False, "message": str(e)}), 400
+
+    async def User_Query(self) -> Response:
+        """Handles POST Requests to save User Queries."""
+        try:
+            req_data = await request.get_json()
+
+            if not self.Authenticate_Request(req_data, "AUTH_TOKEN"):
+                logging.warning("Request Authentication Failed.")
+                return jsonify({
+                    "success": False,
+                    "message": "Authentication Failed."
+                }), 403
+
+            success, message = await self.user_query.Users_Query_Table(req_data["name"], req_data["email"], req_data["query"])
+            return jsonify({"success": success, "message": message}), 200 if success else 500
+
+        except Exception:
+            logging.error("An Error Occurred while Handling the Query Submission: ", exc_info=True)
+            return jsonify({
+                "success": False,
+                "message": "Failed to process query. Please try again."
+            }), 500
+
+    def run(self) -> None:
+        """Runs the Quart App with its Development Server."""
+        try:
+            self.app.run(debug=True, host='0.0.0.0', port=port)
+        except Exception:
+            logging.error("An Error Occurred while running the App", exc_info=True)
+
+
+async_general_api = AsyncGeneralAPI()
+app = async_general_api.app
+
+
+if __name__ == "__main__":
+
+    async_general_api.run()
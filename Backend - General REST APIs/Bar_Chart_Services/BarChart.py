@@ -1,10 +1,20 @@
 import os
+import sys
 import logging
 import pymysql
-from typing import Tuple
+from typing import Dict, Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.FeatureCharts import Percentile_Of
+from Common_Services.FeatureQuery import Fetch_Diagnoses
+from Common_Services.FeatureRegistry import Enabled_Features, feature_list
+from Common_Services.OrderStatistics import OrderStatisticsIndex, Get_Order_Statistics
+from Common_Services.QuantileSketch import SharedQuantileSketch, Get_Quantile_Sketch
+from Common_Services.ResultCache import UserResultCache, Get_Result_Cache, Result_Cache_Metrics
 
 # Set Up Logging
 logging.basicConfig(
@@ -24,115 +34,77 @@ class BarChart:
     """Handles Database Interaction for Bar Charts"""
     
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
+        """Initializes the Shared Database Connection Pool and the Percentile Index of every enabled Feature.
         
-        Returns:
-            pymysql.connections.Connection: The database connection object.
+        PERCENTILE_MODE selects in-memory order statistics that apply the FeatureChanges feed
+        within about a second ("indexed", default), mergeable quantile sketches shared across
+        workers ("approximate"), the materialized FeatureHistograms table maintained on write
+        ("histogram") or a count in the database on every request ("exact"), as the Dashboard does.
         """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        self.pool: ConnectionPool = Get_Pool("BarChart")
+        self.feature_list = feature_list
+        self.cache: UserResultCache = Get_Result_Cache("BarChart")
+        self.cache.Start()
+        self.percentile_mode: str = os.getenv("PERCENTILE_MODE", "indexed").lower()
+        self.order_statistics: Dict[Tuple[str, str], OrderStatisticsIndex] = {}
+        self.quantile_sketches: Dict[Tuple[str, str], SharedQuantileSketch] = {}
+        for key, value in self.feature_list.items():
+            if value is None or self.percentile_mode in ("histogram", "exact"):
+                continue
+            if self.percentile_mode == "approximate":
+                sketch = Get_Quantile_Sketch(key, value[0], value[1])
+                sketch.Start()
+                self.quantile_sketches[(value[0], value[1])] = sketch
+            else:
+                index = Get_Order_Statistics(key, value[0], value[1])
+                index.Load()
+                self.order_statistics[(value[0], value[1])] = index
         
-    def BarChart_Values(self, email:str, feature: str, table: str, column: str) -> Tuple[bool, list, str]:
-        """
-        Return Diagnosis of each Health Feature
+    def Users_Features_Table(self, email: str) -> Tuple[bool, list]:
+        """Get the value of a particluar feature diagnosis report
         
         Args:
             email (str): User's email address.
-            feature (str): Feature Name that user is using.
-            table (str): Table name of the Feature Diagnosis.
-            column (str): Column of the Feature Table where the diagnosis value exists.
-            
+        
         Returns:
-            Tuple[bool, list, str]: A tuple containing a boolean indicating success, list containing values and a message.
+            Tuple[bool, str]: A tuple containing a boolean indicating success and a message.
         """
+        cached = self.cache.Get(email)
+        if cached is not None:
+            return cached
+        
         connection = None
         try:
-            connection = self.Database_Connection()
+            percentile_sum = 0
+            
+            # Read every enabled Feature's Diagnosis with One Connection and One Statement.
+            features = Enabled_Features()
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
+                diagnoses = Fetch_Diagnoses(cursor, email, features)
                 
-                get_query = f"""
-                    SELECT {column}
-                    FROM {table}
-                    WHERE Email = %s;
-                """
-                cursor.execute(get_query, (email,))
-                value = cursor.fetchone()
-
-                if value and value[0] is not None:
-                    diagnosis = round(100*float(value[0]), 4)
-                      
-                    get_all_query = f"""SELECT {column} FROM {table}"""
-                    cursor.execute(get_all_query)
-                    
-                    values = cursor.fetchall()
-                    values = [100*float(row[0]) for row in values]
-                    less_values = [val for val in values if val <= diagnosis]
-                    
-                    percentile = (len(less_values)/len(values))*100
-                    
-                    return True, percentile
-                else:
-                    return False, 0  
+                for key, value in diagnoses.items():
+                    if value is not None:
+                        table, column = features[key]
+                        index = self.quantile_sketches.get((table, column)) or self.order_statistics.get((table, column))
+                        percentile = Percentile_Of(cursor, key, table, column, value, self.percentile_mode, index)
+                    else:
+                        percentile = 0
+                    percentile_sum += percentile
+            result = (True, percentile/8, "Percentile of the User Successfully Calculated.")
+            self.cache.Put(email, result)
+            return result
         except pymysql.MySQLError:
             logging.error("Database Error Occurred: ", exc_info=True)
-            return False, "Database Error Occurred. Please try again later."
+            return False, None, "Database Error Occurred. Please try again later."
         except Exception:
             logging.error("An Unexpected Error Occurred: ", exc_info=True)
-            return False, "An Unexpected Error Occurred. Please try again later."
+            return False, None, "An Unexpected Error Occurred. Please try again later."
         
         finally:
             if connection:
                 connection.close()
 
-    def Users_Features_Table(self, email: str) -> Tuple[bool, list]:
-        """Get the value of a particluar feature diagnosis report
-        
-        Args:
-            email (str): User's email address.
-        
-        Returns:
-            Tuple[bool, str]: A tuple containing a boolean indicating success and a message.
-        """
-        try:
-            feature_list = {
-                "Diabetes": ["UsersDiabetesData", "DiabetesStatus"],
-                "Asthma": None,
-                "Cadiovascular": None,
-                "Arthritis": None,
-                "Heart & Stroke": None,
-                "Migrane Control": None,
-                "Bronchitis": None,
-                "Live Condition Analysis": None
-            }
-            percentile_sum = 0
-            
-            for key, value in feature_list.items():
-                # Remove the Condition afterward once all Services are started.
-                if value is not None:
-                    success, percentile = self.BarChart_Values(email=email,
-                                                                    feature=key,
-                                                                    table=value[0],
-                                                                    column=value[1])
-                    percentile_sum += percentile
-            return True, percentile/8, "Percentile of the User Successfully Calculated."
-        except Exception:
-            logging.error("An Unexpected Error Occurred: ", exc_info=True)
-            return False, None, "An Unexpected Error Occurred. Please try again later."
-
 
 class BarChartsAPI:
     """Flask API Class for Handling Bar Chart Requests."""
@@ -148,6 +120,12 @@ class BarChartsAPI:
             view_func=self.Bar_Chart,
             methods=['POST']
         )
+        self.blueprint.add_url_rule(
+            rule='/BarChart/Metrics',
+            endpoint='BarChartMetrics',
+            view_func=self.Bar_Chart_Metrics,
+            methods=['POST']
+        )
         self.app.register_blueprint(self.blueprint)
         
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -186,6 +164,32 @@ class BarChartsAPI:
             logging.error("An Error Occurred during the Fetching Bar Charts Data.", exc_info=True)
             return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
 
+    def Bar_Chart_Metrics(self) -> Response:
+        """Handles POST requests for the Bar Chart Result Cache and Order Statistics Metrics.
+        
+        Returns:
+            Response: A Flask Response object containing the metrics.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            response = {
+                "success": True,
+                "data": {
+                    "caches": Result_Cache_Metrics(),
+                    "order_statistics": {column: index.Metrics() for (_, column), index in self.bar_chart.order_statistics.items()}
+                },
+                "message": "Successfully Fetched the Bar Chart Metrics."
+            }
+            return jsonify(response), 200
+        except Exception:
+            logging.error("An Error Occurred during the Fetching Bar Chart Metrics.", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
@@ -0,0 +1,107 @@
+import os
+import logging
+import aiomysql
+from typing import Dict, Optional
+
+
+class AsyncConnectionPool:
+    """Non-Blocking Pool of aiomysql Connections for the ASGI Services.
+
+    The Google Cloud SQL Connector has no async MySQL driver, so the async pool always connects
+    directly over TCP (DB_HOST, DB_PORT) or a unix socket (DB_UNIX_SOCKET), e.g. to the
+    Cloud SQL Auth Proxy or a private IP.
+    """
+
+    def __init__(self, service: str) -> None:
+        """Initializes Database Connection and Pool parameters from Environment Variables.
+
+        Args:
+            service (str): Name of the service the pool belongs to, used for metrics.
+        """
+        self.service = service
+        self.user: str = os.getenv("USER")
+        self.password: str = os.getenv("PASSWORD")
+        self.database: str = os.getenv("DATABASE")
+        self.host: str = os.getenv("DB_HOST", "127.0.0.1")
+        self.port: int = int(os.getenv("DB_PORT", 3306))
+        self.unix_socket: Optional[str] = os.getenv("DB_UNIX_SOCKET") or None
+        self.min_size: int = int(os.getenv("DB_POOL_MIN_SIZE", 1))
+        self.max_size: int = int(os.getenv("DB_POOL_MAX_SIZE", 10))
+        self.idle_timeout: int = int(os.getenv("DB_POOL_IDLE_TIMEOUT", 300))
+        self._pool: Optional[aiomysql.Pool] = None
+
+    async def Start(self) -> None:
+        """Creates the Pool on the running Event Loop and opens min_size Connections."""
+        if self._pool is None:
+            self._pool = await aiomysql.create_pool(
+                host=self.host,
+                port=self.port,
+                unix_socket=self.unix_socket,
+                user=self.user,
+                password=self.password,
+                db=self.database,
+                minsize=self.min_size,
+                maxsize=self.max_size,
+                pool_recycle=self.idle_timeout
+            )
+            logging.info(f"Async Connection Pool for {self.service} Started.")
+
+    def Get_Connection(self):
+        """Checks out a Connection; use as ``async with pool.Get_Connection() as connection``.
+
+        Raises:
+            RuntimeError: If the pool has not been started.
+        """
+        if self._pool is None:
+            raise RuntimeError(f"Async Connection Pool for {self.service} is not started.")
+        return self._pool.acquire()
+
+    def Metrics(self) -> Dict[str, int]:
+        """Returns a Snapshot of the Pool Occupancy."""
+        size = self._pool.size if self._pool else 0
+        idle = self._pool.freesize if self._pool else 0
+        return {
+            "service": self.service,
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": self.min_size,
+            "max_size": self.max_size
+        }
+
+    async def Close(self) -> None:
+        """Closes every Connection of the Pool."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.close()
+            await pool.wait_closed()
+
+
+_async_pools: Dict[str, AsyncConnectionPool] = {}
+
+
+def Get_Async_Pool(service: str) -> AsyncConnectionPool:
+    """Returns the Process-Wide Async Connection Pool of a Service, creating it on first use.
+
+    Args:
+        service (str): Name of the service, e.g. "Login".
+
+    Returns:
+        AsyncConnectionPool: The shared pool for the service, started by Start_Async_Pools().
+    """
+    pool = _async_pools.get(service)
+    if pool is None:
+        pool = _async_pools[service] = AsyncConnectionPool(service)
+    return pool
+
+
+async def Start_Async_Pools() -> None:
+    """Starts every Async Pool created so far."""
+    for pool in list(_async_pools.values()):
+        await pool.Start()
+
+
+async def Close_Async_Pools() -> None:
+    """Closes every Async Pool created so far."""
+    for pool in list(_async_pools.values()):
+        await pool.Close()
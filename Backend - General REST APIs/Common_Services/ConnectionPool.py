@@ -0,0 +1,343 @@
+import os
+import time
+import atexit
+import logging
+import pymysql
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from Common_Services.DatabaseConnector import Database_Connection, Get_Database_Connector
+
+
+class PooledConnection:
+    """Proxy around a pymysql Connection that returns it to its Pool on close()."""
+
+    def __init__(self, pool: "ConnectionPool", connection: pymysql.connections.Connection) -> None:
+        """Wraps a Raw Connection checked out from the given Pool.
+
+        Args:
+            pool (ConnectionPool): The pool that owns the connection.
+            connection (pymysql.connections.Connection): The raw database connection.
+        """
+        self._pool = pool
+        self._connection = connection
+        self._broken = False
+
+    def __getattr__(self, name: str) -> Any:
+        if self._connection is None:
+            raise pymysql.err.InterfaceError("Connection already returned to the Pool.")
+        return getattr(self._connection, name)
+
+    def cursor(self, *args, **kwargs) -> pymysql.cursors.Cursor:
+        """Returns a Cursor that marks the connection as broken on Operational Errors."""
+        cursor = self._connection.cursor(*args, **kwargs)
+        execute = cursor.execute
+
+        def Guarded_Execute(query: str, args: Any = None) -> int:
+            try:
+                return execute(query, args)
+            except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+                self._broken = True
+                raise
+
+        cursor.execute = Guarded_Execute
+        return cursor
+
+    def close(self) -> None:
+        """Returns the Connection to the Pool instead of closing the Socket."""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool.Release(connection, broken=self._broken)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-Safe Pool of Database Connections shared by all Requests of a Service."""
+
+    def __init__(self, service: str, connect: Callable[[], pymysql.connections.Connection],
+                 min_size: int = 1, max_size: int = 10, idle_timeout: float = 300.0,
+                 checkout_timeout: float = 30.0, pre_ping: bool = True) -> None:
+        """Initializes the Pool parameters and Metrics.
+
+        Args:
+            service (str): Name of the service the pool belongs to, used for metrics.
+            connect (Callable): Factory that opens a new raw database connection.
+            min_size (int): Number of connections kept open even when idle.
+            max_size (int): Maximum number of connections open at the same time.
+            idle_timeout (float): Seconds after which an idle connection above min_size is closed.
+            checkout_timeout (float): Seconds to wait for a free connection before failing.
+            pre_ping (bool): Whether to ping a connection before handing it out.
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool Sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+
+        self.service = service
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.pre_ping = pre_ping
+
+        self._idle: Deque[Tuple[pymysql.connections.Connection, float]] = deque()
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        self._metrics: Dict[str, float] = {
+            "checkouts": 0,
+            "created": 0,
+            "reused": 0,
+            "closed": 0,
+            "evicted_idle": 0,
+            "ping_failures": 0,
+            "broken": 0,
+            "checkout_timeouts": 0,
+            "checkout_wait_seconds": 0.0
+        }
+
+    def _Open(self) -> pymysql.connections.Connection:
+        """Opens a New Raw Connection, releasing the reserved slot on failure."""
+        try:
+            connection = self.connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._metrics["created"] += 1
+        return connection
+
+    def _Discard(self, connection: pymysql.connections.Connection) -> None:
+        """Closes a Raw Connection without raising."""
+        try:
+            connection.close()
+        except Exception:
+            logging.debug("Error while Closing a Pooled Connection", exc_info=True)
+
+    def _Evict_Idle(self, now: float) -> list:
+        """Pops Idle Connections above min_size that exceeded idle_timeout. Must hold the lock.
+
+        Returns:
+            list: Connections that should be closed outside of the lock.
+        """
+        evicted = []
+        # Oldest idle connections sit at the left end of the deque.
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            evicted.append(self._idle.popleft()[0])
+            self._size -= 1
+            self._metrics["evicted_idle"] += 1
+            self._metrics["closed"] += 1
+        return evicted
+
+    def _Ping(self, connection: pymysql.connections.Connection) -> bool:
+        """Checks that a Connection is still alive."""
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def Get_Connection(self) -> PooledConnection:
+        """Checks out a Connection from the Pool, opening a new one if allowed.
+
+        Returns:
+            PooledConnection: Connection proxy whose close() returns it to the pool.
+
+        Raises:
+            TimeoutError: If no connection became available within checkout_timeout.
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        while True:
+            connection, evicted = None, []
+            with self._condition:
+                if self._closed:
+                    raise pymysql.err.InterfaceError(f"Connection Pool for {self.service} is closed.")
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics["checkout_timeouts"] += 1
+                        raise TimeoutError(f"Timed out waiting for a {self.service} Database Connection.")
+                    self._condition.wait(remaining)
+
+                evicted = self._Evict_Idle(time.monotonic())
+                if self._idle:
+                    # Most recently used connections are the warmest, take from the right end.
+                    connection = self._idle.pop()[0]
+                    reused = True
+                else:
+                    self._size += 1
+                    reused = False
+                self._in_use += 1
+                self._metrics["checkouts"] += 1
+                self._metrics["checkout_wait_seconds"] += time.monotonic() - start
+
+            for stale in evicted:
+                self._Discard(stale)
+
+            try:
+                if not reused:
+                    connection = self._Open()
+                elif self.pre_ping and not self._Ping(connection):
+                    self._Discard(connection)
+                    with self._condition:
+                        self._metrics["ping_failures"] += 1
+                        self._metrics["closed"] += 1
+                        self._size -= 1
+                        self._in_use -= 1
+                    continue
+                else:
+                    with self._condition:
+                        self._metrics["reused"] += 1
+            except Exception:
+                with self._condition:
+                    self._in_use -= 1
+                raise
+            return PooledConnection(self, connection)
+
+    def Release(self, connection: pymysql.connections.Connection, broken: bool = False) -> None:
+        """Returns a Connection to the Pool, rolling back any Uncommitted Work.
+
+        Args:
+            connection (pymysql.connections.Connection): The raw connection being returned.
+            broken (bool): Whether the connection raised an operational error while in use.
+        """
+        if not broken:
+            try:
+                connection.rollback()
+            except Exception:
+                broken = True
+
+        with self._condition:
+            self._in_use -= 1
+            if broken or self._closed:
+                self._size -= 1
+                self._metrics["closed"] += 1
+                if broken:
+                    self._metrics["broken"] += 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+                connection = None
+            self._condition.notify()
+
+        if connection is not None:
+            self._Discard(connection)
+
+    def Warm(self) -> None:
+        """Opens Connections up to min_size so the first Requests do not pay the Handshake."""
+        opened = []
+        try:
+            while True:
+                with self._condition:
+                    if self._size >= self.min_size:
+                        break
+                    self._size += 1
+                opened.append(self._Open())
+        except Exception:
+            logging.error(f"Failed to Warm the {self.service} Connection Pool", exc_info=True)
+        finally:
+            now = time.monotonic()
+            with self._condition:
+                self._idle.extend((connection, now) for connection in opened)
+                self._condition.notify_all()
+
+    def Metrics(self) -> Dict[str, float]:
+        """Returns a Snapshot of the Pool Metrics.
+
+        Returns:
+            Dict[str, float]: Counters together with the current pool occupancy.
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics.update({
+                "service": self.service,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "min_size": self.min_size,
+                "max_size": self.max_size
+            })
+        return metrics
+
+    def Close(self) -> None:
+        """Closes every Idle Connection; Connections in use are closed when released."""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._metrics["closed"] += len(idle)
+            self._condition.notify_all()
+        for connection in idle:
+            self._Discard(connection)
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_pools_registered = False
+
+
+def Get_Pool(service: str, connect: Optional[Callable[[], pymysql.connections.Connection]] = None) -> ConnectionPool:
+    """Returns the Process-Wide Connection Pool of a Service, creating and warming it on first use.
+
+    Pool sizing is read from the DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, DB_POOL_IDLE_TIMEOUT,
+    DB_POOL_CHECKOUT_TIMEOUT and DB_POOL_PRE_PING Environment Variables. Set DB_POOL_WARM
+    to "false" to skip opening min_size connections at startup.
+
+    Args:
+        service (str): Name of the service, e.g. "Login".
+        connect (Callable, optional): Factory for raw connections, defaults to Database_Connection.
+
+    Returns:
+        ConnectionPool: The shared pool for the service.
+    """
+    global _pools_registered
+    with _pools_lock:
+        pool = _pools.get(service)
+        if pool is not None:
+            return pool
+
+        if connect is None:
+            # Start the shared connector before registering Close_Pools, so that at exit
+            # the pools are closed before the connector they depend on is shut down.
+            Get_Database_Connector()
+            connect = Database_Connection
+        pool = ConnectionPool(
+            service=service,
+            connect=connect,
+            min_size=int(os.getenv("DB_POOL_MIN_SIZE", 1)),
+            max_size=int(os.getenv("DB_POOL_MAX_SIZE", 10)),
+            idle_timeout=float(os.getenv("DB_POOL_IDLE_TIMEOUT", 300)),
+            checkout_timeout=float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", 30)),
+            pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        )
+        _pools[service] = pool
+        if not _pools_registered:
+            atexit.register(Close_Pools)
+            _pools_registered = True
+
+    if os.getenv("DB_POOL_WARM", "true").lower() == "true":
+        pool.Warm()
+    return pool
+
+
+def Close_Pools() -> None:
+    """Closes every Pool created in this Process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.Close()
+
+
+def Pool_Metrics() -> Dict[str, Dict[str, float]]:
+    """Returns the Metrics of every Pool created in this Process, keyed by Service."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.service: pool.Metrics() for pool in pools}
@@ -0,0 +1,105 @@
+import os
+import atexit
+import logging
+import pymysql
+import threading
+from typing import Optional
+from google.cloud.sql.connector import Connector, IPTypes
+
+
+class DatabaseConnector:
+    """Process-Wide Factory for Raw Database Connections.
+
+    DB_CONNECTION_MODE selects how connections are opened:
+        "cloudsql" (default): through one long-lived Google Cloud SQL Connector, whose
+            ephemeral certificate and instance metadata are cached and refreshed in the background.
+        "direct": through a plain pymysql TCP (DB_HOST, DB_PORT) or unix socket (DB_UNIX_SOCKET)
+            connect, e.g. to a local MySQL stand-in or the Cloud SQL Auth Proxy.
+    """
+
+    def __init__(self) -> None:
+        """Initializes Database Connection parameters from Environment Variables."""
+        self.mode: str = os.getenv("DB_CONNECTION_MODE", "cloudsql").lower()
+        self.user: str = os.getenv("USER")
+        self.password: str = os.getenv("PASSWORD")
+        self.host: str = os.getenv("HOST")
+        self.database: str = os.getenv("DATABASE")
+        self.ip_type: str = os.getenv("DB_IP_TYPE", "PUBLIC").upper()
+        self.direct_host: str = os.getenv("DB_HOST", "127.0.0.1")
+        self.direct_port: int = int(os.getenv("DB_PORT", 3306))
+        self.unix_socket: Optional[str] = os.getenv("DB_UNIX_SOCKET") or None
+
+        if self.mode not in ("cloudsql", "direct"):
+            raise ValueError(f"Unsupported DB_CONNECTION_MODE: {self.mode}")
+
+        self._connector: Optional[Connector] = None
+        self._lock = threading.Lock()
+
+    def Start(self) -> None:
+        """Creates the Cloud SQL Connector once; a no-op in direct mode."""
+        if self.mode != "cloudsql" or self._connector is not None:
+            return
+        with self._lock:
+            if self._connector is None:
+                self._connector = Connector(IPTypes[self.ip_type])
+                logging.info("Cloud SQL Connector Started.")
+
+    def Database_Connection(self) -> pymysql.connections.Connection:
+        """Opens a New Raw Connection to the Database.
+
+        Returns:
+            pymysql.connections.Connection: The database connection object.
+        """
+        if self.mode == "direct":
+            return pymysql.connect(
+                host=self.direct_host,
+                port=self.direct_port,
+                unix_socket=self.unix_socket,
+                user=self.user,
+                password=self.password,
+                database=self.database
+            )
+
+        self.Start()
+        return self._connector.connect(
+            self.host,
+            "pymysql",
+            user=self.user,
+            password=self.password,
+            db=self.database
+        )
+
+    def Shutdown(self) -> None:
+        """Stops the Cloud SQL Connector and its Background Refresh Threads."""
+        with self._lock:
+            connector, self._connector = self._connector, None
+        if connector is not None:
+            try:
+                connector.close()
+                logging.info("Cloud SQL Connector Stopped.")
+            except Exception:
+                logging.error("An Error Occurred while Stopping the Cloud SQL Connector", exc_info=True)
+
+
+_database_connector: Optional[DatabaseConnector] = None
+_database_connector_lock = threading.Lock()
+
+
+def Get_Database_Connector() -> DatabaseConnector:
+    """Returns the Process-Wide DatabaseConnector, creating and starting it on first use."""
+    global _database_connector
+    with _database_connector_lock:
+        if _database_connector is None:
+            _database_connector = DatabaseConnector()
+            _database_connector.Start()
+            atexit.register(_database_connector.Shutdown)
+        return _database_connector
+
+
+def Database_Connection() -> pymysql.connections.Connection:
+    """Opens a New Raw Connection through the Process-Wide DatabaseConnector.
+
+    Returns:
+        pymysql.connections.Connection: The database connection object.
+    """
+    return Get_Database_Connector().Database_Connection()
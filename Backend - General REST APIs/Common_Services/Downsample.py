@@ -0,0 +1,63 @@
+import numpy as np
+from typing import Tuple
+
+
+def LTTB(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Selects Points with the Largest-Triangle-Three-Buckets Algorithm.
+
+    Keeps the first and last points and, from each of threshold - 2 equal buckets in between,
+    the point forming the largest triangle with the previously kept point and the average of
+    the next bucket, which preserves the visual shape of the series.
+
+    Args:
+        x (np.ndarray): Increasing x values.
+        y (np.ndarray): Values of the series.
+        threshold (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Indices of the kept points, in order.
+    """
+    n = len(x)
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1][:max(threshold, 0)], dtype=np.int64)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        following_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        following_x = x[end:following_end].mean() if following_end > end else x[-1]
+        following_y = y[end:following_end].mean() if following_end > end else y[-1]
+        areas = np.abs(
+            (x[previous] - following_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (following_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+    return kept
+
+
+def Bucket_Average(x: np.ndarray, y: np.ndarray, buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Averages a Series over Equal-Width x Buckets, dropping Empty Buckets.
+
+    Args:
+        x (np.ndarray): Increasing x values.
+        y (np.ndarray): Values of the series.
+        buckets (int): Number of buckets over [x[0], x[-1]].
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Mean x and mean y of every non-empty bucket.
+    """
+    if len(x) <= buckets:
+        return x.astype(np.float64), y.astype(np.float64)
+    edges = np.linspace(x[0], x[-1], buckets + 1)
+    index = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, buckets - 1)
+    counts = np.bincount(index, minlength=buckets)
+    present = counts > 0
+    mean_x = np.bincount(index, weights=x, minlength=buckets)[present] / counts[present]
+    mean_y = np.bincount(index, weights=y, minlength=buckets)[present] / counts[present]
+    return mean_x, mean_y
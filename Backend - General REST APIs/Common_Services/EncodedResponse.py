@@ -0,0 +1,87 @@
+import gzip
+import hashlib
+from typing import Dict, Optional
+from flask import Request, Response
+
+try:
+    import brotli
+except ImportError:
+    # Brotli is optional, clients are served gzip or identity without it.
+    brotli = None
+
+
+class EncodedBody:
+    """Response Body encoded once, with its ETag and Compressed Variants.
+
+    Each content coding gets its own strong ETag (the identity ETag suffixed with the coding),
+    so caches never mix up variants, while a client holding any variant revalidates with 304.
+    """
+
+    def __init__(self, body: bytes, mimetype: str, compress: bool = True) -> None:
+        """Computes the ETag and the gzip and brotli Variants of a Body.
+
+        Args:
+            body (bytes): The encoded response body.
+            mimetype (str): The response mimetype, e.g. "application/json".
+            compress (bool): False for already compressed formats such as PNG.
+        """
+        self.mimetype = mimetype
+        self.tag: str = hashlib.sha256(body).hexdigest()[:32]
+        self.variants: Dict[str, bytes] = {"identity": body}
+        if compress:
+            self.variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                self.variants["br"] = brotli.compress(body, quality=11)
+            # Only keep a coding that actually saves bytes.
+            self.variants = {
+                coding: data for coding, data in self.variants.items()
+                if coding == "identity" or len(data) < len(body)
+            }
+        self.etags: Dict[str, str] = {
+            coding: self.tag if coding == "identity" else f"{self.tag}-{coding}"
+            for coding in self.variants
+        }
+
+    def Choose_Coding(self, request: Request) -> str:
+        """Picks the Smallest Variant the Client Accepts."""
+        best = "identity"
+        for coding in ("br", "gzip"):
+            if coding in self.variants and request.accept_encodings[coding] > 0:
+                if len(self.variants[coding]) < len(self.variants[best]):
+                    best = coding
+        return best
+
+    def Not_Modified(self, request: Request) -> bool:
+        """Returns True if the Client's If-None-Match names any Variant of this Body."""
+        return any(request.if_none_match.contains(etag) for etag in self.etags.values())
+
+    def Serve(self, request: Request, cache_control: str, status: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+        """Builds the Response for a Request without Re-Encoding the Body.
+
+        GET and HEAD requests naming a current ETag get an empty 304.
+
+        Args:
+            request (Request): The incoming request.
+            cache_control (str): The Cache-Control header value.
+            status (int): Status code of a full response.
+            headers (Optional[Dict[str, str]]): Extra response headers.
+
+        Returns:
+            Response: A Flask Response object with the chosen variant.
+        """
+        coding = self.Choose_Coding(request)
+        response = Response(status=status, mimetype=self.mimetype)
+        response.headers["Cache-Control"] = cache_control
+        response.headers["Vary"] = "Accept-Encoding"
+        response.set_etag(self.etags[coding])
+        for name, value in (headers or {}).items():
+            response.headers[name] = value
+
+        if request.method in ("GET", "HEAD") and self.Not_Modified(request):
+            response.status_code = 304
+            return response
+
+        if coding != "identity":
+            response.headers["Content-Encoding"] = coding
+        response.set_data(self.variants[coding])
+        return response
@@ -0,0 +1,27 @@
+from typing import Iterable
+
+
+def Record_Change(cursor, feature: str, old_value, new_value) -> None:
+    """Appends one Score Change of a User to the FeatureChanges Feed.
+
+    Runs on the caller's cursor so the change commits, or rolls back, with the score.
+
+    Args:
+        cursor: Cursor of the transaction that writes the score.
+        feature (str): Feature name of the score.
+        old_value: Previous score of the user, None if there was none.
+        new_value: New score of the user, None if it was removed.
+    """
+    if old_value is None and new_value is None:
+        return
+    cursor.execute(
+        "INSERT INTO FeatureChanges (Feature, OldValue, NewValue) VALUES (%s, %s, %s)",
+        (feature, old_value, new_value)
+    )
+
+
+def Record_Removals(cursor, feature: str, values: Iterable) -> None:
+    """Appends the Removal of a Batch of Deleted Scores to the FeatureChanges Feed; missing scores are skipped."""
+    rows = [(feature, value) for value in values if value is not None]
+    if rows:
+        cursor.executemany("INSERT INTO FeatureChanges (Feature, OldValue, NewValue) VALUES (%s, %s, NULL)", rows)
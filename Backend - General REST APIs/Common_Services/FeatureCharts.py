@@ -0,0 +1,82 @@
+from typing import Optional, Sequence, Tuple
+from Common_Services import FeatureHistogram
+
+
+def PieChart_Result(feature: str, value) -> Tuple[bool, list, str]:
+    """Return the Pie Chart Slices of a Feature Diagnosis
+
+    Args:
+        feature (str): Feature Name that user is using.
+        value: The user's diagnosis value, None if the feature is not used yet.
+
+    Returns:
+        Tuple[bool, list, str]: A tuple containing a boolean indicating success, list containing values and a message.
+    """
+    if value is not None:
+        diagnosis, remaining = round(100*float(value), 4), round(100 - (100*float(value)), 4)
+        return True, [diagnosis, remaining], f"Here's the Latest {feature} Dignostic Value."
+    return False, [0, 100], f"Not Started using {feature} Feature Yet."
+
+
+def Rank_Query(table: str, column: str) -> str:
+    """Returns the Statement Counting the Diagnoses of a Feature Table, and those <= one %s Scaled Diagnosis.
+
+    The count runs in the database, so no diagnosis rows are sent to the service.
+    """
+    return f"SELECT COUNT(*), COALESCE(SUM(100*{column} <= %s), 0) FROM {table} WHERE {column} IS NOT NULL"
+
+
+def Rank_Params(value) -> tuple:
+    """Returns the Parameters of Rank_Query() for a Diagnosis."""
+    return (round(100*float(value), 4),)
+
+
+def Rank_Percentile(row: Optional[Sequence]) -> float:
+    """Returns the Percentile from the Row of Rank_Query(), 0 for an empty Table."""
+    total, below = (int(row[0]), int(row[1])) if row else (0, 0)
+    return (below/total)*100 if total else 0.0
+
+
+def Percentile_Of(cursor, feature: str, table: str, column: str, value, mode: str = "exact", index=None) -> float:
+    """
+    Return the Percentage of Users whose Diagnosis is less than or equal to the User's
+
+    "histogram" mode reads the FeatureHistograms rows of the feature. Otherwise the loaded
+    in-memory index or sketch ranks the value; without one the database counts the rows.
+
+    Args:
+        cursor: Cursor of the caller's connection, used by the histogram and the count fallback.
+        feature (str): Feature Name that user is using.
+        table (str): Table name of the Feature Diagnosis.
+        column (str): Column of the Feature Table where the diagnosis value exists.
+        value: The user's diagnosis value.
+        mode (str): PERCENTILE_MODE of the service, "exact", "approximate" or "histogram".
+        index: OrderStatisticsIndex or SharedQuantileSketch of the column, None if the service has none.
+
+    Returns:
+        float: The percentile of the user.
+    """
+    if mode == "histogram":
+        percentile = FeatureHistogram.Percentile(FeatureHistogram.Read_Histogram(cursor, feature), value)
+        if percentile is not None:
+            return percentile
+
+    if index is not None and index.ready:
+        percentile = index.Percentile(value)
+        if percentile is not None:
+            return percentile
+
+    cursor.execute(Rank_Query(table, column), Rank_Params(value))
+    return Rank_Percentile(cursor.fetchone())
+
+
+async def Percentile_Of_Async(cursor, feature: str, table: str, column: str, value, mode: str = "exact") -> float:
+    """Percentile_Of() on an Asynchronous Cursor, which has no in-memory index to rank with."""
+    if mode == "histogram":
+        await cursor.execute(FeatureHistogram.HISTOGRAM_QUERY, (feature,))
+        percentile = FeatureHistogram.Percentile(FeatureHistogram.Histogram_Counts(await cursor.fetchall()), value)
+        if percentile is not None:
+            return percentile
+
+    await cursor.execute(Rank_Query(table, column), Rank_Params(value))
+    return Rank_Percentile(await cursor.fetchone())
@@ -0,0 +1,123 @@
+import os
+import logging
+from collections import Counter
+from typing import Iterable, List, Optional
+
+# Number of equal-width buckets over a diagnosis score in [0, 1]; changing it requires a rebuild.
+bucket_count: int = int(os.getenv("HISTOGRAM_BUCKETS", 100))
+
+
+def Bucket_Of(value) -> Optional[int]:
+    """Returns the Histogram Bucket of a Diagnosis Score, None for a missing Score."""
+    if value is None:
+        return None
+    return min(max(int(float(value) * bucket_count), 0), bucket_count - 1)
+
+
+def Apply_Change(cursor, feature: str, old_value, new_value) -> None:
+    """Moves one User from the Bucket of old_value to the Bucket of new_value.
+
+    Runs on the caller's cursor so the histogram changes in the same transaction as the score.
+
+    Args:
+        cursor: Cursor of the transaction that writes the score.
+        feature (str): Feature name of the histogram.
+        old_value: Previous score of the user, None if there was none.
+        new_value: New score of the user, None if it was removed.
+    """
+    old_bucket, new_bucket = Bucket_Of(old_value), Bucket_Of(new_value)
+    if old_bucket == new_bucket:
+        return
+    if old_bucket is not None:
+        cursor.execute(
+            "UPDATE FeatureHistograms SET UserCount = UserCount - 1 WHERE Feature = %s AND Bucket = %s AND UserCount > 0",
+            (feature, old_bucket)
+        )
+    if new_bucket is not None:
+        cursor.execute("""
+            INSERT INTO FeatureHistograms (Feature, Bucket, UserCount) VALUES (%s, %s, 1)
+            ON DUPLICATE KEY UPDATE UserCount = UserCount + 1
+        """, (feature, new_bucket))
+
+
+def Remove_Values(cursor, feature: str, values: Iterable) -> None:
+    """Removes the Users of a Batch of Deleted Scores, with one Statement per Bucket touched.
+
+    Args:
+        cursor: Cursor of the transaction that deletes the scores.
+        feature (str): Feature name of the histogram.
+        values (Iterable): Scores of the deleted users; missing scores are skipped.
+    """
+    removed = Counter(bucket for bucket in map(Bucket_Of, values) if bucket is not None)
+    if removed:
+        cursor.executemany(
+            "UPDATE FeatureHistograms SET UserCount = GREATEST(UserCount - %s, 0) WHERE Feature = %s AND Bucket = %s",
+            [(count, feature, bucket) for bucket, count in removed.items()]
+        )
+
+
+# Bucket and UserCount of one %s Feature, read by Read_Histogram() or an asynchronous cursor
+HISTOGRAM_QUERY = "SELECT Bucket, UserCount FROM FeatureHistograms WHERE Feature = %s"
+
+
+def Read_Histogram(cursor, feature: str) -> List[int]:
+    """Reads the User Count of every Bucket of a Feature.
+
+    Returns:
+        List[int]: bucket_count counts, index i covering scores in [i/bucket_count, (i+1)/bucket_count).
+    """
+    cursor.execute(HISTOGRAM_QUERY, (feature,))
+    return Histogram_Counts(cursor.fetchall())
+
+
+def Histogram_Counts(rows: Iterable) -> List[int]:
+    """Returns the Count of every Bucket from the (Bucket, UserCount) Rows of HISTOGRAM_QUERY."""
+    counts = [0] * bucket_count
+    for bucket, user_count in rows:
+        if 0 <= bucket < bucket_count:
+            counts[bucket] = int(user_count)
+    return counts
+
+
+def Percentile(counts: List[int], value) -> Optional[float]:
+    """Estimates the Percentage of Users whose Score is less than or equal to a Score.
+
+    Users below the score's bucket count fully, users inside it are interpolated linearly.
+    """
+    total = sum(counts)
+    if total == 0 or value is None:
+        return None
+    position = min(max(float(value) * bucket_count, 0.0), float(bucket_count))
+    bucket = min(int(position), bucket_count - 1)
+    below = sum(counts[:bucket]) + counts[bucket] * (position - bucket)
+    return (below/total)*100
+
+
+def Rebuild(connection, feature: str, table: str, column: str) -> int:
+    """Recomputes the Histogram of a Feature from its Table in one Transaction.
+
+    Args:
+        connection: Database connection; committed on success.
+        feature (str): Feature name of the histogram.
+        table (str): Table name of the Feature Diagnosis.
+        column (str): Column of the Feature Table where the diagnosis value exists.
+
+    Returns:
+        int: Number of users counted.
+    """
+    with connection.cursor() as cursor:
+        # Lock the Histogram Rows first so Concurrent Writers wait for the Backfill.
+        cursor.execute("SELECT Bucket FROM FeatureHistograms WHERE Feature = %s FOR UPDATE", (feature,))
+        cursor.execute("DELETE FROM FeatureHistograms WHERE Feature = %s", (feature,))
+        cursor.execute(f"""
+            INSERT INTO FeatureHistograms (Feature, Bucket, UserCount)
+            SELECT %s, LEAST(GREATEST(FLOOR({column} * %s), 0), %s), COUNT(*)
+            FROM {table}
+            WHERE {column} IS NOT NULL
+            GROUP BY 2
+        """, (feature, bucket_count, bucket_count - 1))
+        cursor.execute("SELECT COALESCE(SUM(UserCount), 0) FROM FeatureHistograms WHERE Feature = %s", (feature,))
+        users = int(cursor.fetchone()[0])
+    connection.commit()
+    logging.info(f"{feature} Histogram Rebuilt over {users} Users.")
+    return users
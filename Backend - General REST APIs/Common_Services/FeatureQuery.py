@@ -0,0 +1,52 @@
+import threading
+from typing import Dict, Optional, Tuple
+from Common_Services.FeatureRegistry import Enabled_Features
+
+_plans: Dict[Tuple[Tuple[str, str, str], ...], str] = {}
+_plans_lock = threading.Lock()
+
+
+def Diagnosis_Query(features: Dict[str, list]) -> str:
+    """Returns one UNION ALL Statement reading the Diagnosis Column of every given Feature.
+
+    Each branch selects (Feature, Diagnosis) for the user's row of the feature table and takes
+    one %s Email parameter. Statements are cached per feature set.
+    """
+    key = tuple((feature, value[0], value[1]) for feature, value in features.items())
+    with _plans_lock:
+        query = _plans.get(key)
+        if query is None:
+            query = _plans[key] = "\nUNION ALL\n".join(
+                f"(SELECT %s AS Feature, {column} AS Diagnosis FROM {table} WHERE Email = %s LIMIT 1)"
+                for _, table, column in key
+            )
+        return query
+
+
+def Fetch_Diagnoses(cursor, email: str, features: Optional[Dict[str, list]] = None) -> Dict[str, Optional[float]]:
+    """Fetches the User's Diagnosis of every enabled Feature in a single Statement.
+
+    Args:
+        cursor: Cursor of the caller's connection.
+        email (str): User's email address.
+        features (Optional[Dict[str, list]]): Feature -> [Table, Column], the enabled features by default.
+
+    Returns:
+        Dict[str, Optional[float]]: Diagnosis per feature in registry order, None where the user has no row or value.
+    """
+    features = Enabled_Features() if features is None else features
+    diagnoses: Dict[str, Optional[float]] = {feature: None for feature in features}
+    if not features:
+        return diagnoses
+
+    cursor.execute(Diagnosis_Query(features), Diagnosis_Params(email, features))
+    diagnoses.update(cursor.fetchall())
+    return diagnoses
+
+
+def Diagnosis_Params(email: str, features: Dict[str, list]) -> list:
+    """Returns the Parameters of Diagnosis_Query() for a User, for callers running it on their own Cursor."""
+    params = []
+    for feature in features:
+        params.extend((feature, email))
+    return params
@@ -0,0 +1,18 @@
+from typing import Dict, List, Optional
+
+# Health Feature Name -> [Table, Diagnosis Column]; None until the Feature's Service is started.
+feature_list: Dict[str, Optional[List[str]]] = {
+    "Diabetes": ["UsersDiabetesData", "DiabetesStatus"],
+    "Asthma": None,
+    "Cadiovascular": None,
+    "Arthritis": None,
+    "Heart & Stroke": None,
+    "Migrane Control": None,
+    "Bronchitis": None,
+    "Live Condition Analysis": None
+}
+
+
+def Enabled_Features() -> Dict[str, List[str]]:
+    """Returns the Features whose Diagnosis is Stored, in Registry Order."""
+    return {feature: value for feature, value in feature_list.items() if value is not None}
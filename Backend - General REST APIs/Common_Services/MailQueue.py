@@ -0,0 +1,276 @@
+import os
+import time
+import email
+import atexit
+import random
+import logging
+import sqlite3
+import threading
+from email import policy
+from email.message import EmailMessage
+from typing import Any, Callable, Dict, List, Optional
+
+
+class MailQueue:
+    """Durable Outbound Mail Queue backed by SQLite, drained by Background Sender Workers.
+
+    Enqueue() stores the serialized message and returns at once. Workers claim due messages
+    with a lease, send them and delete them on success. A failed send is retried with
+    exponential backoff and jitter, and a message that failed max_attempts times is kept with
+    status 'dead' for inspection, its body erased so secrets such as OTPs are not retained.
+    Messages claimed by a process that died are picked up again once their lease expires, so
+    nothing queued is lost across restarts.
+
+    A message enqueued with an expiry (an OTP that is useless after its TTL) is never sent
+    late: it is deleted instead of being claimed or retried past its expiry.
+    """
+
+    def __init__(self, path: str, send: Callable[[EmailMessage], None], workers: int = 2,
+                 max_attempts: int = 5, backoff_base: float = 2.0, backoff_max: float = 300.0,
+                 lease: float = 120.0, poll_interval: float = 1.0) -> None:
+        """Opens the Queue Database and Initializes the Metrics.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            send (Callable[[EmailMessage], None]): Sends one message, raising on failure.
+            workers (int): Number of background sender threads.
+            max_attempts (int): Attempts before a message is dead-lettered.
+            backoff_base (float): Seconds before the first retry, doubled on each further attempt.
+            backoff_max (float): Upper bound of the retry delay.
+            lease (float): Seconds a claimed message is reserved for its worker.
+            poll_interval (float): Seconds a worker idles before looking for due retries.
+        """
+        self.path = path
+        self.send = send
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease = lease
+        self.poll_interval = poll_interval
+
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS Outbox (
+                Id INTEGER PRIMARY KEY AUTOINCREMENT,
+                Recipient TEXT,
+                Message BLOB NOT NULL,
+                Status TEXT NOT NULL DEFAULT 'pending',
+                Attempts INTEGER NOT NULL DEFAULT 0,
+                EnqueuedAt REAL NOT NULL,
+                NextAttempt REAL NOT NULL,
+                ClaimedUntil REAL,
+                LastError TEXT,
+                ExpiresAt REAL
+            )
+        """)
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(Outbox)")}
+        if "ExpiresAt" not in columns:
+            self._connection.execute("ALTER TABLE Outbox ADD COLUMN ExpiresAt REAL")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS OutboxDue ON Outbox (Status, NextAttempt)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS OutboxExpiry ON Outbox (ExpiresAt)")
+        # Overwrite deleted rows on disk, and erase the bodies of dead letters left by earlier versions.
+        self._connection.execute("PRAGMA secure_delete=ON")
+        self._connection.execute("UPDATE Outbox SET Message = X'' WHERE Status = 'dead' AND length(Message) > 0")
+        self._db_lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._threads: List[threading.Thread] = []
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, float] = {
+            "enqueued": 0,
+            "sent": 0,
+            "failed_attempts": 0,
+            "dead_lettered": 0,
+            "expired": 0,
+            "send_seconds": 0.0,
+            "max_send_seconds": 0.0,
+            "queue_seconds": 0.0
+        }
+
+    def Start(self) -> None:
+        """Starts the Background Sender Workers."""
+        if self._threads:
+            return
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._Work_Loop, name=f"MailQueue-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def Enqueue(self, message: EmailMessage, expires_at: Optional[float] = None) -> int:
+        """Stores a Message for Delivery and wakes a Worker.
+
+        Args:
+            message (EmailMessage): The message to send.
+            expires_at (Optional[float]): Epoch time after which the message is dropped unsent, None to keep retrying.
+
+        Returns:
+            int: Id of the queued message.
+        """
+        now = time.time()
+        with self._db_lock:
+            cursor = self._connection.execute(
+                "INSERT INTO Outbox (Recipient, Message, EnqueuedAt, NextAttempt, ExpiresAt) VALUES (?, ?, ?, ?, ?)",
+                (message["To"], message.as_bytes(), now, now, expires_at)
+            )
+        with self._metrics_lock:
+            self._metrics["enqueued"] += 1
+        with self._wakeup:
+            self._wakeup.notify()
+        return cursor.lastrowid
+
+    def _Claim(self) -> Optional[tuple]:
+        """Reserves the Next Due Message, including ones whose Lease Expired, after Dropping Expired Messages."""
+        now = time.time()
+        with self._db_lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                expired = self._connection.execute("""
+                    DELETE FROM Outbox
+                    WHERE ExpiresAt <= ? AND Status != 'dead' AND (Status = 'pending' OR ClaimedUntil < ?)
+                """, (now, now)).rowcount
+                row = self._connection.execute("""
+                    SELECT Id, Message, Attempts, EnqueuedAt, ExpiresAt FROM Outbox
+                    WHERE (Status = 'pending' AND NextAttempt <= ?) OR (Status = 'sending' AND ClaimedUntil < ?)
+                    ORDER BY NextAttempt
+                    LIMIT 1
+                """, (now, now)).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE Outbox SET Status = 'sending', ClaimedUntil = ? WHERE Id = ?",
+                        (now + self.lease, row[0])
+                    )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        if expired:
+            with self._metrics_lock:
+                self._metrics["expired"] += expired
+            logging.info(f"Dropped {expired} Expired Mails Unsent.")
+        return row
+
+    def _Backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _Deliver(self, row: tuple) -> None:
+        """Sends a Claimed Message and records the Outcome."""
+        message_id, data, attempts, enqueued_at, expires_at = row
+        start = time.monotonic()
+        try:
+            self.send(email.message_from_bytes(data, policy=policy.default))
+        except Exception as error:
+            attempts += 1
+            next_attempt = time.time() + self._Backoff(attempts)
+            expired = expires_at is not None and next_attempt >= expires_at
+            dead = not expired and attempts >= self.max_attempts
+            with self._db_lock:
+                if expired:
+                    # A retry would deliver after the expiry, so drop the message instead.
+                    self._connection.execute("DELETE FROM Outbox WHERE Id = ?", (message_id,))
+                elif dead:
+                    # Keep the failure for inspection, not the body (e.g. an OTP).
+                    self._connection.execute(
+                        "UPDATE Outbox SET Status = 'dead', Message = X'', Attempts = ?, ClaimedUntil = NULL, LastError = ? WHERE Id = ?",
+                        (attempts, repr(error), message_id)
+                    )
+                else:
+                    self._connection.execute(
+                        "UPDATE Outbox SET Status = 'pending', Attempts = ?, NextAttempt = ?, ClaimedUntil = NULL, LastError = ? WHERE Id = ?",
+                        (attempts, next_attempt, repr(error), message_id)
+                    )
+            with self._metrics_lock:
+                self._metrics["failed_attempts"] += 1
+                if expired:
+                    self._metrics["expired"] += 1
+                if dead:
+                    self._metrics["dead_lettered"] += 1
+            if dead:
+                logging.error(f"Dead-Lettered Mail {message_id} after {attempts} Attempts", exc_info=True)
+            elif expired:
+                logging.warning(f"Dropped Mail {message_id} after {attempts} Attempts, it Expires before the Next Retry: {error!r}")
+            else:
+                logging.warning(f"Failed to Send Mail {message_id} (Attempt {attempts}), Retrying Later: {error!r}")
+            return
+
+        elapsed = time.monotonic() - start
+        with self._db_lock:
+            self._connection.execute("DELETE FROM Outbox WHERE Id = ?", (message_id,))
+        with self._metrics_lock:
+            self._metrics["sent"] += 1
+            self._metrics["send_seconds"] += elapsed
+            self._metrics["max_send_seconds"] = max(self._metrics["max_send_seconds"], elapsed)
+            self._metrics["queue_seconds"] += time.time() - enqueued_at
+
+    def _Work_Loop(self) -> None:
+        while not self._stopping:
+            try:
+                row = self._Claim()
+            except Exception:
+                logging.error("Failed to Claim from the Mail Queue", exc_info=True)
+                row = None
+            if row is None:
+                with self._wakeup:
+                    if not self._stopping:
+                        self._wakeup.wait(self.poll_interval)
+                continue
+            self._Deliver(row)
+
+    def Metrics(self) -> Dict[str, Any]:
+        """Returns the Queue Depth, Dead Letters and Send Latency Metrics."""
+        with self._db_lock:
+            counts = dict(self._connection.execute("SELECT Status, COUNT(*) FROM Outbox GROUP BY Status").fetchall())
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        sent = metrics["sent"]
+        metrics.update({
+            "depth": counts.get("pending", 0) + counts.get("sending", 0),
+            "in_flight": counts.get("sending", 0),
+            "dead": counts.get("dead", 0),
+            "average_send_seconds": metrics["send_seconds"]/sent if sent else 0.0,
+            "average_queue_seconds": metrics["queue_seconds"]/sent if sent else 0.0
+        })
+        return metrics
+
+    def Stop(self, timeout: float = 5.0) -> None:
+        """Stops the Workers; Messages still queued are sent after the next Start."""
+        self._stopping = True
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+
+_mail_queue: Optional[MailQueue] = None
+_mail_queue_lock = threading.Lock()
+
+
+def Get_Mail_Queue(send: Callable[[EmailMessage], None]) -> MailQueue:
+    """Returns the Process-Wide Mail Queue, creating and starting it on first use.
+
+    Configured by MAIL_QUEUE_PATH, MAIL_QUEUE_WORKERS, MAIL_QUEUE_MAX_ATTEMPTS,
+    MAIL_QUEUE_BACKOFF_BASE, MAIL_QUEUE_BACKOFF_MAX, MAIL_QUEUE_LEASE and
+    MAIL_QUEUE_POLL_INTERVAL.
+
+    Args:
+        send (Callable[[EmailMessage], None]): Sends one message, raising on failure.
+    """
+    global _mail_queue
+    with _mail_queue_lock:
+        if _mail_queue is None:
+            _mail_queue = MailQueue(
+                path=os.getenv("MAIL_QUEUE_PATH", "mail_queue.sqlite3"),
+                send=send,
+                workers=int(os.getenv("MAIL_QUEUE_WORKERS", 2)),
+                max_attempts=int(os.getenv("MAIL_QUEUE_MAX_ATTEMPTS", 5)),
+                backoff_base=float(os.getenv("MAIL_QUEUE_BACKOFF_BASE", 2)),
+                backoff_max=float(os.getenv("MAIL_QUEUE_BACKOFF_MAX", 300)),
+                lease=float(os.getenv("MAIL_QUEUE_LEASE", 120)),
+                poll_interval=float(os.getenv("MAIL_QUEUE_POLL_INTERVAL", 1))
+            )
+            _mail_queue.Start()
+            atexit.register(_mail_queue.Stop)
+        return _mail_queue
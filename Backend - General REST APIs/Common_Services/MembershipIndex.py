@@ -0,0 +1,234 @@
+import os
+import math
+import time
+import hashlib
+import logging
+import threading
+import unicodedata
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+
+
+class BloomFilter:
+    """Fixed-Size Bloom Filter over 128-bit Fingerprints using Double Hashing."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Sizes the Bit Array for the given Capacity and False-Positive Rate.
+
+        Args:
+            capacity (int): Expected number of inserted values.
+            error_rate (float): Target false-positive probability at capacity.
+        """
+        capacity = max(capacity, 1)
+        self.size: int = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count: int = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _Positions(self, fingerprint: Tuple[int, int]):
+        first, second = fingerprint
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def Add(self, fingerprint: Tuple[int, int]) -> None:
+        """Sets the Bits of a Fingerprint."""
+        for position in self._Positions(fingerprint):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def Might_Contain(self, fingerprint: Tuple[int, int]) -> bool:
+        """Returns False only if the Fingerprint was definitely never added."""
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._Positions(fingerprint))
+
+
+class MembershipIndex:
+    """In-Memory Index of the Email, Username and MobileNumber values in UsersData.
+
+    Each column has a Bloom filter in front of an exact set of 64-bit fingerprints. A miss
+    means the value is definitely not registered, so the caller can skip the database; a hit
+    is only a possible match and must be confirmed with SQL, since rows may have been deleted
+    or changed by another process. Values are normalised (accents, case and surrounding
+    whitespace removed) so they never miss a row that a case- or accent-insensitive MySQL
+    collation would consider equal.
+
+    The index is per process: it is rebuilt from the database every MEMBERSHIP_REFRESH_INTERVAL
+    seconds to pick up writes made by other processes, and writes made through this process are
+    applied immediately. Between refreshes a miss may be stale, so it only ever skips a uniqueness
+    SELECT whose result the UNIQUE keys of UsersData enforce anyway (Database_Schema/
+    UsersDataUniqueKeys.sql); answers that must be exact, like whether an account exists, go to SQL.
+    """
+
+    COLUMNS = ("Email", "Username", "MobileNumber")
+
+    def __init__(self) -> None:
+        """Initializes the Index parameters from Environment Variables."""
+        self.pool: Optional[ConnectionPool] = None
+        self.error_rate: float = float(os.getenv("MEMBERSHIP_ERROR_RATE", 0.001))
+        self.refresh_interval: float = float(os.getenv("MEMBERSHIP_REFRESH_INTERVAL", 300))
+        self.ready: bool = False
+        self._filters: Dict[str, BloomFilter] = {}
+        self._fingerprints: Dict[str, Set[int]] = {}
+        self._pending: Optional[List[Callable[[], None]]] = None
+        self._lock = threading.RLock()
+        self._refresher: Optional[threading.Thread] = None
+        self._metrics: Dict[str, float] = {
+            "lookups": 0,
+            "definite_misses": 0,
+            "possible_hits": 0,
+            "loads": 0,
+            "load_seconds": 0.0
+        }
+
+    def _Normalize(self, value: str) -> str:
+        decomposed = unicodedata.normalize("NFKD", str(value))
+        return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold().strip()
+
+    def _Fingerprint(self, value: str) -> Tuple[int, int]:
+        digest = hashlib.blake2b(self._Normalize(value).encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def _Apply_Add(self, column: str, fingerprint: Tuple[int, int]) -> None:
+        self._filters[column].Add(fingerprint)
+        self._fingerprints[column].add(fingerprint[0])
+
+    def _Apply_Remove(self, column: str, fingerprint: Tuple[int, int]) -> None:
+        # Bloom filters cannot forget; the exact set is enough to report a definite miss.
+        self._fingerprints[column].discard(fingerprint[0])
+
+    def _Record(self, operation: Callable[[], None]) -> None:
+        """Applies a Write and remembers it while a Rebuild is in progress. Must hold the lock."""
+        if self.ready:
+            operation()
+        if self._pending is not None:
+            self._pending.append(operation)
+
+    def Load(self) -> None:
+        """Builds the Index from UsersData and starts the Background Refresh Thread.
+
+        On failure the index stays not-ready and every lookup reports a possible hit.
+        """
+        try:
+            self.Rebuild()
+        except Exception:
+            logging.error("Failed to Load the Membership Index, Falling back to SQL Checks", exc_info=True)
+
+        if self.refresh_interval > 0 and self._refresher is None:
+            self._refresher = threading.Thread(target=self._Refresh_Loop, name="MembershipIndex", daemon=True)
+            self._refresher.start()
+
+    def _Refresh_Loop(self) -> None:
+        while True:
+            time.sleep(self.refresh_interval)
+            try:
+                self.Rebuild()
+            except Exception:
+                logging.error("Failed to Refresh the Membership Index", exc_info=True)
+
+    def Rebuild(self) -> None:
+        """Rebuilds every Filter and Fingerprint Set from UsersData, then swaps them in."""
+        start = time.monotonic()
+        with self._lock:
+            self._pending = []
+
+        try:
+            if self.pool is None:
+                self.pool = Get_Pool("MembershipIndex")
+            connection = self.pool.Get_Connection()
+            try:
+                with connection.cursor() as cursor:
+                    # Emails of Deleted Accounts stay Registered until the Purger releases them.
+                    cursor.execute("""
+                        SELECT Email, Username, MobileNumber FROM UsersData
+                        UNION ALL
+                        SELECT Email, NULL, NULL FROM DeletedAccounts WHERE PurgedAt IS NULL
+                    """)
+                    rows = cursor.fetchall()
+            finally:
+                connection.close()
+
+            capacity = max(2 * len(rows), 1024)
+            filters = {column: BloomFilter(capacity, self.error_rate) for column in self.COLUMNS}
+            fingerprints: Dict[str, Set[int]] = {column: set() for column in self.COLUMNS}
+            for row in rows:
+                for column, value in zip(self.COLUMNS, row):
+                    if value is not None:
+                        fingerprint = self._Fingerprint(value)
+                        filters[column].Add(fingerprint)
+                        fingerprints[column].add(fingerprint[0])
+
+            with self._lock:
+                pending, self._pending = self._pending, None
+                self._filters, self._fingerprints = filters, fingerprints
+                # Replay the writes made while the rows were being read.
+                for operation in pending:
+                    operation()
+                self.ready = True
+                self._metrics["loads"] += 1
+                self._metrics["load_seconds"] = time.monotonic() - start
+            logging.info(f"Membership Index Loaded with {len(rows)} Users.")
+        finally:
+            with self._lock:
+                self._pending = None
+
+    def Might_Exist(self, column: str, value: Optional[str]) -> bool:
+        """Checks whether a Value might already be registered in a Column.
+
+        Args:
+            column (str): One of "Email", "Username" or "MobileNumber".
+            value (Optional[str]): The value to look up.
+
+        Returns:
+            bool: False if the value is definitely not registered, True if SQL must confirm it.
+        """
+        if value is None:
+            return False
+        fingerprint = self._Fingerprint(value)
+        with self._lock:
+            self._metrics["lookups"] += 1
+            hit = (
+                not self.ready
+                or (self._filters[column].Might_Contain(fingerprint)
+                    and fingerprint[0] in self._fingerprints[column])
+            )
+            self._metrics["possible_hits" if hit else "definite_misses"] += 1
+        return hit
+
+    def Add_User(self, email: str, user_name: str, phone_number: str) -> None:
+        """Registers the Unique Values of a Newly Written User."""
+        with self._lock:
+            for column, value in zip(self.COLUMNS, (email, user_name, phone_number)):
+                if value is not None:
+                    fingerprint = self._Fingerprint(value)
+                    self._Record(lambda column=column, fingerprint=fingerprint: self._Apply_Add(column, fingerprint))
+
+    def Remove(self, column: str, value: Optional[str]) -> None:
+        """Forgets a Value that is no longer registered, e.g. after a Deletion or Email Change."""
+        if value is None:
+            return
+        fingerprint = self._Fingerprint(value)
+        with self._lock:
+            self._Record(lambda: self._Apply_Remove(column, fingerprint))
+
+    def Metrics(self) -> Dict[str, float]:
+        """Returns a Snapshot of the Index Metrics."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["ready"] = self.ready
+            for column, fingerprints in self._fingerprints.items():
+                metrics[f"{column}_count"] = len(fingerprints)
+        return metrics
+
+
+_membership_index: Optional[MembershipIndex] = None
+_membership_index_lock = threading.Lock()
+
+
+def Get_Membership_Index() -> MembershipIndex:
+    """Returns the Process-Wide MembershipIndex, creating it on first use.
+
+    The index is only loaded by services that read it (call Load()); in other services the
+    write hooks are no-ops until then.
+    """
+    global _membership_index
+    with _membership_index_lock:
+        if _membership_index is None:
+            _membership_index = MembershipIndex()
+        return _membership_index
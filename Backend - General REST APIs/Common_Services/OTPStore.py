@@ -0,0 +1,266 @@
+import os
+import hmac
+import time
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+class TimerWheel:
+    """Hierarchical Timer Wheel giving O(1) Schedule, Cancel and per-Tick Expiry.
+
+    Level l has `slots` buckets each spanning slots**l ticks. A timer is placed on the lowest
+    level whose range covers its delay, and when a higher-level bucket comes due its timers are
+    cascaded down one level. Advancing a tick only touches the current bucket of each level
+    that rolls over, so expiry never scans all outstanding timers.
+    """
+
+    def __init__(self, slots: int = 64, levels: int = 4, start_tick: int = 0) -> None:
+        """Initializes the Empty Wheel.
+
+        Args:
+            slots (int): Buckets per level.
+            levels (int): Number of levels; delays beyond slots**levels ticks are re-cascaded.
+            start_tick (int): The current tick.
+        """
+        self.slots = slots
+        self.levels = levels
+        self.current_tick = start_tick
+        self._wheels: List[List[Dict[str, int]]] = [[{} for _ in range(slots)] for _ in range(levels)]
+        self._timers: Dict[str, Tuple[int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def Schedule(self, key: str, expire_tick: int) -> None:
+        """Schedules (or Reschedules) a Key to expire at a Tick."""
+        self.Cancel(key)
+        delay = max(expire_tick - self.current_tick, 1)
+        level, span = 0, 1
+        while level < self.levels - 1 and delay >= span * self.slots:
+            level += 1
+            span *= self.slots
+        # Timers beyond the top level's range wait in its furthest bucket and are cascaded again.
+        target = min(expire_tick, self.current_tick + span * (self.slots - 1))
+        slot = (target // span) % self.slots
+        self._wheels[level][slot][key] = expire_tick
+        self._timers[key] = (expire_tick, level, slot)
+
+    def Cancel(self, key: str) -> None:
+        """Removes a Key's Timer, if any."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            self._wheels[timer[1]][timer[2]].pop(key, None)
+
+    def Advance(self, tick: int) -> List[str]:
+        """Moves the Wheel to a Tick, returning the Keys that Expired on the way."""
+        expired: List[str] = []
+        while self.current_tick < tick:
+            self.current_tick += 1
+            span = 1
+            for level in range(1, self.levels):
+                span *= self.slots
+                if self.current_tick % span:
+                    break
+                bucket = self._wheels[level][(self.current_tick // span) % self.slots]
+                due = list(bucket.items())
+                bucket.clear()
+                for key, expire_tick in due:
+                    del self._timers[key]
+                    self.Schedule(key, expire_tick)
+
+            bucket = self._wheels[0][self.current_tick % self.slots]
+            for key, expire_tick in list(bucket.items()):
+                if expire_tick <= self.current_tick:
+                    del bucket[key]
+                    del self._timers[key]
+                    expired.append(key)
+        return expired
+
+
+class OTPStore:
+    """Server-Side Store of Outstanding OTPs keyed by Recipient.
+
+    Only a keyed hash of each code is kept, and codes are compared with hmac.compare_digest.
+    Expiry runs on a TimerWheel with one-second ticks, advanced on every call and by a
+    background ticker, so expired codes are dropped without scanning. A code is removed after
+    it is verified or after max_attempts wrong guesses, and once max_entries codes are
+    outstanding the oldest one is evicted.
+
+    Wrong guesses are counted per recipient, not per code: a re-issued code inherits the count,
+    which is forgotten lockout seconds after the last wrong guess or on a correct one. A
+    recipient that used up max_attempts cannot be issued a new code until then, so requesting
+    codes again does not buy more guesses.
+
+    The store lives in process memory: run the OTP service as a single process (or with
+    sticky routing by recipient) so that verification reaches the process that issued the code.
+    """
+
+    def __init__(self, ttl: int = 300, max_attempts: int = 5, max_entries: int = 1000000,
+                 lockout: Optional[int] = None) -> None:
+        """Initializes the Store parameters.
+
+        Args:
+            ttl (int): Seconds an OTP stays valid.
+            max_attempts (int): Wrong guesses allowed per recipient before its OTP is revoked.
+            max_entries (int): Maximum number of outstanding OTPs, and of recipients with wrong guesses.
+            lockout (Optional[int]): Seconds wrong guesses are remembered after the last one, ttl by default.
+        """
+        self.ttl = ttl
+        self.max_attempts = max_attempts
+        self.max_entries = max_entries
+        self.lockout = ttl if lockout is None else lockout
+        self._key = secrets.token_bytes(32)
+        # Recipient -> [code digest, expiry time], oldest issued first.
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        # Recipient -> wrong guesses since the last success, least recently failed first.
+        self._failures: "OrderedDict[str, int]" = OrderedDict()
+        self._wheel = TimerWheel(start_tick=int(time.time()))
+        self._lock = threading.Lock()
+        self._ticker: Optional[threading.Thread] = None
+        self._metrics: Dict[str, int] = {
+            "issued": 0,
+            "verified": 0,
+            "rejected": 0,
+            "expired": 0,
+            "revoked": 0,
+            "evicted": 0,
+            "locked_out": 0
+        }
+
+    def _Digest(self, recipient: str, code: str) -> bytes:
+        return hmac.new(self._key, f"{recipient}\x00{code}".encode("utf-8"), hashlib.sha256).digest()
+
+    # Prefix of the Timer Keys that forget a Recipient's Wrong Guesses.
+    FAILURES_KEY = "failures\x00"
+
+    def _Expire(self, now: float) -> None:
+        """Drops the OTPs and Wrong-Guess Counts whose Timers fired. Must hold the lock."""
+        for key in self._wheel.Advance(int(now)):
+            if key.startswith(self.FAILURES_KEY):
+                self._failures.pop(key[len(self.FAILURES_KEY):], None)
+            elif self._entries.pop(key, None) is not None:
+                self._metrics["expired"] += 1
+
+    def _Record_Failure(self, recipient: str, now: float) -> int:
+        """Counts a Wrong Guess of a Recipient and restarts its Lockout. Must hold the lock."""
+        failures = self._failures.pop(recipient, 0) + 1
+        while len(self._failures) >= self.max_entries:
+            oldest, _ = self._failures.popitem(last=False)
+            self._wheel.Cancel(self.FAILURES_KEY + oldest)
+        self._failures[recipient] = failures
+        self._wheel.Schedule(self.FAILURES_KEY + recipient, int(now + self.lockout) + 1)
+        return failures
+
+    def _Clear_Failures(self, recipient: str) -> None:
+        """Forgets the Wrong Guesses of a Recipient. Must hold the lock."""
+        self._failures.pop(recipient, None)
+        self._wheel.Cancel(self.FAILURES_KEY + recipient)
+
+    def _Remove(self, recipient: str) -> None:
+        """Drops an OTP and its Timer. Must hold the lock."""
+        self._entries.pop(recipient, None)
+        self._wheel.Cancel(recipient)
+
+    def Start(self) -> None:
+        """Starts the Background Ticker that expires OTPs while the Store is idle."""
+        if self._ticker is None:
+            self._ticker = threading.Thread(target=self._Tick_Loop, name="OTPStore", daemon=True)
+            self._ticker.start()
+
+    def _Tick_Loop(self) -> None:
+        while True:
+            time.sleep(1)
+            with self._lock:
+                self._Expire(time.time())
+
+    def Issue(self, recipient: str, code: str) -> Tuple[bool, str]:
+        """Stores a New OTP for a Recipient, replacing any Outstanding One.
+
+        Args:
+            recipient (str): The recipient the OTP is sent to.
+            code (str): The OTP.
+
+        Returns:
+            Tuple[bool, str]: A tuple containing a boolean indicating the OTP was stored (and may be sent) and a message.
+        """
+        now = time.time()
+        with self._lock:
+            self._Expire(now)
+            if self._failures.get(recipient, 0) >= self.max_attempts:
+                self._metrics["locked_out"] += 1
+                return False, "Too Many Incorrect Attempts. Please try again later."
+            self._Remove(recipient)
+            while len(self._entries) >= self.max_entries:
+                oldest, _ = self._entries.popitem(last=False)
+                self._wheel.Cancel(oldest)
+                self._metrics["evicted"] += 1
+            expires_at = now + self.ttl
+            self._entries[recipient] = [self._Digest(recipient, code), expires_at]
+            # Round up so an OTP never expires before its full TTL.
+            self._wheel.Schedule(recipient, int(expires_at) + 1)
+            self._metrics["issued"] += 1
+        return True, "OTP Issued."
+
+    def Verify(self, recipient: str, code: str) -> Tuple[bool, str]:
+        """Checks a Code against the Recipient's Outstanding OTP, in Constant Time.
+
+        Args:
+            recipient (str): The recipient the OTP was sent to.
+            code (str): The code entered by the user.
+
+        Returns:
+            Tuple[bool, str]: A tuple containing a boolean indicating a match and a message.
+        """
+        now = time.time()
+        # Hash before taking the lock, and even for unknown recipients, to keep timing uniform.
+        digest = self._Digest(recipient, str(code))
+        with self._lock:
+            self._Expire(now)
+            entry = self._entries.get(recipient)
+            if entry is None or entry[1] <= now:
+                self._metrics["rejected"] += 1
+                return False, "OTP Expired or Not Requested."
+
+            if hmac.compare_digest(entry[0], digest):
+                self._Remove(recipient)
+                self._Clear_Failures(recipient)
+                self._metrics["verified"] += 1
+                return True, "OTP Verified Successfully."
+
+            failures = self._Record_Failure(recipient, now)
+            self._metrics["rejected"] += 1
+            if failures >= self.max_attempts:
+                self._Remove(recipient)
+                self._metrics["revoked"] += 1
+                return False, "Too Many Incorrect Attempts. Please try again later."
+            return False, f"Incorrect OTP. {self.max_attempts - failures} Attempts Remaining."
+
+    def Metrics(self) -> Dict[str, int]:
+        """Returns the Store Counters and the Number of Outstanding OTPs."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["outstanding"] = len(self._entries)
+            metrics["recipients_with_failures"] = len(self._failures)
+        return metrics
+
+
+_otp_store: Optional[OTPStore] = None
+_otp_store_lock = threading.Lock()
+
+
+def Get_OTP_Store() -> OTPStore:
+    """Returns the Process-Wide OTP Store, configured by OTP_TTL, OTP_MAX_ATTEMPTS, OTP_STORE_MAX_ENTRIES and OTP_LOCKOUT."""
+    global _otp_store
+    with _otp_store_lock:
+        if _otp_store is None:
+            _otp_store = OTPStore(
+                ttl=int(os.getenv("OTP_TTL", 300)),
+                max_attempts=int(os.getenv("OTP_MAX_ATTEMPTS", 5)),
+                max_entries=int(os.getenv("OTP_STORE_MAX_ENTRIES", 1000000)),
+                lockout=int(os.getenv("OTP_LOCKOUT")) if os.getenv("OTP_LOCKOUT") else None
+            )
+            _otp_store.Start()
+        return _otp_store
@@ -0,0 +1,273 @@
+import os
+import time
+import bisect
+import logging
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Set, Tuple
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+
+
+class OrderStatisticsIndex:
+    """In-Memory Sorted Index of one Diagnosis Column for Rank and Percentile Queries.
+
+    Values are bulk-loaded once into a sorted NumPy array. Writes land in two small sorted
+    buffers (inserted and deleted values) that are merged into the array once they exceed
+    ORDER_STATISTICS_MERGE_THRESHOLD, so a rank query is a binary search on the array plus
+    one on each buffer. Values are kept scaled by 100, the same way the percentile views
+    compare them.
+
+    The diagnosis columns are written by other processes, which append every change to the
+    FeatureChanges feed in the write's transaction (see Common_Services/FeatureChanges.py).
+    The index polls the feed every ORDER_STATISTICS_POLL_INTERVAL seconds for the rows past
+    the last id it applied, so a write is ranked against within about one poll. Ids are
+    assigned when a write runs but become visible when it commits, so rows within
+    ORDER_STATISTICS_POLL_OVERLAP seconds of the database time are re-read and applied once.
+    The index is rebuilt every ORDER_STATISTICS_REFRESH_INTERVAL seconds from one consistent
+    snapshot of the column and the feed, which also corrects drift from values the database
+    stores at a lower precision.
+    """
+
+    def __init__(self, feature: str, table: str, column: str) -> None:
+        """Initializes the Index parameters from Environment Variables.
+
+        Args:
+            feature (str): Feature name the writes are recorded under in FeatureChanges.
+            table (str): Table name of the Feature Diagnosis.
+            column (str): Column of the Feature Table where the diagnosis value exists.
+        """
+        self.feature = feature
+        self.table = table
+        self.column = column
+        self.pool: Optional[ConnectionPool] = None
+        self.merge_threshold: int = int(os.getenv("ORDER_STATISTICS_MERGE_THRESHOLD", 1024))
+        self.refresh_interval: float = float(os.getenv("ORDER_STATISTICS_REFRESH_INTERVAL", 600))
+        self.poll_interval: float = float(os.getenv("ORDER_STATISTICS_POLL_INTERVAL", 1))
+        self.poll_overlap: float = float(os.getenv("ORDER_STATISTICS_POLL_OVERLAP", 10))
+        self.feed_retention: float = float(os.getenv("ORDER_STATISTICS_FEED_RETENTION", 86400))
+        self.ready: bool = False
+        self._values = np.empty(0, dtype=np.float64)
+        self._inserted: List[float] = []
+        self._deleted: List[float] = []
+        # Every feed row with Id <= _watermark is applied; _applied holds the ones past it.
+        self._watermark: int = 0
+        self._applied: Set[int] = set()
+        self._lock = threading.RLock()
+        self._refresher: Optional[threading.Thread] = None
+        self._metrics: Dict[str, float] = {
+            "rebuilds": 0,
+            "polls": 0,
+            "changes_applied": 0,
+            "merges": 0,
+            "last_poll_at": 0.0
+        }
+
+    def _Scale(self, value) -> float:
+        return 100*float(value)
+
+    def _Merge(self) -> None:
+        """Folds the Write Buffers into the Sorted Array. Must hold the lock."""
+        values = self._values
+        if self._inserted:
+            values = np.sort(np.concatenate([values, np.asarray(self._inserted)]), kind="mergesort")
+        if self._deleted and len(values):
+            deleted = np.asarray(self._deleted)
+            positions = np.searchsorted(values, deleted, side="left")
+            # Equal deleted values must remove distinct elements.
+            positions += np.arange(len(deleted)) - np.searchsorted(deleted, deleted, side="left")
+            # Values read back at a lower precision may not match exactly, use the nearest element.
+            positions = np.clip(positions, 0, len(values) - 1)
+            lower = np.clip(positions - 1, 0, len(values) - 1)
+            nearer = np.abs(values[lower] - deleted) < np.abs(values[positions] - deleted)
+            positions = np.unique(np.where(nearer, lower, positions))
+            values = np.delete(values, positions)
+        self._values = values
+        self._inserted, self._deleted = [], []
+        self._metrics["merges"] += 1
+
+    def _Apply_Insert(self, value: float) -> None:
+        index = bisect.bisect_left(self._deleted, value)
+        if index < len(self._deleted) and self._deleted[index] == value:
+            self._deleted.pop(index)
+        else:
+            bisect.insort(self._inserted, value)
+
+    def _Apply_Delete(self, value: float) -> None:
+        index = bisect.bisect_left(self._inserted, value)
+        if index < len(self._inserted) and self._inserted[index] == value:
+            self._inserted.pop(index)
+        else:
+            bisect.insort(self._deleted, value)
+
+    def Load(self) -> None:
+        """Builds the Index from the Database and starts the Background Refresh Thread.
+
+        On failure the index stays not-ready and callers fall back to SQL.
+        """
+        try:
+            self.Rebuild()
+        except Exception:
+            logging.error(f"Failed to Load the {self.table}.{self.column} Order Statistics", exc_info=True)
+
+        if self._refresher is None:
+            self._refresher = threading.Thread(target=self._Refresh_Loop, name=f"OrderStatistics-{self.column}", daemon=True)
+            self._refresher.start()
+
+    def _Refresh_Loop(self) -> None:
+        # Polling and rebuilding share this thread, so a poll never races a rebuild's snapshot.
+        last_rebuild = time.monotonic()
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                if self.refresh_interval > 0 and time.monotonic() - last_rebuild >= self.refresh_interval:
+                    last_rebuild = time.monotonic()
+                    self.Rebuild()
+                else:
+                    self.Poll_Changes()
+            except Exception:
+                logging.error(f"Failed to Refresh the {self.table}.{self.column} Order Statistics", exc_info=True)
+
+    def _Settled_Id_Query(self) -> str:
+        return f"""
+            SELECT COALESCE(MAX(Id), 0) FROM FeatureChanges
+            WHERE Feature = %s AND ChangedAt < CURRENT_TIMESTAMP(6) - INTERVAL {int(self.poll_overlap * 1000000)} MICROSECOND
+        """
+
+    def Rebuild(self) -> None:
+        """Reloads every non-NULL Value of the Column and the Feed Position from one Consistent Snapshot."""
+        if self.pool is None:
+            self.pool = Get_Pool("OrderStatistics")
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+                cursor.execute(f"SELECT {self.column} FROM {self.table} WHERE {self.column} IS NOT NULL")
+                rows = cursor.fetchall()
+                # Feed rows in the snapshot are already counted in the values read above.
+                cursor.execute(self._Settled_Id_Query(), (self.feature,))
+                watermark = int(cursor.fetchone()[0])
+                cursor.execute("SELECT Id FROM FeatureChanges WHERE Feature = %s AND Id > %s", (self.feature, watermark))
+                applied = {int(row[0]) for row in cursor.fetchall()}
+                connection.commit()
+
+                cursor.execute(
+                    "DELETE FROM FeatureChanges WHERE ChangedAt < CURRENT_TIMESTAMP(6) - INTERVAL %s SECOND LIMIT 10000",
+                    (int(self.feed_retention),)
+                )
+                connection.commit()
+        finally:
+            connection.close()
+
+        values = np.fromiter((row[0] for row in rows), dtype=np.float64, count=len(rows)) * 100
+        values.sort()
+
+        with self._lock:
+            self._values, self._inserted, self._deleted = values, [], []
+            self._watermark, self._applied = watermark, applied
+            self.ready = True
+            self._metrics["rebuilds"] += 1
+        logging.info(f"{self.table}.{self.column} Order Statistics Loaded with {len(values)} Values.")
+
+    def Poll_Changes(self) -> int:
+        """Applies the FeatureChanges Rows written since the last Poll to the Write Buffers.
+
+        Returns:
+            int: Number of changes applied.
+        """
+        if not self.ready:
+            self.Rebuild()
+            return 0
+
+        with self._lock:
+            watermark = self._watermark
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(self._Settled_Id_Query(), (self.feature,))
+                settled = int(cursor.fetchone()[0])
+                cursor.execute(
+                    "SELECT Id, OldValue, NewValue FROM FeatureChanges WHERE Feature = %s AND Id > %s ORDER BY Id",
+                    (self.feature, watermark)
+                )
+                rows = cursor.fetchall()
+                connection.commit()
+        finally:
+            connection.close()
+
+        applied = 0
+        with self._lock:
+            if self._watermark != watermark:
+                # A rebuild ran meanwhile, its snapshot already holds these rows.
+                return 0
+            for change_id, old_value, new_value in rows:
+                if change_id in self._applied:
+                    continue
+                self._applied.add(change_id)
+                if old_value is not None:
+                    self._Apply_Delete(self._Scale(old_value))
+                if new_value is not None:
+                    self._Apply_Insert(self._Scale(new_value))
+                applied += 1
+            if len(self._inserted) + len(self._deleted) > self.merge_threshold:
+                self._Merge()
+            # Rows older than the overlap are committed or never will be, so stop tracking them.
+            if settled > self._watermark:
+                self._watermark = settled
+                self._applied = {change_id for change_id in self._applied if change_id > settled}
+            self._metrics["polls"] += 1
+            self._metrics["changes_applied"] += applied
+            self._metrics["last_poll_at"] = time.time()
+        return applied
+
+    def Rank(self, value) -> Tuple[int, int]:
+        """Counts the Values less than or equal to a Diagnosis.
+
+        Args:
+            value: The diagnosis value, on the scale stored in the database.
+
+        Returns:
+            Tuple[int, int]: The number of values <= round(100*value, 4), and the total number of values.
+        """
+        diagnosis = round(self._Scale(value), 4)
+        with self._lock:
+            count = (
+                int(np.searchsorted(self._values, diagnosis, side="right"))
+                + bisect.bisect_right(self._inserted, diagnosis)
+                - bisect.bisect_right(self._deleted, diagnosis)
+            )
+            total = len(self._values) + len(self._inserted) - len(self._deleted)
+        return count, total
+
+    def Percentile(self, value) -> Optional[float]:
+        """Returns the Percentage of Values less than or equal to a Diagnosis, None if empty."""
+        count, total = self.Rank(value)
+        return (count/total)*100 if total > 0 else None
+
+    def Metrics(self) -> Dict[str, float]:
+        """Returns the Size, Delta and Feed Metrics of the Index."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics.update({
+                "ready": self.ready,
+                "values": len(self._values),
+                "delta": len(self._inserted) + len(self._deleted),
+                "watermark": self._watermark
+            })
+        return metrics
+
+
+_order_statistics: Dict[Tuple[str, str], OrderStatisticsIndex] = {}
+_order_statistics_lock = threading.Lock()
+
+
+def Get_Order_Statistics(feature: str, table: str, column: str) -> OrderStatisticsIndex:
+    """Returns the Process-Wide Order Statistics Index of a Column, creating it on first use.
+
+    Only services that read the index load it (call Load()); writers record their changes
+    with Common_Services.FeatureChanges instead.
+    """
+    with _order_statistics_lock:
+        index = _order_statistics.get((table, column))
+        if index is None:
+            index = _order_statistics[(table, column)] = OrderStatisticsIndex(feature, table, column)
+        return index
@@ -0,0 +1,121 @@
+import os
+import hmac
+import base64
+import hashlib
+import secrets
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+
+class PasswordHasher:
+    """Salted PBKDF2-SHA256 Password Hashing on a Bounded Worker Pool.
+
+    Hashes are stored as ``pbkdf2_sha256$<iterations>$<salt>$<hash>`` (base64 salt and hash),
+    which needs a `Password` column of at least VARCHAR(128). Any stored value without that
+    prefix is treated as a legacy plaintext password.
+    """
+
+    ALGORITHM = "pbkdf2_sha256"
+
+    def __init__(self) -> None:
+        """Initializes the Hashing parameters and Worker Pool from Environment Variables."""
+        self.iterations: int = int(os.getenv("PASSWORD_HASH_ITERATIONS", 600000))
+        self.salt_bytes: int = 16
+        # hashlib releases the GIL while deriving keys, so the workers run on separate cores.
+        self.executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 2)),
+            thread_name_prefix="PasswordHasher"
+        )
+
+    def _Derive(self, password: str, salt: bytes, iterations: int) -> bytes:
+        """Derives the Key of a Password."""
+        return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+    def _Hash(self, password: str) -> str:
+        salt = secrets.token_bytes(self.salt_bytes)
+        derived = self._Derive(password, salt, self.iterations)
+        return "$".join([
+            self.ALGORITHM,
+            str(self.iterations),
+            base64.b64encode(salt).decode("ascii"),
+            base64.b64encode(derived).decode("ascii")
+        ])
+
+    def _Verify(self, password: str, stored: Optional[str]) -> Tuple[bool, bool]:
+        if not stored:
+            return False, False
+
+        parts = stored.split("$")
+        if len(parts) != 4 or parts[0] != self.ALGORITHM:
+            # Legacy Plaintext Password, rehash it once it has been verified.
+            matches = hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8"))
+            return matches, matches
+
+        try:
+            iterations = int(parts[1])
+            salt = base64.b64decode(parts[2])
+            expected = base64.b64decode(parts[3])
+        except ValueError:
+            logging.error("Malformed Password Hash in the Database.")
+            return False, False
+
+        matches = hmac.compare_digest(self._Derive(password, salt, iterations), expected)
+        return matches, matches and iterations != self.iterations
+
+    def Is_Hashed(self, stored: Optional[str]) -> bool:
+        """Checks whether a Stored Password is already a KDF Hash."""
+        return bool(stored) and stored.startswith(self.ALGORITHM + "$")
+
+    def Hash_Password(self, password: str) -> str:
+        """Hashes a Password on the Worker Pool.
+
+        Args:
+            password (str): The plaintext password.
+
+        Returns:
+            str: The encoded salted hash.
+        """
+        return self.Submit_Hash(password).result()
+
+    def Submit_Hash(self, password: str) -> Future:
+        """Schedules Password Hashing on the Worker Pool.
+
+        Returns:
+            Future: Resolves to the same value as Hash_Password().
+        """
+        return self.executor.submit(self._Hash, password)
+
+    def Submit_Verify(self, password: str, stored: Optional[str]) -> Future:
+        """Schedules Password Verification on the Worker Pool.
+
+        Returns:
+            Future: Resolves to the same tuple as Verify_Password().
+        """
+        return self.executor.submit(self._Verify, password, stored)
+
+    def Verify_Password(self, password: str, stored: Optional[str]) -> Tuple[bool, bool]:
+        """Verifies a Password against its Stored Hash or Legacy Plaintext Value.
+
+        Args:
+            password (str): The submitted plaintext password.
+            stored (Optional[str]): The value of the `Password` column.
+
+        Returns:
+            Tuple[bool, bool]: Whether the password matches, and whether the stored value should be rehashed.
+        """
+        return self.Submit_Verify(password, stored).result()
+
+
+_password_hasher: Optional[PasswordHasher] = None
+_password_hasher_lock = threading.Lock()
+
+
+def Get_Password_Hasher() -> PasswordHasher:
+    """Returns the Process-Wide PasswordHasher, creating it on first use."""
+    global _password_hasher
+    with _password_hasher_lock:
+        if _password_hasher is None:
+            _password_hasher = PasswordHasher()
+        return _password_hasher
@@ -0,0 +1,310 @@
+import os
+import math
+import time
+import random
+import socket
+import struct
+import logging
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+
+
+class KLLSketch:
+    """Mergeable KLL Quantile Sketch.
+
+    Items live in a hierarchy of compactors; an item at level h stands for 2**h inputs. With
+    parameter k the rank error is about 1.65% at k=200 and shrinks proportionally to 1/k, while
+    memory stays O(k) regardless of how many values are added.
+    """
+
+    MAGIC = b"KLL1"
+    HEADER = struct.Struct("<4sIQH")
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        """Initializes an Empty Sketch.
+
+        Args:
+            k (int): Size of the top compactor, controls the error bound.
+            seed (Optional[int]): Seed of the compaction coin flips, for reproducibility.
+        """
+        self.k = max(8, int(k))
+        self.count = 0
+        self.compactors: List[List[float]] = [[]]
+        self._random = random.Random(seed)
+        self._view: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @staticmethod
+    def K_For_Error(error: float) -> int:
+        """Returns the k that keeps the normalised rank error around the given fraction."""
+        return max(8, math.ceil(3.3 / error))
+
+    def _Capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, math.ceil(self.k * (2/3) ** depth))
+
+    def _Size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _Max_Size(self) -> int:
+        return sum(self._Capacity(level) for level in range(len(self.compactors)))
+
+    def _Compress(self) -> None:
+        """Compacts Levels until the Sketch fits its Capacity."""
+        while self._Size() >= self._Max_Size():
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) >= self._Capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self.compactors.append([])
+                    compactor.sort()
+                    # Keep an odd leftover at this level, promote every other item of the rest.
+                    leftover = [compactor.pop()] if len(compactor) % 2 else []
+                    offset = self._random.randint(0, 1)
+                    self.compactors[level + 1].extend(compactor[offset::2])
+                    self.compactors[level] = leftover
+                    break
+
+    def Update(self, value: float) -> None:
+        """Adds one Value to the Sketch."""
+        self.compactors[0].append(float(value))
+        self.count += 1
+        self._view = None
+        if len(self.compactors[0]) >= self._Capacity(0):
+            self._Compress()
+
+    def Merge(self, other: "KLLSketch") -> None:
+        """Folds another Sketch into this one, the result covers the inputs of both."""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.count += other.count
+        self._view = None
+        self._Compress()
+
+    def _View(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted Values with the Cumulative Weight up to each, cached until the next Write."""
+        if self._view is None:
+            values = np.concatenate([np.asarray(compactor, dtype=np.float64) for compactor in self.compactors])
+            weights = np.concatenate([
+                np.full(len(compactor), 2 ** level, dtype=np.float64)
+                for level, compactor in enumerate(self.compactors)
+            ])
+            order = np.argsort(values, kind="mergesort")
+            self._view = (values[order], np.cumsum(weights[order]))
+        return self._view
+
+    def Rank(self, value: float) -> float:
+        """Returns the Approximate Fraction of Inputs less than or equal to a Value."""
+        values, cumulative = self._View()
+        if len(values) == 0:
+            return 0.0
+        position = int(np.searchsorted(values, value, side="right"))
+        return float(cumulative[position - 1] / cumulative[-1]) if position else 0.0
+
+    def Serialize(self) -> bytes:
+        """Encodes the Sketch as a Compact Binary Blob."""
+        lengths = np.asarray([len(compactor) for compactor in self.compactors], dtype="<u4")
+        values = np.concatenate([np.asarray(compactor, dtype="<f8") for compactor in self.compactors])
+        header = self.HEADER.pack(self.MAGIC, self.k, self.count, len(self.compactors))
+        return header + lengths.tobytes() + values.tobytes()
+
+    @classmethod
+    def Deserialize(cls, blob: bytes) -> "KLLSketch":
+        """Decodes a Blob produced by Serialize()."""
+        magic, k, count, levels = cls.HEADER.unpack_from(blob)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a KLL Sketch Blob.")
+        offset = cls.HEADER.size
+        lengths = np.frombuffer(blob, dtype="<u4", count=levels, offset=offset)
+        offset += lengths.nbytes
+        values = np.frombuffer(blob, dtype="<f8", count=int(lengths.sum()), offset=offset)
+
+        sketch = cls(k)
+        sketch.count = count
+        bounds = np.concatenate([[0], np.cumsum(lengths)]).astype(int)
+        sketch.compactors = [values[bounds[i]:bounds[i + 1]].tolist() for i in range(levels)]
+        return sketch
+
+
+class SharedQuantileSketch:
+    """Approximate Percentiles of one Diagnosis Column, shared by every Worker through the Database.
+
+    Sketches are stored in the QuantileSketches table (see Database_Schema/QuantileSketches.sql):
+        - a "base" sketch of the whole column, rebuilt with a full scan by whichever worker
+          first finds it older than QUANTILE_SKETCH_REBUILD_INTERVAL seconds;
+        - one "delta" sketch per writing worker with the values it wrote since that base.
+    Readers merge the base with the newer deltas every QUANTILE_SKETCH_SYNC_INTERVAL seconds and
+    answer percentile queries from the merged sketch in memory. KLL sketches cannot forget, so a
+    changed value is counted twice until the next base rebuild.
+    """
+
+    def __init__(self, feature: str, table: str, column: str) -> None:
+        """Initializes the Sketch parameters from Environment Variables.
+
+        Args:
+            feature (str): Feature name, used as the sketch key.
+            table (str): Table name of the Feature Diagnosis.
+            column (str): Column of the Feature Table where the diagnosis value exists.
+        """
+        self.feature = feature
+        self.table = table
+        self.column = column
+        self.pool: Optional[ConnectionPool] = None
+        self.k: int = KLLSketch.K_For_Error(float(os.getenv("QUANTILE_SKETCH_ERROR", 0.01)))
+        self.sync_interval: float = float(os.getenv("QUANTILE_SKETCH_SYNC_INTERVAL", 30))
+        self.rebuild_interval: float = float(os.getenv("QUANTILE_SKETCH_REBUILD_INTERVAL", 3600))
+        self.worker: str = f"{socket.gethostname()}-{os.getpid()}"
+        self.ready: bool = False
+        self._merged: Optional[KLLSketch] = None
+        self._delta = KLLSketch(self.k)
+        self._delta_dirty = False
+        self._base_built_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._syncer: Optional[threading.Thread] = None
+
+    def _Connection(self):
+        if self.pool is None:
+            self.pool = Get_Pool("QuantileSketch")
+        return self.pool.Get_Connection()
+
+    def Start(self) -> None:
+        """Runs a First Synchronisation and starts the Background Sync Thread."""
+        try:
+            self.Sync()
+        except Exception:
+            logging.error(f"Failed to Load the {self.feature} Quantile Sketch", exc_info=True)
+
+        if self.sync_interval > 0 and self._syncer is None:
+            self._syncer = threading.Thread(target=self._Sync_Loop, name=f"QuantileSketch-{self.feature}", daemon=True)
+            self._syncer.start()
+
+    def _Sync_Loop(self) -> None:
+        while True:
+            time.sleep(self.sync_interval)
+            try:
+                self.Sync()
+            except Exception:
+                logging.error(f"Failed to Sync the {self.feature} Quantile Sketch", exc_info=True)
+
+    def Rebuild(self) -> None:
+        """Builds the Base Sketch from a Full Scan of the Column and publishes it."""
+        built_at = time.time()
+        sketch = KLLSketch(self.k)
+        connection = self._Connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT {self.column} FROM {self.table} WHERE {self.column} IS NOT NULL")
+                for row in cursor.fetchall():
+                    sketch.Update(100*float(row[0]))
+
+                upsert_query = """
+                    INSERT INTO QuantileSketches (Feature, Worker, BuiltAt, Sketch)
+                    VALUES (%s, 'base', %s, %s)
+                    ON DUPLICATE KEY UPDATE BuiltAt = VALUES(BuiltAt), Sketch = VALUES(Sketch)
+                """
+                cursor.execute(upsert_query, (self.feature, built_at, sketch.Serialize()))
+                connection.commit()
+        finally:
+            connection.close()
+        logging.info(f"{self.feature} Quantile Sketch Rebuilt from {sketch.count} Values.")
+
+    def _Claim_Rebuild(self, cursor, base_built_at: Optional[float]) -> bool:
+        """Atomically moves the Base Timestamp forward so only one Worker rebuilds it.
+
+        If the claiming worker dies mid-rebuild, the base is claimed again after rebuild_interval.
+        """
+        now = time.time()
+        if base_built_at is None:
+            cursor.execute(
+                "INSERT IGNORE INTO QuantileSketches (Feature, Worker, BuiltAt, Sketch) VALUES (%s, 'base', %s, '')",
+                (self.feature, 0)
+            )
+            base_built_at = 0
+        cursor.execute(
+            "UPDATE QuantileSketches SET BuiltAt = %s WHERE Feature = %s AND Worker = 'base' AND BuiltAt = %s",
+            (now, self.feature, base_built_at)
+        )
+        return cursor.rowcount == 1
+
+    def Sync(self) -> None:
+        """Publishes this Worker's Delta, rebuilds a stale Base and reloads the Merged Sketch."""
+        with self._lock:
+            delta_blob = self._delta.Serialize() if self._delta_dirty else None
+            self._delta_dirty = False
+
+        connection = self._Connection()
+        try:
+            with connection.cursor() as cursor:
+                if delta_blob is not None:
+                    cursor.execute("""
+                        INSERT INTO QuantileSketches (Feature, Worker, BuiltAt, Sketch)
+                        VALUES (%s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE BuiltAt = VALUES(BuiltAt), Sketch = VALUES(Sketch)
+                    """, (self.feature, self.worker, time.time(), delta_blob))
+
+                cursor.execute("SELECT Worker, BuiltAt, Sketch FROM QuantileSketches WHERE Feature = %s", (self.feature,))
+                rows = cursor.fetchall()
+                base = next((row for row in rows if row[0] == "base"), None)
+                base_built_at = base[1] if base else None
+
+                rebuild = (base is None or not base[2] or time.time() - base_built_at > self.rebuild_interval)
+                claimed = rebuild and self._Claim_Rebuild(cursor, base_built_at)
+                connection.commit()
+        finally:
+            connection.close()
+
+        if claimed:
+            self.Rebuild()
+            return self.Sync()
+        if base is None or not base[2]:
+            return
+
+        merged = KLLSketch.Deserialize(base[2])
+        for worker, built_at, blob in rows:
+            # Deltas published before the base was built are already part of it.
+            if worker != "base" and blob and built_at >= base_built_at:
+                merged.Merge(KLLSketch.Deserialize(blob))
+
+        with self._lock:
+            if self._base_built_at != base_built_at:
+                # A new base covers everything this worker wrote before it, start a fresh delta
+                # and publish it so the stale one stops being merged.
+                self._delta = KLLSketch(self.k)
+                self._delta_dirty = self._base_built_at is not None
+                self._base_built_at = base_built_at
+            self._merged = merged
+            self.ready = True
+
+    def Percentile(self, value) -> Optional[float]:
+        """Returns the Approximate Percentage of Values less than or equal to a Diagnosis, None if not loaded."""
+        with self._lock:
+            merged = self._merged
+        if merged is None or merged.count == 0:
+            return None
+        return merged.Rank(round(100*float(value), 4))*100
+
+    def Update(self, value) -> None:
+        """Records a Value written by this Worker, published with the next Sync."""
+        if value is None:
+            return
+        with self._lock:
+            self._delta.Update(100*float(value))
+            self._delta_dirty = True
+
+
+_quantile_sketches: Dict[str, SharedQuantileSketch] = {}
+_quantile_sketches_lock = threading.Lock()
+
+
+def Get_Quantile_Sketch(feature: str, table: str, column: str) -> SharedQuantileSketch:
+    """Returns the Process-Wide Shared Quantile Sketch of a Feature, creating it on first use.
+
+    Readers call Start() to begin synchronising; writers only call Update() and Sync().
+    """
+    with _quantile_sketches_lock:
+        sketch = _quantile_sketches.get(feature)
+        if sketch is None:
+            sketch = _quantile_sketches[feature] = SharedQuantileSketch(feature, table, column)
+        return sketch
@@ -0,0 +1,177 @@
+import os
+import time
+import logging
+import threading
+from datetime import timedelta
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+
+
+class UserResultCache:
+    """Bounded LRU Cache of Per-User Results with a Time-To-Live.
+
+    Entries are keyed by the user's email. A write path that changes what a user's result
+    would be records the email with Record_Invalidation() inside its transaction, and drops
+    it from the caches of its own process with Invalidate_User() after the commit. Caches in
+    other processes learn of the change from the CacheInvalidations table, polled every
+    RESULT_CACHE_POLL_INTERVAL seconds, so a stale entry outlives a write by at most one poll.
+
+    Results that also depend on other users (e.g. percentiles) are only refreshed by the TTL.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initializes the Cache parameters from Environment Variables.
+
+        Args:
+            name (str): Name of the cached result, e.g. "PieChart".
+        """
+        self.name = name
+        self.max_entries: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", 10000))
+        self.ttl: float = float(os.getenv("RESULT_CACHE_TTL", 60))
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "expirations": 0,
+            "evictions": 0,
+            "invalidations": 0
+        }
+
+    def Start(self) -> None:
+        """Starts listening for Invalidations recorded by other Processes."""
+        _Start_Poller()
+
+    def Get(self, email: str) -> Optional[Any]:
+        """Returns the Cached Result of a User, None on a miss or an expired entry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+            if entry[0] <= now:
+                del self._entries[email]
+                self._metrics["expirations"] += 1
+                self._metrics["misses"] += 1
+                return None
+            self._entries.move_to_end(email)
+            self._metrics["hits"] += 1
+            return entry[1]
+
+    def Put(self, email: str, value: Any) -> None:
+        """Caches the Result of a User, evicting the Least Recently Used entries beyond max_entries."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[email] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._metrics["evictions"] += 1
+
+    def Invalidate(self, email: str) -> None:
+        """Drops the Cached Result of a User."""
+        with self._lock:
+            if self._entries.pop(email, None) is not None:
+                self._metrics["invalidations"] += 1
+
+    def Metrics(self) -> Dict[str, Any]:
+        """Returns the Hit, Miss and Eviction Counters and the Current Size of the Cache."""
+        with self._lock:
+            lookups = self._metrics["hits"] + self._metrics["misses"]
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": self._metrics["hits"]/lookups if lookups else 0.0,
+                **self._metrics
+            }
+
+
+_caches: Dict[str, UserResultCache] = {}
+_caches_lock = threading.Lock()
+_poller: Optional[threading.Thread] = None
+
+
+def Get_Result_Cache(name: str) -> UserResultCache:
+    """Returns the Process-Wide Result Cache of a Name, creating it on first use."""
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = _caches[name] = UserResultCache(name)
+        return cache
+
+
+def Invalidate_User(*emails: str) -> None:
+    """Drops the Results of the given Users from every Cache of this Process."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        for email in emails:
+            cache.Invalidate(email)
+
+
+def Record_Invalidation(cursor, *emails: str) -> None:
+    """Records the given Users as changed, on the caller's Cursor so it commits with the Write.
+
+    Args:
+        cursor: Cursor of the transaction that changes the users.
+        emails (str): Emails whose cached results are no longer valid.
+    """
+    for email in emails:
+        cursor.execute("""
+            INSERT INTO CacheInvalidations (Email, InvalidatedAt) VALUES (%s, CURRENT_TIMESTAMP(6))
+            ON DUPLICATE KEY UPDATE InvalidatedAt = CURRENT_TIMESTAMP(6)
+        """, (email,))
+
+
+def Result_Cache_Metrics() -> Dict[str, Dict[str, Any]]:
+    """Returns the Metrics of every Result Cache of this Process."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {cache.name: cache.Metrics() for cache in caches}
+
+
+def _Start_Poller() -> None:
+    global _poller
+    with _caches_lock:
+        if _poller is not None:
+            return
+        interval = float(os.getenv("RESULT_CACHE_POLL_INTERVAL", 2))
+        if interval <= 0:
+            return
+        _poller = threading.Thread(target=_Poll_Loop, args=(interval,), name="ResultCacheInvalidations", daemon=True)
+        _poller.start()
+
+
+def _Poll_Loop(interval: float) -> None:
+    # Rows are stamped when the write runs but become visible when it commits, so each poll
+    # re-reads an overlap window behind the database time of the previous poll.
+    overlap = timedelta(seconds=float(os.getenv("RESULT_CACHE_POLL_OVERLAP", 10)))
+    pool: Optional[ConnectionPool] = None
+    since = None
+    while True:
+        time.sleep(interval)
+        try:
+            if pool is None:
+                pool = Get_Pool("ResultCache")
+            connection = pool.Get_Connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT CURRENT_TIMESTAMP(6)")
+                    now = cursor.fetchone()[0]
+                    cursor.execute(
+                        "SELECT Email FROM CacheInvalidations WHERE InvalidatedAt >= %s",
+                        (since if since is not None else now - overlap,)
+                    )
+                    rows = cursor.fetchall()
+            finally:
+                connection.close()
+
+            since = now - overlap
+            if rows:
+                Invalidate_User(*(row[0] for row in rows))
+        except Exception:
+            logging.error("Failed to Poll the Result Cache Invalidations", exc_info=True)
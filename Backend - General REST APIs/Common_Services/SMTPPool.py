@@ -0,0 +1,248 @@
+import os
+import time
+import atexit
+import smtplib
+import logging
+import threading
+from collections import deque
+from email.message import EmailMessage
+from typing import Deque, Dict, Optional, Tuple
+
+
+class SMTPPool:
+    """Thread-Safe Pool of Authenticated, Keep-Alive SMTP Sessions.
+
+    A session idle for more than noop_after seconds is checked with NOOP before reuse, and one
+    idle for more than idle_timeout seconds is closed, since servers drop quiet sessions. A
+    message whose session was dropped mid-send is retried once on a fresh session.
+    """
+
+    def __init__(self, host: str, port: int, security: str, username: Optional[str], password: Optional[str],
+                 max_size: int = 4, idle_timeout: float = 240.0, noop_after: float = 10.0,
+                 checkout_timeout: float = 30.0, timeout: float = 30.0) -> None:
+        """Initializes the Pool parameters and Metrics.
+
+        Args:
+            host (str): SMTP server host.
+            port (int): SMTP server port.
+            security (str): "ssl" for implicit TLS, "starttls", or "none" for a plain local server.
+            username (Optional[str]): Login user, no login if empty.
+            password (Optional[str]): Login password.
+            max_size (int): Maximum number of sessions open at the same time.
+            idle_timeout (float): Seconds after which an idle session is closed instead of reused.
+            noop_after (float): Seconds of idleness after which a session is checked with NOOP.
+            checkout_timeout (float): Seconds to wait for a free session before failing.
+            timeout (float): Socket timeout of a session.
+        """
+        if security not in ("ssl", "starttls", "none"):
+            raise ValueError("SMTP Security must be one of 'ssl', 'starttls' or 'none'.")
+        if max_size < 1:
+            raise ValueError("SMTP Pool max_size must be at least 1.")
+
+        self.host = host
+        self.port = port
+        self.security = security
+        self.username = username
+        self.password = password
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.noop_after = noop_after
+        self.checkout_timeout = checkout_timeout
+        self.timeout = timeout
+
+        self._idle: Deque[Tuple[smtplib.SMTP, float]] = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        self._metrics: Dict[str, float] = {
+            "sent": 0,
+            "failed": 0,
+            "created": 0,
+            "reused": 0,
+            "noop_checks": 0,
+            "noop_failures": 0,
+            "reconnects": 0,
+            "evicted_idle": 0,
+            "send_seconds": 0.0
+        }
+
+    def _Open(self) -> smtplib.SMTP:
+        """Opens and Authenticates a New Session."""
+        if self.security == "ssl":
+            session = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            session = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.security == "starttls":
+                session.starttls()
+        try:
+            if self.username:
+                session.login(self.username, self.password)
+        except Exception:
+            self._Discard(session)
+            raise
+        with self._condition:
+            self._metrics["created"] += 1
+        return session
+
+    def _Discard(self, session: smtplib.SMTP) -> None:
+        """Closes a Session without raising."""
+        try:
+            session.quit()
+        except Exception:
+            try:
+                session.close()
+            except Exception:
+                logging.debug("Error while Closing an SMTP Session", exc_info=True)
+
+    def _Healthy(self, session: smtplib.SMTP) -> bool:
+        """Checks a Session with NOOP."""
+        with self._condition:
+            self._metrics["noop_checks"] += 1
+        try:
+            return session.noop()[0] == 250
+        except Exception:
+            with self._condition:
+                self._metrics["noop_failures"] += 1
+            return False
+
+    def _Checkout(self) -> smtplib.SMTP:
+        """Takes an Idle Session or opens a New One within max_size."""
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            session, idle_since = None, 0.0
+            with self._condition:
+                if self._closed:
+                    raise smtplib.SMTPException("SMTP Pool is closed.")
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("Timed out waiting for an SMTP Session.")
+                    self._condition.wait(remaining)
+                if self._idle:
+                    session, idle_since = self._idle.pop()
+                else:
+                    self._size += 1
+
+            if session is None:
+                try:
+                    return self._Open()
+                except Exception:
+                    self._Release(None)
+                    raise
+
+            idle = time.monotonic() - idle_since
+            if idle > self.idle_timeout or (idle > self.noop_after and not self._Healthy(session)):
+                self._Discard(session)
+                with self._condition:
+                    if idle > self.idle_timeout:
+                        self._metrics["evicted_idle"] += 1
+                self._Release(None)
+                continue
+            with self._condition:
+                self._metrics["reused"] += 1
+            return session
+
+    def _Release(self, session: Optional[smtplib.SMTP]) -> None:
+        """Returns a Session to the Pool, or frees its slot if it is None."""
+        with self._condition:
+            if session is not None and not self._closed:
+                self._idle.append((session, time.monotonic()))
+                session = None
+            else:
+                self._size -= 1
+            self._condition.notify()
+        if session is not None:
+            self._Discard(session)
+
+    def Send(self, message: EmailMessage) -> None:
+        """Sends a Message on a Pooled Session, reconnecting once if the Server dropped it.
+
+        Args:
+            message (EmailMessage): The message to send.
+        """
+        start = time.monotonic()
+        for attempt in range(2):
+            session = self._Checkout()
+            try:
+                session.send_message(message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError):
+                self._Discard(session)
+                self._Release(None)
+                if attempt == 0:
+                    with self._condition:
+                        self._metrics["reconnects"] += 1
+                    continue
+                with self._condition:
+                    self._metrics["failed"] += 1
+                raise
+            except Exception:
+                # The server rejected this message; the session itself is still usable.
+                self._Release(session)
+                with self._condition:
+                    self._metrics["failed"] += 1
+                raise
+            self._Release(session)
+            with self._condition:
+                self._metrics["sent"] += 1
+                self._metrics["send_seconds"] += time.monotonic() - start
+            return
+
+    def Warm(self) -> None:
+        """Opens one Session so the first Message does not pay the Handshake."""
+        try:
+            self._Release(self._Checkout())
+        except Exception:
+            logging.error(f"Failed to Warm the SMTP Pool for {self.host}:{self.port}", exc_info=True)
+
+    def Metrics(self) -> Dict[str, float]:
+        """Returns a Snapshot of the Pool Metrics."""
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics.update({"size": self._size, "idle": len(self._idle), "max_size": self.max_size})
+        return metrics
+
+    def Close(self) -> None:
+        """Closes every Idle Session; Sessions in use are closed when released."""
+        with self._condition:
+            self._closed = True
+            idle = [session for session, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for session in idle:
+            self._Discard(session)
+
+
+_smtp_pool: Optional[SMTPPool] = None
+_smtp_pool_lock = threading.Lock()
+
+
+def Get_SMTP_Pool() -> SMTPPool:
+    """Returns the Process-Wide SMTP Pool, creating and warming it on first use.
+
+    The server is read from SMTP_HOST, SMTP_PORT and SMTP_SECURITY (defaults: Gmail over
+    implicit TLS) and the login from SERVER_EMAIL and SERVER_PASSWORD, so a local SMTP
+    stand-in can be used with SMTP_HOST=localhost, SMTP_PORT=1025, SMTP_SECURITY=none.
+    Sizing is read from SMTP_POOL_SIZE, SMTP_IDLE_TIMEOUT, SMTP_NOOP_AFTER and
+    SMTP_CHECKOUT_TIMEOUT.
+    """
+    global _smtp_pool
+    with _smtp_pool_lock:
+        if _smtp_pool is not None:
+            return _smtp_pool
+        _smtp_pool = SMTPPool(
+            host=os.getenv("SMTP_HOST", "smtp.gmail.com"),
+            port=int(os.getenv("SMTP_PORT", 465)),
+            security=os.getenv("SMTP_SECURITY", "ssl").lower(),
+            username=os.getenv("SERVER_EMAIL"),
+            password=os.getenv("SERVER_PASSWORD"),
+            max_size=int(os.getenv("SMTP_POOL_SIZE", 4)),
+            idle_timeout=float(os.getenv("SMTP_IDLE_TIMEOUT", 240)),
+            noop_after=float(os.getenv("SMTP_NOOP_AFTER", 10)),
+            checkout_timeout=float(os.getenv("SMTP_CHECKOUT_TIMEOUT", 30))
+        )
+        atexit.register(_smtp_pool.Close)
+
+    if os.getenv("SMTP_POOL_WARM", "true").lower() == "true":
+        _smtp_pool.Warm()
+    return _smtp_pool
@@ -0,0 +1,366 @@
+import os
+import json
+import time
+import atexit
+import logging
+import pymysql
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from Common_Services.ConnectionPool import ConnectionPool
+
+try:
+    import fcntl
+except ImportError:
+    # Windows locks the WAL with msvcrt instead.
+    fcntl = None
+    import msvcrt
+
+# Errors caused by the Rows themselves: retrying the same Batch can never succeed.
+NON_TRANSIENT_ERRORS = (
+    pymysql.err.DataError,
+    pymysql.err.IntegrityError,
+    pymysql.err.ProgrammingError,
+    pymysql.err.NotSupportedError
+)
+
+
+class WriteBehindBuffer:
+    """Buffers Rows of one INSERT Statement and writes them in Batches with executemany.
+
+    Append() returns as soon as the row is buffered (and, with a WAL file, appended and
+    fsynced to it). A flusher thread writes the buffer once it holds max_batch rows or its
+    oldest row is flush_interval seconds old, one transaction per batch. A batch that fails
+    on the connection stays buffered and is retried; a batch rejected for its data is written
+    row by row, and the rows still rejected are dead-lettered (to "<wal_path>.dead", or the
+    log without a WAL) and dropped, so one bad row cannot block the buffer.
+
+    The WAL is append-only: after each batch only the byte offset of the first unwritten row
+    is saved to "<wal_path>.offset". The WAL is truncated when the buffer drains and compacted
+    once its written prefix exceeds compact_bytes. It is replayed from the offset on startup,
+    so rows buffered by a process that crashed are written by the next one; delivery is
+    at-least-once, a crash between a commit and the offset update may insert a batch twice.
+    A WAL file belongs to one process: a second buffer on the same path fails to start.
+    """
+
+    def __init__(self, name: str, pool: ConnectionPool, insert_query: str, max_batch: int = 500,
+                 flush_interval: float = 1.0, max_buffer: int = 100000, wal_path: Optional[str] = None,
+                 fsync: bool = True, compact_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initializes the Buffer, Locks and Replays the WAL File.
+
+        Args:
+            name (str): Name of the buffer, used for logs and metrics.
+            pool (ConnectionPool): Pool the batches are written with.
+            insert_query (str): Single-row INSERT statement with %s placeholders.
+            max_batch (int): Rows per executemany, and the buffer size that triggers a flush.
+            flush_interval (float): Seconds the oldest buffered row may wait before a flush.
+            max_buffer (int): Rows the buffer may hold; Append() refuses rows beyond it.
+            wal_path (Optional[str]): Path of the local WAL file, no WAL if None.
+            fsync (bool): Whether to fsync the WAL after every appended row.
+            compact_bytes (int): Size of the written WAL prefix that triggers a compaction.
+
+        Raises:
+            RuntimeError: If another process holds the WAL file.
+        """
+        self.name = name
+        self.pool = pool
+        self.insert_query = insert_query
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.wal_path = wal_path
+        self.fsync = fsync
+        self.compact_bytes = compact_bytes
+
+        self._rows: List[Sequence[Any]] = []
+        # WAL byte offset just past each buffered row, parallel to _rows
+        self._ends: List[int] = []
+        self._oldest: Optional[float] = None
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        self._flush_lock = threading.Lock()
+        self._wal = None
+        self._wal_lock = None
+        self._flusher: Optional[threading.Thread] = None
+        self._metrics: Dict[str, float] = {
+            "buffered": 0,
+            "flushed": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "split_batches": 0,
+            "dead_lettered": 0,
+            "refused": 0,
+            "replayed": 0,
+            "compactions": 0,
+            "flush_seconds": 0.0,
+            "max_flush_seconds": 0.0
+        }
+
+        if self.wal_path:
+            self._Lock_WAL()
+            self._Replay_WAL()
+            self._wal = open(self.wal_path, "ab")
+
+    def _Lock_WAL(self) -> None:
+        """Takes the Exclusive Lock of the WAL File, held until the Process Exits."""
+        self._wal_lock = open(f"{self.wal_path}.lock", "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._wal_lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                self._wal_lock.seek(0)
+                msvcrt.locking(self._wal_lock.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            self._wal_lock.close()
+            self._wal_lock = None
+            raise RuntimeError(
+                f"The {self.name} WAL {self.wal_path} is in use by another process; "
+                "give every process (worker, reloader) its own WAL path."
+            )
+
+    def _Read_Offset(self) -> int:
+        try:
+            with open(f"{self.wal_path}.offset", "r", encoding="utf-8") as file:
+                return int(file.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _Write_Offset(self, offset: int) -> None:
+        """Saves the Offset of the First Unwritten WAL Row; a few bytes, whatever the buffer depth."""
+        temporary = f"{self.wal_path}.offset.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(str(offset))
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        os.replace(temporary, f"{self.wal_path}.offset")
+
+    def _Replay_WAL(self) -> None:
+        """Loads the Rows left in the WAL File by a previous Process."""
+        if os.path.exists(self.wal_path):
+            with open(self.wal_path, "rb") as file:
+                file.seek(self._Read_Offset())
+                for line in file:
+                    try:
+                        self._rows.append(json.loads(line))
+                    except ValueError:
+                        # A torn last line from a crash mid-append was never acknowledged.
+                        logging.warning(f"Skipped a Malformed {self.name} WAL Line")
+        if self._rows:
+            self._oldest = time.monotonic()
+            self._metrics["replayed"] += len(self._rows)
+            logging.info(f"Replayed {len(self._rows)} {self.name} Rows from the WAL.")
+        # Compact at once, dropping the written prefix and any torn line, and resetting the offset.
+        self._Compact_WAL()
+
+    def _Compact_WAL(self) -> None:
+        """Replaces the WAL with the Rows still Buffered. Must hold the condition lock, or run before the flusher starts."""
+        if self._wal is not None:
+            self._wal.close()
+        temporary = f"{self.wal_path}.tmp"
+        ends, end = [], 0
+        with open(temporary, "wb") as file:
+            for row in self._rows:
+                line = (json.dumps(list(row)) + "\n").encode("utf-8")
+                file.write(line)
+                end += len(line)
+                ends.append(end)
+            file.flush()
+            os.fsync(file.fileno())
+        # Reset the offset first: a crash in between replays written rows again rather than skipping new ones.
+        self._Write_Offset(0)
+        os.replace(temporary, self.wal_path)
+        self._ends = ends
+        if self._wal is not None:
+            self._wal = open(self.wal_path, "ab")
+        self._metrics["compactions"] += 1
+
+    def Start(self) -> None:
+        """Starts the Flusher Thread and registers the Drain at Exit."""
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._Flush_Loop, name=f"WriteBehind-{self.name}", daemon=True)
+            self._flusher.start()
+            atexit.register(self.Close)
+
+    def Append(self, row: Sequence[Any]) -> bool:
+        """Buffers a Row for the next Batch.
+
+        Args:
+            row (Sequence[Any]): Values for the insert statement's placeholders.
+
+        Returns:
+            bool: True once the row is buffered, False if the buffer is full or closed and the caller must write it itself.
+        """
+        with self._condition:
+            if self._closed or len(self._rows) >= self.max_buffer:
+                self._metrics["refused"] += 1
+                return False
+            if self._wal is not None:
+                self._wal.write((json.dumps(list(row)) + "\n").encode("utf-8"))
+                self._wal.flush()
+                if self.fsync:
+                    os.fsync(self._wal.fileno())
+                self._ends.append(self._wal.tell())
+            self._rows.append(row)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            self._metrics["buffered"] += 1
+            if len(self._rows) >= self.max_batch:
+                self._condition.notify()
+        return True
+
+    def _Write_Rows(self, batch: List[Sequence[Any]]) -> Tuple[int, List[Tuple[Sequence[Any], str]]]:
+        """Writes a Rejected Batch Row by Row.
+
+        Returns:
+            Tuple[int, List[Tuple[Sequence[Any], str]]]: Rows processed (all unless a connection error
+            cut the split short) and the rows rejected with their errors.
+        """
+        rejected: List[Tuple[Sequence[Any], str]] = []
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                for done, row in enumerate(batch):
+                    try:
+                        cursor.execute(self.insert_query, row)
+                        connection.commit()
+                    except NON_TRANSIENT_ERRORS as error:
+                        connection.rollback()
+                        rejected.append((row, repr(error)))
+                    except Exception:
+                        logging.error(f"Failed to Write a {self.name} Row, Retrying the Rest", exc_info=True)
+                        return done, rejected
+        finally:
+            connection.close()
+        return len(batch), rejected
+
+    def _Dead_Letter(self, rejected: List[Tuple[Sequence[Any], str]]) -> None:
+        """Records the Rows the Database Rejected, then they are Dropped from the Buffer."""
+        for row, error in rejected:
+            logging.error(f"Dead-Lettered a {self.name} Row Rejected by the Database: {error}")
+        if self.wal_path:
+            with open(f"{self.wal_path}.dead", "a", encoding="utf-8") as file:
+                for row, error in rejected:
+                    file.write(json.dumps({"row": list(row), "error": error, "at": time.time()}) + "\n")
+        else:
+            for row, error in rejected:
+                logging.error(f"Rejected {self.name} Row: {json.dumps(list(row))}")
+
+    def _Remove_Head(self, count: int) -> None:
+        """Drops the first count Rows, once written or dead-lettered, and advances the WAL."""
+        if self._wal is not None:
+            # Save the offset outside the condition lock: Append() never waits on its fsync.
+            self._Write_Offset(self._ends[count - 1])
+        with self._condition:
+            # Only the flusher removes rows, so the batch is still the head of the buffer.
+            del self._rows[:count]
+            del self._ends[:count]
+            self._oldest = time.monotonic() if self._rows else None
+            if self._wal is not None:
+                if not self._rows:
+                    self._Write_Offset(0)
+                    self._wal.truncate(0)
+                elif self._ends and self._ends[0] > self.compact_bytes:
+                    self._Compact_WAL()
+
+    def Flush(self) -> int:
+        """Writes one Batch of the Oldest Buffered Rows.
+
+        Returns:
+            int: Number of rows removed from the buffer, written or dead-lettered.
+        """
+        with self._flush_lock:
+            with self._condition:
+                batch = self._rows[:self.max_batch]
+            if not batch:
+                return 0
+
+            start = time.monotonic()
+            rejected: List[Tuple[Sequence[Any], str]] = []
+            connection = self.pool.Get_Connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.executemany(self.insert_query, batch)
+                connection.commit()
+                done = len(batch)
+            except NON_TRANSIENT_ERRORS:
+                connection.rollback()
+                logging.warning(f"A {self.name} Batch was Rejected, Writing it Row by Row", exc_info=True)
+                with self._condition:
+                    self._metrics["split_batches"] += 1
+                done, rejected = self._Write_Rows(batch)
+            finally:
+                connection.close()
+            elapsed = time.monotonic() - start
+
+            if rejected:
+                self._Dead_Letter(rejected)
+            if done:
+                self._Remove_Head(done)
+            with self._condition:
+                self._metrics["flushed"] += done - len(rejected)
+                self._metrics["dead_lettered"] += len(rejected)
+                self._metrics["batches"] += 1
+                self._metrics["flush_seconds"] += elapsed
+                self._metrics["max_flush_seconds"] = max(self._metrics["max_flush_seconds"], elapsed)
+            if done < len(batch):
+                raise pymysql.err.OperationalError(f"{self.name} Row-by-Row Write Interrupted after {done} Rows")
+            return done
+
+    def _Flush_Loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if len(self._rows) >= self.max_batch:
+                        break
+                    if self._oldest is not None:
+                        remaining = self._oldest + self.flush_interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+            try:
+                self.Flush()
+            except Exception:
+                with self._condition:
+                    self._metrics["failed_batches"] += 1
+                logging.error(f"Failed to Flush the {self.name} Write-Behind Buffer, Retrying", exc_info=True)
+                time.sleep(self.flush_interval)
+
+    def Metrics(self) -> Dict[str, Any]:
+        """Returns the Buffer Depth and Flush Latency Metrics."""
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics.update({
+                "name": self.name,
+                "depth": len(self._rows),
+                "oldest_seconds": time.monotonic() - self._oldest if self._oldest is not None else 0.0,
+                "average_flush_seconds": metrics["flush_seconds"]/metrics["batches"] if metrics["batches"] else 0.0
+            })
+        return metrics
+
+    def Close(self) -> None:
+        """Stops Accepting Rows and Drains the Buffer; Rows that still fail stay in the WAL."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if self._flusher is not None:
+            self._flusher.join(self.flush_interval + 5)
+        try:
+            while self.Flush():
+                pass
+        except Exception:
+            logging.error(f"Failed to Drain the {self.name} Write-Behind Buffer", exc_info=True)
+        with self._condition:
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+            if self._wal_lock is not None:
+                self._wal_lock.close()
+                self._wal_lock = None
+            if self._rows:
+                logging.warning(f"{len(self._rows)} {self.name} Rows left Unwritten.")
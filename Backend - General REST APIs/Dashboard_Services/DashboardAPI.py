@@ -0,0 +1,217 @@
+import os
+import sys
+import logging
+import pymysql
+from typing import Any, Dict, Optional, Tuple
+from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, Flask, jsonify, request, Response
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.FeatureCharts import PieChart_Result, Percentile_Of
+from Common_Services.FeatureQuery import Fetch_Diagnoses
+from Common_Services.FeatureRegistry import Enabled_Features
+
+# Set Up Logging
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()]
+)
+
+# Load Environment Variables
+load_dotenv(dotenv_path='.env')
+
+# Initialize SERVER PORT
+port = int(os.getenv('PORT', 5000))
+
+
+class Dashboard:
+    """Handles Database Interaction for the Dashboard Page.
+
+    The profile and the Diabetes record are read with one JOIN, while the diagnosis of every
+    enabled feature is read with one UNION ALL statement and ranked with the shared percentile
+    logic of the Bar Chart. The two run concurrently on connections of the Dashboard pool, and
+    the Pie Chart slices are derived from the same diagnoses without another query.
+
+    The Dashboard holds no in-memory percentile index: in "histogram" PERCENTILE_MODE it reads
+    FeatureHistograms, otherwise the database counts the rows at or below the user's diagnosis.
+    """
+
+    PROFILE_COLUMNS = ["FullName", "Username", "Email", "Country", "CountryCode", "MobileNumber", "Address"]
+    DIABETES_COLUMNS = [
+        "Age", "Gender", "Weight", "Height", "FamilyHistory", "PhysicalActivityLevel", "DietaryHabits",
+        "EthnicityRace", "MedicationUse", "SleepDurationQuality", "StressLevels", "WaistCircumference",
+        "HipCircumference", "SmokingStatus", "FastingBloodGlucose", "HbA1c", "WaistToHipRatio", "BMI",
+        "CholesterolLevel", "DiabetesStatus", "DiabetesCategory", "OperationCount", "LastDate"
+    ]
+
+    def __init__(self) -> None:
+        """Initializes the Shared Database Connection Pool, the Percentile Mode and the Sub-Query Workers."""
+        self.pool: ConnectionPool = Get_Pool("Dashboard")
+        self.percentile_mode: str = os.getenv("PERCENTILE_MODE", "exact").lower()
+        self.executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("DASHBOARD_WORKERS", 8)),
+            thread_name_prefix="Dashboard"
+        )
+
+    def Profile_Data(self, email: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Get the Profile and the Latest Diabetes Record of a User in one Query
+
+        Args:
+            email (str): User's email address.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]: The user's profile, None if not registered, and Diabetes record, None if not started.
+        """
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                profile_columns = ", ".join(f"u.{column}" for column in self.PROFILE_COLUMNS)
+                diabetes_columns = ", ".join(f"d.{column}" for column in self.DIABETES_COLUMNS)
+                get_query = f"""
+                    SELECT {profile_columns}, d.Email, {diabetes_columns}
+                    FROM UsersData u
+                    LEFT JOIN UsersDiabetesData d ON d.Email = u.Email
+                    WHERE u.Email = %s
+                    LIMIT 1;
+                """
+                cursor.execute(get_query, (email,))
+                row = cursor.fetchone()
+        finally:
+            connection.close()
+
+        if row is None:
+            return None, None
+
+        split = len(self.PROFILE_COLUMNS)
+        profile = dict(zip(self.PROFILE_COLUMNS, row[:split]))
+        diabetes = dict(zip(self.DIABETES_COLUMNS, row[split + 1:])) if row[split] is not None else None
+        return profile, diabetes
+
+    def Feature_Charts(self, email: str) -> Tuple[list, float]:
+        """Get the Pie Chart Slices and the Bar Chart Percentile of every enabled Feature
+
+        Args:
+            email (str): User's email address.
+
+        Returns:
+            Tuple[list, float]: The per-feature Pie Chart results and the Bar Chart percentile, as /PieChart and /BarChart return them.
+        """
+        features = Enabled_Features()
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                diagnoses = Fetch_Diagnoses(cursor, email, features)
+
+                pie_chart, percentile = [], 0
+                for key, value in diagnoses.items():
+                    success, values, message = PieChart_Result(feature=key, value=value)
+                    pie_chart.append([success, values, message])
+                    if value is not None:
+                        percentile = Percentile_Of(cursor, key, features[key][0], features[key][1], value, self.percentile_mode)
+                    else:
+                        percentile = 0
+        finally:
+            connection.close()
+        return pie_chart, percentile/8
+
+    def Dashboard_Data(self, email: str) -> Tuple[bool, Dict[str, Any], str]:
+        """Get Everything the Dashboard Page Shows for a User
+
+        Args:
+            email (str): User's email address.
+
+        Returns:
+            Tuple[bool, Dict[str, Any], str]: A tuple containing a boolean indicating success, the dashboard document and a message.
+        """
+        try:
+            profile_future = self.executor.submit(self.Profile_Data, email)
+            charts_future = self.executor.submit(self.Feature_Charts, email)
+            profile, diabetes = profile_future.result()
+            pie_chart, percentile = charts_future.result()
+
+            if profile is None:
+                return False, {}, "Email does not exists."
+
+            data = {
+                "profile": profile,
+                "diabetes": diabetes,
+                "pie_chart": pie_chart,
+                "bar_chart": percentile
+            }
+            return True, data, "Successfully Fetched the Dashboard Data."
+        except pymysql.MySQLError:
+            logging.error("Database Error Occurred: ", exc_info=True)
+            return False, {}, "Database Error Occurred. Please try again later."
+        except Exception:
+            logging.error("An Unexpected Error Occurred: ", exc_info=True)
+            return False, {}, "An Unexpected Error Occurred. Please try again later."
+
+
+class DashboardAPI:
+    """Flask API Class for Handling Dashboard Requests."""
+
+    def __init__(self) -> None:
+        """Initializes the Flask App and sets up the Blueprint."""
+        self.app = Flask(__name__)
+        self.dashboard = Dashboard()
+        self.blueprint = Blueprint('Dashboard', __name__)
+        self.blueprint.add_url_rule(
+            rule='/Dashboard',
+            endpoint='Dashboard',
+            view_func=self.Dashboard_Page,
+            methods=['POST']
+        )
+        self.app.register_blueprint(self.blueprint)
+
+    def Authenticate_Request(self, req_data: dict) -> bool:
+        """Authenticates the Incoming Request based on Environment-Stored Credentials.
+
+        Args:
+            req_data (dict): The request data containing user, password, and token.
+
+        Returns:
+            bool: True if the request is authenticated, False otherwise.
+        """
+        return (
+            req_data.get("user") == os.getenv("AUTH_NAME") and
+            req_data.get("password") == os.getenv("AUTH_PASSWORD") and
+            req_data.get("token") == os.getenv("AUTH_TOKEN_DASHBOARD")
+        )
+
+    def Dashboard_Page(self) -> Response:
+        """Handles POST requests for the Dashboard.
+
+        Returns:
+            Response: A Flask Response object containing the JSON Response.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            success, data, message = self.dashboard.Dashboard_Data(req_data["email"])
+            response = {"success": success, "data": data, "message": message}
+
+            return jsonify(response), 200
+        except Exception:
+            logging.error("An Error Occurred during the Fetching Dashboard Data.", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
+    def run(self) -> None:
+        """Runs the Flask App."""
+        try:
+            self.app.run(debug=True, host='0.0.0.0', port=port)
+        except Exception:
+            logging.error("An Error Occurred while running the App", exc_info=True)
+
+
+if __name__ == "__main__":
+
+    dashboard_api = DashboardAPI()
+    dashboard_api.run()
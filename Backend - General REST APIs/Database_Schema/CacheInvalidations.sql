@@ -0,0 +1,7 @@
+-- Latest Write per User that invalidates cached Dashboard results, polled by every process.
+CREATE TABLE IF NOT EXISTS CacheInvalidations (
+    Email VARCHAR(255) NOT NULL,
+    InvalidatedAt DATETIME(6) NOT NULL,
+    PRIMARY KEY (Email),
+    INDEX (InvalidatedAt)
+);
@@ -0,0 +1,14 @@
+-- Tombstones of Deleted Accounts. The UsersData and Feature rows are deleted with the Tombstone,
+-- the remaining per-User rows are removed in Chunks by the Account Purger, which then sets PurgedAt.
+-- The Email stays reserved for Sign-Up until the Purge completes.
+CREATE TABLE IF NOT EXISTS DeletedAccounts (
+    Email VARCHAR(255) NOT NULL,
+    DeletedAt DATETIME(6) NOT NULL,
+    PurgedAt DATETIME(6),
+    PRIMARY KEY (Email),
+    INDEX (PurgedAt, DeletedAt)
+);
+
+-- The Purger deletes by Email in LIMIT-bounded Chunks, so every purged Table needs an Index led by Email.
+-- UsersDiabetesHistory and CacheInvalidations are keyed by Email already.
+CREATE INDEX UsersQueriesEmail ON UsersQueries (Email);
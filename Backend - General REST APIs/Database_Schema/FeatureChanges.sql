@@ -0,0 +1,13 @@
+-- Change Feed of the Diagnosis Scores, one Row per Write, recorded in the Write's Transaction.
+-- The Order Statistics Index of every BarChart process polls the Rows past the last Id it has
+-- applied, and prunes the Rows older than ORDER_STATISTICS_FEED_RETENTION seconds on rebuild.
+CREATE TABLE IF NOT EXISTS FeatureChanges (
+    Id BIGINT NOT NULL AUTO_INCREMENT,
+    Feature VARCHAR(64) NOT NULL,
+    OldValue DOUBLE,
+    NewValue DOUBLE,
+    ChangedAt DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    PRIMARY KEY (Id),
+    INDEX (Feature, Id),
+    INDEX (ChangedAt)
+);
@@ -0,0 +1,8 @@
+-- Number of Users per Diagnosis Score Bucket of each Feature, maintained on write.
+-- Backfill with: python Maintenance_Services/RebuildHistograms.py
+CREATE TABLE IF NOT EXISTS FeatureHistograms (
+    Feature VARCHAR(64) NOT NULL,
+    Bucket SMALLINT NOT NULL,
+    UserCount BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Feature, Bucket)
+);
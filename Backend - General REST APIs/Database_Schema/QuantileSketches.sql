@@ -0,0 +1,9 @@
+-- Serialized KLL Sketches of each Feature Diagnosis, shared by every Worker.
+-- Worker = 'base' holds the sketch of a full scan, any other value a worker's delta since that base.
+CREATE TABLE IF NOT EXISTS QuantileSketches (
+    Feature VARCHAR(64) NOT NULL,
+    Worker VARCHAR(128) NOT NULL,
+    BuiltAt DOUBLE NOT NULL,
+    Sketch MEDIUMBLOB NOT NULL,
+    PRIMARY KEY (Feature, Worker)
+);
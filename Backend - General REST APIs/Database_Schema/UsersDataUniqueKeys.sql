@@ -0,0 +1,10 @@
+-- Unique Keys on the Sign-Up Values of UsersData. The Membership Index of a process only skips the
+-- uniqueness SELECT for values it has never seen, and a value registered by another process since its
+-- last refresh is one of them, so these Keys are what rejects the duplicate (as an IntegrityError).
+-- Existing duplicates must be resolved first; list them with, for each column:
+--   SELECT Email, COUNT(*) FROM UsersData GROUP BY Email HAVING COUNT(*) > 1;
+ALTER TABLE UsersData
+    ADD UNIQUE KEY UsersDataEmail (Email),
+    ADD UNIQUE KEY UsersDataUsername (Username),
+    ADD UNIQUE KEY UsersDataMobileNumber (MobileNumber),
+    ALGORITHM = INPLACE, LOCK = NONE;
@@ -0,0 +1,28 @@
+-- Append-Only Time Series of Diabetes Assessments, one Row per Assessment, written in the
+-- same Transaction as UsersDiabetesData. Version is the OperationCount the assessment produced.
+-- Partitioned by Year of AssessmentDate; add next years' partitions with
+-- python Maintenance_Services/ExtendHistoryPartitions.py
+CREATE TABLE IF NOT EXISTS UsersDiabetesHistory (
+    Email VARCHAR(255) NOT NULL,
+    Version INT NOT NULL,
+    AssessmentDate DATE NOT NULL,
+    Weight DOUBLE,
+    WaistCircumference DOUBLE,
+    HipCircumference DOUBLE,
+    FastingBloodGlucose DOUBLE,
+    HbA1c DOUBLE,
+    WaistToHipRatio DOUBLE,
+    BMI DOUBLE,
+    CholesterolLevel DOUBLE,
+    DiabetesStatus DOUBLE,
+    DiabetesCategory VARCHAR(64),
+    -- Partitioned tables need the partitioning column in every unique key.
+    PRIMARY KEY (Email, Version, AssessmentDate)
+)
+PARTITION BY RANGE COLUMNS (AssessmentDate) (
+    PARTITION p2024 VALUES LESS THAN ('2025-01-01'),
+    PARTITION p2025 VALUES LESS THAN ('2026-01-01'),
+    PARTITION p2026 VALUES LESS THAN ('2027-01-01'),
+    PARTITION p2027 VALUES LESS THAN ('2028-01-01'),
+    PARTITION pFuture VALUES LESS THAN (MAXVALUE)
+);
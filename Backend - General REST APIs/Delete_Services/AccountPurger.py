@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.MembershipIndex import MembershipIndex, Get_Membership_Index
+
+# Set Up Logging
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()]
+)
+
+# Load Environment Variables
+load_dotenv(dotenv_path='.env')
+
+
+class AccountPurger:
+    """Removes the Remaining Rows of Deleted Accounts in Bounded Chunks.
+
+    Deleting an account only tombstones it in DeletedAccounts. The purger picks up tombstones
+    older than the purge delay (which leaves the result cache pollers time to see the deletion)
+    and deletes the account's rows from every table in PURGE_TABLES with DELETE ... LIMIT on the
+    Email index, committing each chunk and pausing between chunks, so no purge holds row locks or
+    undo for long. The tombstone is marked purged, and its Email released for sign-up, once every
+    table is clear. Purging is idempotent, so several purgers may run at once.
+    """
+
+    # Per-User Tables purged after the Tombstone, each with an Index led by Email
+    PURGE_TABLES = ("UsersDiabetesHistory", "UsersQueries", "CacheInvalidations")
+
+    def __init__(self) -> None:
+        """Initializes the Shared Database Connection Pool and the Purge Parameters from Environment Variables."""
+        self.pool: ConnectionPool = Get_Pool("AccountPurger")
+        self.index: MembershipIndex = Get_Membership_Index()
+        self.chunk_size: int = int(os.getenv("ACCOUNT_PURGE_CHUNK_SIZE", 1000))
+        self.chunk_pause: float = float(os.getenv("ACCOUNT_PURGE_CHUNK_PAUSE", 0.05))
+        self.delay: float = float(os.getenv("ACCOUNT_PURGE_DELAY", 60))
+        self.interval: float = float(os.getenv("ACCOUNT_PURGE_INTERVAL", 30))
+        self.accounts_per_pass: int = int(os.getenv("ACCOUNT_PURGE_ACCOUNTS_PER_PASS", 100))
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, float] = {
+            "passes": 0,
+            "accounts_purged": 0,
+            "rows_deleted": 0,
+            "chunks": 0,
+            "failed_accounts": 0,
+            "max_chunk_seconds": 0.0
+        }
+
+    def Start(self) -> None:
+        """Starts the Background Purge Thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._Purge_Loop, name="AccountPurger", daemon=True)
+            self._thread.start()
+
+    def _Purge_Loop(self) -> None:
+        while True:
+            try:
+                self.Purge_Pass()
+            except Exception:
+                logging.error("Failed to Run an Account Purge Pass", exc_info=True)
+            time.sleep(self.interval)
+
+    def _Due_Tombstones(self) -> List[tuple]:
+        """Returns the Email and DeletedAt of the Oldest Tombstones due for Purging."""
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("""
+                    SELECT Email, DeletedAt FROM DeletedAccounts
+                    WHERE PurgedAt IS NULL AND DeletedAt <= CURRENT_TIMESTAMP(6) - INTERVAL %s MICROSECOND
+                    ORDER BY DeletedAt
+                    LIMIT %s
+                """, (int(self.delay * 1000000), self.accounts_per_pass))
+                return list(cursor.fetchall())
+        finally:
+            connection.close()
+
+    def Purge_Account(self, email: str, deleted_at) -> int:
+        """Deletes the Rows of one Tombstoned Account, Chunk by Chunk, then marks it Purged.
+
+        Args:
+            email (str): Email of the deleted account.
+            deleted_at: DeletedAt of the tombstone; a newer tombstone of the same Email is left for its own pass.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        deleted = 0
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                for table in self.PURGE_TABLES:
+                    while True:
+                        start = time.monotonic()
+                        cursor.execute(f"DELETE FROM {table} WHERE Email = %s LIMIT %s", (email, self.chunk_size))
+                        rows = cursor.rowcount
+                        connection.commit()
+                        elapsed = time.monotonic() - start
+                        deleted += rows
+                        with self._lock:
+                            self._metrics["chunks"] += 1
+                            self._metrics["rows_deleted"] += rows
+                            self._metrics["max_chunk_seconds"] = max(self._metrics["max_chunk_seconds"], elapsed)
+                        if rows < self.chunk_size:
+                            break
+                        time.sleep(self.chunk_pause)
+
+                cursor.execute(
+                    "UPDATE DeletedAccounts SET PurgedAt = CURRENT_TIMESTAMP(6) WHERE Email = %s AND DeletedAt = %s AND PurgedAt IS NULL",
+                    (email, deleted_at)
+                )
+                connection.commit()
+        finally:
+            connection.close()
+
+        self.index.Remove("Email", email)
+        with self._lock:
+            self._metrics["accounts_purged"] += 1
+        return deleted
+
+    def Purge_Pass(self) -> int:
+        """Purges the Tombstones currently Due.
+
+        Returns:
+            int: Number of accounts purged.
+        """
+        purged = 0
+        for email, deleted_at in self._Due_Tombstones():
+            try:
+                rows = self.Purge_Account(email, deleted_at)
+                purged += 1
+                logging.info(f"Purged {rows} Rows of a Deleted Account.")
+            except Exception:
+                with self._lock:
+                    self._metrics["failed_accounts"] += 1
+                logging.error("Failed to Purge a Deleted Account, Retrying Next Pass", exc_info=True)
+        with self._lock:
+            self._metrics["passes"] += 1
+        return purged
+
+    def Metrics(self) -> Dict[str, Any]:
+        """Returns the Purge Counters and the Number of Tombstones still to Purge."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT COUNT(*), MIN(DeletedAt) FROM DeletedAccounts WHERE PurgedAt IS NULL")
+                backlog, oldest = cursor.fetchone()
+        finally:
+            connection.close()
+        metrics["backlog"] = int(backlog)
+        metrics["oldest_pending"] = oldest.isoformat() if oldest else None
+        return metrics
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Purge the Remaining Rows of Deleted Accounts.")
+    parser.add_argument("--once", action="store_true", help="Run passes until no tombstone is due, then exit.")
+    args = parser.parse_args()
+
+    account_purger = AccountPurger()
+    if args.once:
+        while account_purger.Purge_Pass():
+            pass
+        print(json.dumps(account_purger.Metrics()))
+    else:
+        account_purger._Purge_Loop()
@@ -1,10 +1,21 @@
 import os
+import sys
+import time
 import logging
 import pymysql
-from typing import Tuple
+from typing import Any, Dict, List, Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+from AccountPurger import AccountPurger
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services import FeatureHistogram
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.FeatureChanges import Record_Removals
+from Common_Services.FeatureRegistry import Enabled_Features
+from Common_Services.MembershipIndex import MembershipIndex, Get_Membership_Index
+from Common_Services.ResultCache import Invalidate_User, Record_Invalidation
 
 # Set Up Logging
 logging.basicConfig(
@@ -21,55 +32,77 @@ port = int(os.getenv('PORT', 5000))
 
 
 class DeleteAccount:
-    """Handles Database Interaction for User Deletion."""
+    """Handles Database Interaction for User Deletion.
+
+    A deletion removes the UsersData row and the user's row in every enabled feature table, and
+    tombstones the user in DeletedAccounts, in a single transaction. The user's remaining rows
+    (assessment history, queries, ...) are removed in chunks afterwards by the AccountPurger,
+    and the Email stays reserved for sign-up until then.
+    """
 
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
+        """Initializes the Shared Database Connection Pool and Membership Index of the Service."""
+        self.pool: ConnectionPool = Get_Pool("DeleteAccount")
+        self.index: MembershipIndex = Get_Membership_Index()
+        self.batch_size: int = int(os.getenv("DELETE_BATCH_SIZE", 500))
 
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
+    def _Tombstone_Users(self, cursor: pymysql.cursors.Cursor, emails: List[str]) -> List[tuple]:
+        """Deletes the Users of a Chunk and writes their Tombstones, on the caller's Transaction.
 
         Returns:
-            pymysql.connections.Connection: The database connection object.
+            List[tuple]: Email, Username and MobileNumber of every user found and deleted.
         """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        placeholders = ", ".join(["%s"] * len(emails))
+        cursor.execute(f"SELECT Email, Username, MobileNumber FROM UsersData WHERE Email IN ({placeholders}) FOR UPDATE", emails)
+        users = list(cursor.fetchall())
+        if not users:
+            return users
+
+        found = [user[0] for user in users]
+        placeholders = ", ".join(["%s"] * len(found))
+        for feature, (table, column) in Enabled_Features().items():
+            # Lock and Remove the Diagnoses from the Histogram and the Order Statistics with their Rows.
+            cursor.execute(f"SELECT {column} FROM {table} WHERE Email IN ({placeholders}) FOR UPDATE", found)
+            values = [row[0] for row in cursor.fetchall()]
+            FeatureHistogram.Remove_Values(cursor, feature, values)
+            Record_Removals(cursor, feature, values)
+            cursor.execute(f"DELETE FROM {table} WHERE Email IN ({placeholders})", found)
+
+        cursor.execute(f"DELETE FROM UsersData WHERE Email IN ({placeholders})", found)
+        cursor.executemany("""
+            INSERT INTO DeletedAccounts (Email, DeletedAt) VALUES (%s, CURRENT_TIMESTAMP(6))
+            ON DUPLICATE KEY UPDATE DeletedAt = CURRENT_TIMESTAMP(6), PurgedAt = NULL
+        """, [(email,) for email in found])
+        Record_Invalidation(cursor, *found)
+        return users
+
+    def _Forget_Users(self, users: List[tuple]) -> None:
+        """Applies Committed Deletions to the Membership Index and the Result Caches."""
+        for _, user_name, phone_number in users:
+            self.index.Remove("Username", user_name)
+            self.index.Remove("MobileNumber", phone_number)
+        Invalidate_User(*[user[0] for user in users])
 
     def Delete_User(self, email: str) -> Tuple[bool, str]:
         """Deletes a User from the Database based on Email.
 
         Args:
-            user_identifier (str): Email of the User to be Deleted.
+            email (str): Email of the User to be Deleted.
 
         Returns:
             Tuple[bool, str]: A tuple containing a Boolean Indicating Success and a Message.
         """
         connection = None
         try:
-            connection = self.Database_Connection()
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
-                # Delete User from the Database
-                delete_query = """
-                    DELETE FROM UsersData
-                    WHERE Email = %s;
-                """
-                cursor.execute(delete_query, (email,))
-                connection.commit()
-                
-                if cursor.rowcount == 0:
+                users = self._Tombstone_Users(cursor, [email])
+                if not users:
+                    connection.rollback()
                     return False, "No User Found with the Given Email."
-                
+
+                connection.commit()
+                self._Forget_Users(users)
                 return True, "User Account Deleted Successfully."
 
         except pymysql.MySQLError:
@@ -83,6 +116,58 @@ class DeleteAccount:
             if connection:
                 connection.close()
 
+    def Delete_Users(self, emails: List[str]) -> Dict[str, Any]:
+        """Deletes a Batch of Users, one Transaction per Chunk of DELETE_BATCH_SIZE Emails.
+
+        A chunk that fails is rolled back and reported, and the following chunks still run.
+
+        Args:
+            emails (List[str]): Emails of the Users to be Deleted.
+
+        Returns:
+            Dict[str, Any]: Totals and a per-email result report.
+        """
+        start = time.monotonic()
+        emails = list(dict.fromkeys(emails))
+        results: List[Dict[str, Any]] = []
+        deleted = 0
+
+        connection = self.pool.Get_Connection()
+        try:
+            for offset in range(0, len(emails), self.batch_size):
+                chunk = emails[offset:offset + self.batch_size]
+                try:
+                    with connection.cursor() as cursor:
+                        users = self._Tombstone_Users(cursor, chunk)
+                    connection.commit()
+                except pymysql.MySQLError:
+                    connection.rollback()
+                    logging.error("Database Error Occurred: ", exc_info=True)
+                    results.extend({"email": email, "success": False, "message": "Database Error Occurred. Please try again later."} for email in chunk)
+                    continue
+
+                self._Forget_Users(users)
+                # The collation may match Emails that differ in case from the request.
+                found = {user[0].casefold() for user in users}
+                for email in chunk:
+                    if email.casefold() in found:
+                        deleted += 1
+                        results.append({"email": email, "success": True, "message": "User Account Deleted Successfully."})
+                    else:
+                        results.append({"email": email, "success": False, "message": "No User Found with the Given Email."})
+        finally:
+            connection.close()
+
+        elapsed = time.monotonic() - start
+        logging.info(f"Batch Deletion Processed {len(emails)} Emails, Deleted {deleted} in {elapsed:.2f}s.")
+        return {
+            "total": len(emails),
+            "deleted": deleted,
+            "not_deleted": len(emails) - deleted,
+            "seconds": round(elapsed, 3),
+            "results": results
+        }
+
 
 class DeleteAccountAPI:
     """Flask API Class for Handling Delete Account Requests."""
@@ -91,6 +176,9 @@ class DeleteAccountAPI:
         """Initializes the Flask App and sets up the Blueprint."""
         self.app = Flask(__name__)
         self.delete_account = DeleteAccount()
+        self.account_purger = AccountPurger()
+        if os.getenv("ACCOUNT_PURGE_ENABLED", "true").lower() == "true":
+            self.account_purger.Start()
         self.blueprint = Blueprint('DeleteAccount', __name__)
         self.blueprint.add_url_rule(
             rule='/delete_account',
@@ -98,6 +186,18 @@ class DeleteAccountAPI:
             view_func=self.Delete_Account,
             methods=['DELETE']
         )
+        self.blueprint.add_url_rule(
+            rule='/delete_account/batch',
+            endpoint='delete_account_batch',
+            view_func=self.Delete_Account_Batch,
+            methods=['DELETE']
+        )
+        self.blueprint.add_url_rule(
+            rule='/delete_account/metrics',
+            endpoint='delete_account_metrics',
+            view_func=self.Delete_Account_Metrics,
+            methods=['POST']
+        )
         self.app.register_blueprint(self.blueprint)
 
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -137,6 +237,51 @@ class DeleteAccountAPI:
             logging.error("An Error Occurred during the Account Deletion Process", exc_info=True)
             return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
 
+    def Delete_Account_Batch(self) -> Response:
+        """Handles DELETE requests for Batch Account Deletion, e.g. Erasure Sweeps.
+
+        Returns:
+            Response: A Flask Response object containing the per-email JSON Report.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                return jsonify({"success": False, "message": "Authentication Failed"}), 403
+
+            emails = req_data.get("emails")
+            if not isinstance(emails, list) or not all(isinstance(email, str) for email in emails):
+                return jsonify({"success": False, "message": "emails must be a List of Email Addresses."}), 400
+
+            # Delete Users
+            report = self.delete_account.Delete_Users(emails)
+            message = f"{report['deleted']} of {report['total']} User Accounts Deleted Successfully."
+            return jsonify({"success": True, "data": report, "message": message}), 200
+
+        except Exception:
+            logging.error("An Error Occurred during the Batch Account Deletion Process", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
+    def Delete_Account_Metrics(self) -> Response:
+        """Handles POST requests for the Account Purger Metrics.
+
+        Returns:
+            Response: A Flask Response object containing the JSON Response.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                return jsonify({"success": False, "message": "Authentication Failed"}), 403
+
+            return jsonify({"success": True, "data": self.account_purger.Metrics()}), 200
+
+        except Exception:
+            logging.error("An Error Occurred while Fetching the Account Purger Metrics", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
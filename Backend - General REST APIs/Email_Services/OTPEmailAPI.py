@@ -1,11 +1,18 @@
 import os
-import random
-import smtplib
+import sys
+import time
+import secrets
 import logging
 from dotenv import load_dotenv
 from email.message import EmailMessage
 from flask import Blueprint, Flask, jsonify, request, Response
 
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.MailQueue import MailQueue, Get_Mail_Queue
+from Common_Services.OTPStore import OTPStore, Get_OTP_Store
+from Common_Services.SMTPPool import SMTPPool, Get_SMTP_Pool
+
 # Set Up Logging
 logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s",
@@ -34,7 +41,7 @@ class EmailOTP:
             str: The generated 6-digit OTP.
         """
         try:
-            otp = ''.join([str(random.randint(0, 9)) for _ in range(6)])
+            otp = ''.join([str(secrets.randbelow(10)) for _ in range(6)])
             logging.info("OTP Generated Successfully.")
             return otp
         except Exception as e:
@@ -49,8 +56,13 @@ class EmailOTPAPI:
         """Initializes the Flask App and sets up the Blueprint."""
         self.app = Flask(__name__)
         self.email_otp = EmailOTP()
+        self.smtp_pool: SMTPPool = Get_SMTP_Pool()
+        self.mail_queue: MailQueue = Get_Mail_Queue(self.smtp_pool.Send)
+        self.otp_store: OTPStore = Get_OTP_Store()
         self.blueprint = Blueprint('generate_otp', __name__)
         self.blueprint.add_url_rule('/GenerateOTP', 'GenerateOTP', self.Generate_Email_OTP, methods=['POST'])
+        self.blueprint.add_url_rule('/VerifyOTP', 'VerifyOTP', self.Verify_Email_OTP, methods=['POST'])
+        self.blueprint.add_url_rule('/MailQueue/Metrics', 'MailQueueMetrics', self.Mail_Queue_Metrics, methods=['POST'])
         self.app.register_blueprint(self.blueprint)
     
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -83,28 +95,13 @@ class EmailOTPAPI:
             msg['Subject'] = 'AliveAI Email Authentication'
             msg['From'] = f'AliveAI <{self.email_otp.email}>'
             msg['To'] = recipient_email
-            msg.set_content(f"Your OTP is: {otp}. It will expire within 300 seconds.")
+            msg.set_content(f"Your OTP is: {otp}. It will expire within {self.otp_store.ttl} seconds.")
             logging.info(f"Email Message created for Recipient: {recipient_email}")
             return msg
         except Exception as e:
             logging.error('An Error Occurred while creating the Email Message: ', exc_info=True)
             raise e
 
-    def Email_Server_AUTH(self) -> smtplib.SMTP_SSL:
-        """Logs in to the Email Server and returns the SMTP Connection.
-        
-        Returns:
-            smtplib.SMTP_SSL: The SMTP server connection.
-        """
-        try:
-            server = smtplib.SMTP_SSL('smtp.gmail.com', 465)
-            server.login(self.email_otp.email, self.email_otp.password)
-            logging.info("Successfully logged in to the email server.")
-            return server
-        except Exception as e:
-            logging.error('An error occurred during email server login: ', exc_info=True)
-            raise e
-
     def Generate_Email_OTP(self) -> Response:
         """Handles OTP Generation and sends an email to the Specified Recipient.
         
@@ -125,22 +122,20 @@ class EmailOTPAPI:
             recipient_email = request_data.get('to_mail')
             otp = self.email_otp.Generate_OTP()
 
-            # Create the Email Message
+            # Create the Email Message; a Recipient out of Attempts gets no new OTP until its Lockout ends
             email_message = self.Generate_Email_Message(otp, recipient_email)
+            issued, message = self.otp_store.Issue(recipient_email, otp)
+            if not issued:
+                return jsonify({"success": False, "message": message}), 429
 
-            # Log in to Email Server and Send the Message
-            email_server = self.Email_Server_AUTH()
-            email_server.send_message(email_message)
-            email_server.quit()
-            logging.info(f"OTP Sent Successfully to {recipient_email}.")
+            # Queue the Message, the Background Workers send it on the SMTP Pool until the OTP Expires
+            self.mail_queue.Enqueue(email_message, expires_at=time.time() + self.otp_store.ttl)
+            logging.info(f"OTP Queued for {recipient_email}.")
 
-            # Prepare the Response
+            # Prepare the Response, the OTP itself is only sent by Email and checked by /VerifyOTP
             response = {
                 "success": True,
-                "data": {
-                    "email": recipient_email,
-                    "otp": otp
-                },
+                "data": {"email": recipient_email, "expires_in": self.otp_store.ttl},
                 "message": f"OTP Sent Successfully to {recipient_email}."
             }
             return jsonify(response), 200
@@ -152,6 +147,68 @@ class EmailOTPAPI:
                 "message": "Failed to send OTP. Please try again."
             }), 500
 
+    def Verify_Email_OTP(self) -> Response:
+        """Handles OTP Verification against the Server-Side OTP Store.
+        
+        Returns:
+            Response: A Flask response object containing the result of the OTP verification.
+        """
+        try:
+            request_data = request.get_json()
+
+            # Authenticate the Incoming Request
+            if not self.Authenticate_Request(request_data):
+                logging.warning("Request Authentication Failed.")
+                return jsonify({
+                    "success": False,
+                    "message": "Authentication Failed."
+                }), 403
+
+            recipient_email = request_data.get('to_mail')
+            success, message = self.otp_store.Verify(recipient_email, request_data.get('otp', ''))
+            return jsonify({"success": success, "message": message}), 200
+
+        except Exception:
+            logging.error('An Error Occurred during OTP Verification: ', exc_info=True)
+            return jsonify({
+                "success": False,
+                "message": "Failed to verify OTP. Please try again."
+            }), 500
+
+    def Mail_Queue_Metrics(self) -> Response:
+        """Handles POST requests for the Mail Queue and SMTP Pool Metrics.
+        
+        Returns:
+            Response: A Flask response object containing the metrics.
+        """
+        try:
+            request_data = request.get_json()
+
+            # Authenticate the Incoming Request
+            if not self.Authenticate_Request(request_data):
+                logging.warning("Request Authentication Failed.")
+                return jsonify({
+                    "success": False,
+                    "message": "Authentication Failed."
+                }), 403
+
+            return jsonify({
+                "success": True,
+                "data": {
+                    "queue": self.mail_queue.Metrics(),
+                    "smtp": self.smtp_pool.Metrics(),
+                    "otp": self.otp_store.Metrics()
+                },
+                "message": "Mail Queue Metrics Fetched Successfully."
+            }), 200
+
+        except Exception:
+            logging.error('An Error Occurred while Fetching the Mail Queue Metrics: ', exc_info=True)
+            return jsonify({
+                "success": False,
+                "message": "Failed to fetch the Mail Queue Metrics."
+            }), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
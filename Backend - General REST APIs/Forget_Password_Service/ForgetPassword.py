@@ -1,10 +1,14 @@
 import os
+import sys
 import logging
 import pymysql
 from typing import Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
 
 # Set Up Logging
 logging.basicConfig(
@@ -24,27 +28,8 @@ class ForgetPassword:
     """Handles Database Interaction for Forget Password."""
     
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
-        
-        Returns:
-            pymysql.connections.Connection: The database connection object.
-        """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        """Initializes the Shared Database Connection Pool of the Service."""
+        self.pool: ConnectionPool = Get_Pool("ForgetPassword")
 
     def Users_Data_Table(self, email: str) -> Tuple[bool, str]:
         """Validate Account Exists in the Database or not.
@@ -57,20 +42,18 @@ class ForgetPassword:
         """
         connection = None
         try:
-            connection = self.Database_Connection()
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
                 # Validate if the Email Exists
                 validate_query = """
-                    SELECT Email
+                    SELECT 1
                     FROM UsersData
-                    WHERE Email = %s;
+                    WHERE Email = %s
+                    LIMIT 1;
                 """
-                cursor.execute(validate_query, (email))
-                
-                existing_data = cursor.fetchall()
-                email_exists = any(row[0] == email for row in existing_data)
+                cursor.execute(validate_query, (email,))
 
-                if email_exists:
+                if cursor.fetchone() is not None:
                     return True, "Account Exists in the Database."
                 return False, "Account does not Exists."
         
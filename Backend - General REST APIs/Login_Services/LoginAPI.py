@@ -1,10 +1,14 @@
 import os
+import sys
 import logging
-import pymysql
 from typing import Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.PasswordHasher import PasswordHasher, Get_Password_Hasher
 
 # Set Up Logging
 logging.basicConfig(
@@ -23,31 +27,42 @@ class Login:
     """Handles Database Interaction for User Login."""
     
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-    
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the Database using the Google Cloud SQL Connector.
+        """Initializes the Shared Database Connection Pool and Password Hasher of the Service."""
+        self.pool: ConnectionPool = Get_Pool("Login")
+        self.hasher: PasswordHasher = Get_Password_Hasher()
+
+    def Rehash_Password(self, email: str, password: str, stored_password: str) -> None:
+        """Replaces a Legacy or Outdated Stored Password with a Fresh KDF Hash.
         
-        Returns:
-            pymysql.connections.Connection: The database connection object.
+        The update only applies if the stored value is unchanged, so a concurrent password
+        change is never overwritten. Failures are logged and do not affect the login.
+        
+        Args:
+            email (str): The user's email.
+            password (str): The verified plaintext password.
+            stored_password (str): The stored value that was verified.
         """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        connection = None
+        try:
+            new_hash = self.hasher.Hash_Password(password)
+            connection = self.pool.Get_Connection()
+            with connection.cursor() as cursor:
+                rehash_query = "UPDATE UsersData SET `Password` = %s WHERE Email = %s AND `Password` = %s"
+                cursor.execute(rehash_query, (new_hash, email, stored_password))
+                connection.commit()
+        except Exception:
+            logging.error("An Error Occurred while Rehashing the User's Password", exc_info=True)
+        
+        finally:
+            if connection:
+                connection.close()
 
     def Users_Data_Table(self, email: str, password: str) -> Tuple[bool, str]:
         """Validates the User's Email and Password against the Database.
         
+        Existence and credential come from a single lookup on the Email index; the
+        connection is returned to the pool before the password hash is verified.
+        
         Args:
             email (str): The user's email.
             password (str): The user's password.
@@ -57,25 +72,27 @@ class Login:
         """
         connection = None
         try:
-            connection = self.Database_Connection()
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
-                # Validate Email Existence
-                email_query = "SELECT COUNT(*) FROM UsersData WHERE Email = %s"
-                cursor.execute(email_query, (email,))
-                email_count = cursor.fetchone()[0]
-                
-                if email_count == 0:
-                    return False, "Invalid Email"
-                
-                # Validate Password
-                password_query = "SELECT Password FROM UsersData WHERE Email = %s"
-                cursor.execute(password_query, (email,))
-                stored_password = cursor.fetchone()[0]
-                
-                if stored_password == password:
-                    return True, "Login Success!"
-                else:
-                    return False, "Invalid Password"
+                # Fetch the Stored Credential, no Row means the Email does not Exist
+                login_query = "SELECT `Password` FROM UsersData WHERE Email = %s LIMIT 1"
+                cursor.execute(login_query, (email,))
+                row = cursor.fetchone()
+            connection.close()
+            connection = None
+            
+            if row is None:
+                return False, "Invalid Email"
+            
+            # Validate Password
+            stored_password = row[0]
+            matches, needs_rehash = self.hasher.Verify_Password(password, stored_password)
+            if not matches:
+                return False, "Invalid Password"
+            
+            if needs_rehash:
+                self.Rehash_Password(email, password, stored_password)
+            return True, "Login Success!"
         except Exception:
             logging.error("An Error Occurred during user validation", exc_info=True)
             return False, "An Error Occurred. Please try again later."
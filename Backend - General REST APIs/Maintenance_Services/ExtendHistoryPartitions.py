@@ -0,0 +1,68 @@
+import os
+import sys
+import logging
+import argparse
+from datetime import date
+from dotenv import load_dotenv
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import Get_Pool
+
+# Set Up Logging
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()]
+)
+
+# Load Environment Variables
+load_dotenv(dotenv_path='.env')
+
+
+def Extend_History_Partitions(years_ahead: int) -> list:
+    """Splits the pFuture Partition of UsersDiabetesHistory so every Year up to years_ahead has its own.
+
+    Args:
+        years_ahead (int): Number of years after the current one that should have a partition.
+
+    Returns:
+        list: Names of the partitions added.
+    """
+    connection = Get_Pool("Maintenance").Get_Connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT PARTITION_NAME FROM INFORMATION_SCHEMA.PARTITIONS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'UsersDiabetesHistory'
+            """)
+            years = [int(row[0][1:]) for row in cursor.fetchall() if row[0] and row[0][1:].isdigit()]
+
+            # Range partitions only grow at the end, so start after the last yearly partition.
+            first = max(years) + 1 if years else date.today().year
+            missing = list(range(first, date.today().year + years_ahead + 1))
+            if not missing:
+                return []
+
+            partitions = ", ".join(
+                f"PARTITION p{year} VALUES LESS THAN ('{year + 1}-01-01')" for year in missing
+            )
+            cursor.execute(f"""
+                ALTER TABLE UsersDiabetesHistory REORGANIZE PARTITION pFuture INTO (
+                    {partitions}, PARTITION pFuture VALUES LESS THAN (MAXVALUE)
+                )
+            """)
+        added = [f"p{year}" for year in missing]
+        logging.info(f"Added UsersDiabetesHistory Partitions: {', '.join(added)}")
+        return added
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Add the Yearly Partitions of the Diabetes Assessment History.")
+    parser.add_argument("--years-ahead", type=int, default=2, help="Years after the current one to partition, 2 by default.")
+    args = parser.parse_args()
+
+    Extend_History_Partitions(args.years_ahead)
@@ -0,0 +1,51 @@
+import os
+import sys
+import logging
+import argparse
+from dotenv import load_dotenv
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services import FeatureHistogram
+from Common_Services.ConnectionPool import Get_Pool
+from Common_Services.FeatureRegistry import Enabled_Features
+
+# Set Up Logging
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()]
+)
+
+# Load Environment Variables
+load_dotenv(dotenv_path='.env')
+
+
+def Rebuild_Histograms(features: list) -> None:
+    """Rebuilds the FeatureHistograms rows of the given Features from their Tables.
+
+    Args:
+        features (list): Feature names to rebuild, every enabled feature if empty.
+    """
+    enabled = Enabled_Features()
+    unknown = [feature for feature in features if feature not in enabled]
+    if unknown:
+        raise ValueError(f"Unknown or Disabled Features: {', '.join(unknown)}")
+
+    pool = Get_Pool("Maintenance")
+    for feature in features or list(enabled):
+        table, column = enabled[feature]
+        connection = pool.Get_Connection()
+        try:
+            FeatureHistogram.Rebuild(connection, feature, table, column)
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Backfill the Materialized Feature Histograms.")
+    parser.add_argument("features", nargs="*", help="Feature names to rebuild, all enabled features by default.")
+    args = parser.parse_args()
+
+    Rebuild_Histograms(args.features)
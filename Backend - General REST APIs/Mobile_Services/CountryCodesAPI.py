@@ -1,10 +1,17 @@
 import os
+import sys
+import json
+import time
 import logging
-import pymysql
+import threading
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.EncodedResponse import EncodedBody
 
 # Set Up Logging
 logging.basicConfig(
@@ -22,30 +29,19 @@ load_dotenv(dotenv_path='.env')
 port = int(os.getenv('PORT', 5000))
 
 class CountryCodes:
-    """Handles Database Connection and Data Retrieval for Country Codes."""
+    """Handles Database Connection and Data Retrieval for Country Codes.
     
-    def __init__(self) -> None:
-        """Initializes Database Connection Parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: int = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
+    The table is essentially static, so its response body is encoded and compressed once by
+    Load() and re-read every COUNTRY_CODES_REFRESH_INTERVAL seconds in the background.
+    """
     
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the Database using the Google Cloud SQL Connector.
-        
-        Returns:
-            pymysql.connections.Connection: The database connection object.
-        """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+    def __init__(self) -> None:
+        """Initializes the Shared Database Connection Pool of the Service."""
+        self.pool: ConnectionPool = Get_Pool("CountryCodes")
+        self.refresh_interval: float = float(os.getenv("COUNTRY_CODES_REFRESH_INTERVAL", 3600))
+        self.body: Optional[EncodedBody] = None
+        self._lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
 
     def Country_Codes_Table(self) -> List[Dict[str, Any]]:
         """Fetches Country Codes from the Database.
@@ -58,7 +54,7 @@ class CountryCodes:
         """
         connection = None
         try:
-            connection = self.Database_Connection()
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
                 query = "SELECT CountryName, CountryCode FROM CountryCodes"
                 cursor.execute(query)
@@ -75,12 +71,59 @@ class CountryCodes:
             if connection:
                 connection.close()
 
+    def Refresh(self) -> EncodedBody:
+        """Re-reads the Country Codes and Encodes the Response Body once.
+        
+        Returns:
+            EncodedBody: The JSON body with its ETag and compressed variants.
+        """
+        response = {
+            "success": True,
+            "data": self.Country_Codes_Table(),
+            "message": "Country codes successfully fetched."
+        }
+        body = EncodedBody(json.dumps(response, separators=(",", ":")).encode("utf-8"), "application/json")
+        with self._lock:
+            changed = self.body is None or self.body.tag != body.tag
+            self.body = body
+        if changed:
+            logging.info(f"Country Codes Loaded with {len(response['data'])} Countries.")
+        return body
+
+    def Load(self) -> None:
+        """Encodes the Country Codes at Startup and starts the Background Refresh Thread.
+        
+        On failure the body is encoded on the first request instead.
+        """
+        try:
+            self.Refresh()
+        except Exception:
+            logging.error("Failed to Load the Country Codes at Startup", exc_info=True)
+
+        if self.refresh_interval > 0 and self._refresher is None:
+            self._refresher = threading.Thread(target=self._Refresh_Loop, name="CountryCodes", daemon=True)
+            self._refresher.start()
+
+    def _Refresh_Loop(self) -> None:
+        while True:
+            time.sleep(self.refresh_interval)
+            try:
+                self.Refresh()
+            except Exception:
+                logging.error("Failed to Refresh the Country Codes", exc_info=True)
+
+    def Country_Codes_Body(self) -> EncodedBody:
+        """Returns the Encoded Response Body, reading the table only if it was never Loaded."""
+        return self.body or self.Refresh()
+
 class CountryCodesAPI:
     """Flask API Class for Handling requests related to Country Codes."""
     
     def __init__(self) -> None:
         self.app = Flask(__name__)
         self.country_codes = CountryCodes()
+        self.country_codes.Load()
+        self.cache_control: str = f"public, max-age={int(os.getenv('COUNTRY_CODES_MAX_AGE', 86400))}"
         self.blueprint = Blueprint('CountryCodes', __name__)
         self.blueprint.add_url_rule(
             rule='/CountryCodes',
@@ -88,6 +131,12 @@ class CountryCodesAPI:
             view_func=self.Country_Codes_Data,
             methods=['POST']
         )
+        self.blueprint.add_url_rule(
+            rule='/CountryCodes',
+            endpoint='CountryCodesPublic',
+            view_func=self.Country_Codes_Public,
+            methods=['GET']
+        )
         self.app.register_blueprint(self.blueprint)
         
     def Authenticate_Request(self, req_data: Dict[str, Any]) -> bool:
@@ -117,13 +166,20 @@ class CountryCodesAPI:
             if not self.Authenticate_Request(req_data):
                 return jsonify({"success": False, "message": "Authentication failed"}), 403
 
-            data = self.country_codes.Country_Codes_Table()
-            response = {
-                "success": True,
-                "data": data,
-                "message": "Country codes successfully fetched."
-            }
-            return jsonify(response), 200
+            return self.country_codes.Country_Codes_Body().Serve(request, cache_control="private, no-cache")
+        
+        except Exception as e:
+            logging.error("An Error Occurred during the API Call", exc_info=True)
+            return jsonify({"success": False, "message": str(e)}), 400
+
+    def Country_Codes_Public(self) -> Response:
+        """Handles GET requests to fetch Country Codes, Cacheable by Browsers and CDNs.
+        
+        Returns:
+            Response: A Flask Response object containing the JSON Response, or 304 if the client's copy is current.
+        """
+        try:
+            return self.country_codes.Country_Codes_Body().Serve(request, cache_control=self.cache_control)
         
         except Exception as e:
             logging.error("An Error Occurred during the API Call", exc_info=True)
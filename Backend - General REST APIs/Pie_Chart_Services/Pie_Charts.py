@@ -1,10 +1,19 @@
 import os
+import sys
 import logging
 import pymysql
-from typing import Tuple
+from typing import List, Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services import FeatureHistogram
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.FeatureCharts import PieChart_Result
+from Common_Services.FeatureQuery import Fetch_Diagnoses
+from Common_Services.FeatureRegistry import Enabled_Features, feature_list
+from Common_Services.ResultCache import UserResultCache, Get_Result_Cache, Result_Cache_Metrics
 
 # Set Up Logging
 logging.basicConfig(
@@ -24,65 +33,45 @@ class PieChart:
     """Handles Database Interaction for Pie Charts"""
     
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
+        """Initializes the Shared Database Connection Pool and the Result Cache of the Service."""
+        self.pool: ConnectionPool = Get_Pool("PieChart")
+        self.feature_list = feature_list
+        self.cache: UserResultCache = Get_Result_Cache("PieChart")
+        self.cache.Start()
         
-        Returns:
-            pymysql.connections.Connection: The database connection object.
-        """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+    def Population_Distribution(self, feature: str, slices: int = 4) -> Tuple[bool, List[float], str]:
+        """Return the Share of Users in each equal Slice of a Feature's Diagnosis Range
         
-    def PieChart_Values(self, email:str, feature: str, table: str, column: str) -> Tuple[bool, list, str]:
-        """
-        Return Diagnosis of each Health Feature
+        Reads the materialized FeatureHistograms rows of the feature instead of the feature table.
         
         Args:
-            email (str): User's email address.
-            feature (str): Feature Name that user is using.
-            table (str): Table name of the Feature Diagnosis.
-            column (str): Column of the Feature Table where the diagnosis value exists.
+            feature (str): Feature Name of the histogram.
+            slices (int): Number of equal-width slices of the [0, 100] diagnosis range.
             
         Returns:
-            Tuple[bool, list, str]: A tuple containing a boolean indicating success, list containing values and a message.
+            Tuple[bool, List[float], str]: A tuple containing a boolean indicating success, the percentage of users per slice and a message.
         """
         connection = None
         try:
-            connection = self.Database_Connection()
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
-                
-                get_query = f"""
-                    SELECT {column}
-                    FROM {table}
-                    WHERE Email = %s;
-                """
-                cursor.execute(get_query, (email,))
-                value = cursor.fetchone()
-
-                if value and value[0] is not None:
-                    diagnosis, remaining = round(100*float(value[0]), 4), round(100 - (100*float(value[0])), 4)
-                    return True, [diagnosis, remaining], f"Here's the Latest {feature} Dignostic Value."
-                return False, [0, 100], f"Not Started using {feature} Feature Yet."
+                counts = FeatureHistogram.Read_Histogram(cursor, feature)
+
+            total = sum(counts)
+            if total == 0:
+                return False, [0] * slices, f"No {feature} Diagnosis Recorded Yet."
+            
+            shares = [0] * slices
+            for bucket, count in enumerate(counts):
+                shares[bucket * slices // len(counts)] += count
+            return True, [round((share/total)*100, 4) for share in shares], f"Here's the {feature} Population Distribution."
         
         except pymysql.MySQLError:
             logging.error("Database Error Occurred: ", exc_info=True)
-            return False, "Database Error Occurred. Please try again later."
+            return False, [], "Database Error Occurred. Please try again later."
         except Exception:
             logging.error("An Unexpected Error Occurred: ", exc_info=True)
-            return False, "An Unexpected Error Occurred. Please try again later."
+            return False, [], "An Unexpected Error Occurred. Please try again later."
         
         finally:
             if connection:
@@ -97,31 +86,33 @@ class PieChart:
         Returns:
             Tuple[bool, str]: A tuple containing a boolean indicating success and a message.
         """
+        cached = self.cache.Get(email)
+        if cached is not None:
+            return cached
+        
+        connection = None
         try:
-            feature_list = {
-                "Diabetes": ["UsersDiabetesData", "DiabetesStatus"],
-                "Asthma": None,
-                "Cadiovascular": None,
-                "Arthritis": None,
-                "Heart & Stroke": None,
-                "Migrane Control": None,
-                "Bronchitis": None,
-                "Live Condition Analysis": None
-            }
-            results = []
+            # Read every enabled Feature's Diagnosis with One Connection and One Statement.
+            connection = self.pool.Get_Connection()
+            with connection.cursor() as cursor:
+                diagnoses = Fetch_Diagnoses(cursor, email, Enabled_Features())
             
-            for key, value in feature_list.items():
-                # Remove the Condition afterward once all Services are started.
-                if value is not None:
-                    success, values, message = self.PieChart_Values(email=email,
-                                                                    feature=key,
-                                                                    table=value[0],
-                                                                    column=value[1])
-                    results.append([success, values, message])
+            results = []
+            for key, value in diagnoses.items():
+                success, values, message = PieChart_Result(feature=key, value=value)
+                results.append([success, values, message])
+            self.cache.Put(email, (True, results))
             return True, results
+        except pymysql.MySQLError:
+            logging.error("Database Error Occurred: ", exc_info=True)
+            return False, "Database Error Occurred. Please try again later."
         except Exception:
             logging.error("An Unexpected Error Occurred: ", exc_info=True)
             return False, "An Unexpected Error Occurred. Please try again later."
+        
+        finally:
+            if connection:
+                connection.close()
 
 
 class PieChartsAPI:
@@ -138,6 +129,18 @@ class PieChartsAPI:
             view_func=self.Pie_Chart,
             methods=['POST']
         )
+        self.blueprint.add_url_rule(
+            rule='/PieChart/Population',
+            endpoint='PieChartPopulation',
+            view_func=self.Pie_Chart_Population,
+            methods=['POST']
+        )
+        self.blueprint.add_url_rule(
+            rule='/PieChart/Metrics',
+            endpoint='PieChartMetrics',
+            view_func=self.Pie_Chart_Metrics,
+            methods=['POST']
+        )
         self.app.register_blueprint(self.blueprint)
         
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -176,6 +179,54 @@ class PieChartsAPI:
             logging.error("An Error Occurred during the Fetching Pie Charts Data.", exc_info=True)
             return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
 
+    def Pie_Chart_Population(self) -> Response:
+        """Handles POST requests for the Population Distribution of every enabled Feature.
+        
+        Returns:
+            Response: A Flask Response object containing the JSON Response.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            results = []
+            for key, value in self.pie_chart.feature_list.items():
+                if value is not None:
+                    success, values, message = self.pie_chart.Population_Distribution(key)
+                    results.append([success, values, message])
+            response = {"success": True, "data": results, "message": "Successfully Fetched the Population Distribution."}
+
+            return jsonify(response), 200
+        except Exception:
+            logging.error("An Error Occurred during the Fetching Population Distribution.", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
+    def Pie_Chart_Metrics(self) -> Response:
+        """Handles POST requests for the Pie Chart Result Cache Metrics.
+        
+        Returns:
+            Response: A Flask Response object containing the metrics.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            response = {
+                "success": True,
+                "data": {"caches": Result_Cache_Metrics()},
+                "message": "Successfully Fetched the Pie Chart Metrics."
+            }
+            return jsonify(response), 200
+        except Exception:
+            logging.error("An Error Occurred during the Fetching Pie Chart Metrics.", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
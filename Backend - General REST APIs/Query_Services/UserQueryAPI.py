@@ -1,10 +1,15 @@
 import os
+import sys
 import logging
 import pymysql
-from typing import Tuple
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.WriteBehind import WriteBehindBuffer
 
 # Set Up Logging
 logging.basicConfig(
@@ -23,28 +28,33 @@ port = int(os.getenv('PORT', 5000))
 class UserQuery:
     """Handles Database Interaction for Storing User Queries."""
 
+    INSERT_QUERY = """
+        INSERT INTO UsersQueries (Name, Email, Query)
+        VALUES (%s, %s, %s)
+    """
+
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the Database using Google Cloud SQL Connector.
+        """Initializes the Shared Database Connection Pool and the Write-Behind Buffer of the Service.
         
-        Returns:
-            pymysql.connections.Connection: The database connection object.
+        USER_QUERY_WRITE_BEHIND set to "false" writes every query synchronously. The buffer is
+        sized by USER_QUERY_BATCH_SIZE, USER_QUERY_FLUSH_INTERVAL and USER_QUERY_BUFFER_SIZE,
+        and USER_QUERY_WAL_PATH enables its local WAL file, which must be a different path
+        for every process of the service.
         """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        self.pool: ConnectionPool = Get_Pool("UserQuery")
+        self.buffer: Optional[WriteBehindBuffer] = None
+        if os.getenv("USER_QUERY_WRITE_BEHIND", "true").lower() == "true":
+            self.buffer = WriteBehindBuffer(
+                name="UserQuery",
+                pool=self.pool,
+                insert_query=self.INSERT_QUERY,
+                max_batch=int(os.getenv("USER_QUERY_BATCH_SIZE", 500)),
+                flush_interval=float(os.getenv("USER_QUERY_FLUSH_INTERVAL", 1)),
+                max_buffer=int(os.getenv("USER_QUERY_BUFFER_SIZE", 100000)),
+                wal_path=os.getenv("USER_QUERY_WAL_PATH") or None,
+                fsync=os.getenv("USER_QUERY_WAL_FSYNC", "true").lower() == "true"
+            )
+            self.buffer.Start()
 
     def Users_Query_Table(self, name: str, email: str, query: str) -> Tuple[bool, str]:
         """Saves the User's Query to the Database.
@@ -57,15 +67,15 @@ class UserQuery:
         Returns:
             Tuple[bool, str]: A tuple containing a success flag and a message.
         """
+        # Acknowledge once Buffered, the Flusher writes it with the next Batch
+        if self.buffer is not None and self.buffer.Append((name, email, query)):
+            return True, "Query Saved Successfully"
+        
         connection = None
         try:
-            connection = self.Database_Connection()
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
-                insert_query = """
-                    INSERT INTO UsersQueries (Name, Email, Query)
-                    VALUES (%s, %s, %s)
-                """
-                cursor.execute(insert_query, (name, email, query))
+                cursor.execute(self.INSERT_QUERY, (name, email, query))
                 connection.commit()
                 logging.info("Query saved successfully for user: %s", name)
                 return True, "Query Saved Successfully"     
@@ -94,6 +104,12 @@ class UserQueryAPI:
             view_func=self.User_Query,
             methods=['POST']
         )
+        self.blueprint.add_url_rule(
+            rule='/UserQuery/Metrics',
+            endpoint='UserQueryMetrics',
+            view_func=self.User_Query_Metrics,
+            methods=['POST']
+        )
         self.app.register_blueprint(self.blueprint)
 
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -141,10 +157,47 @@ class UserQueryAPI:
                 "message": "Failed to process query. Please try again."
             }), 500
 
+    def User_Query_Metrics(self) -> Response:
+        """Handles POST Requests for the Write-Behind Buffer and Connection Pool Metrics.
+        
+        Returns:
+            Response: A Flask Response object containing the metrics.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                logging.warning("Request Authentication Failed.")
+                return jsonify({
+                    "success": False,
+                    "message": "Authentication Failed."
+                }), 403
+
+            buffer = self.user_query.buffer
+            response = {
+                "success": True,
+                "data": {
+                    "buffer": buffer.Metrics() if buffer is not None else None,
+                    "pool": self.user_query.pool.Metrics()
+                },
+                "message": "User Query Metrics Fetched Successfully."
+            }
+            return jsonify(response), 200
+
+        except Exception:
+            logging.error("An Error Occurred while Fetching the User Query Metrics: ", exc_info=True)
+            return jsonify({
+                "success": False,
+                "message": "Failed to fetch the metrics. Please try again."
+            }), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
-            self.app.run(debug=True, host='0.0.0.0', port=port)
+            # The reloader's parent process would hold the WAL the serving child needs.
+            buffer = self.user_query.buffer
+            self.app.run(debug=True, host='0.0.0.0', port=port, use_reloader=buffer is None or buffer.wal_path is None)
         except Exception as e:
             logging.error("An Error Occurred while running the App: ", exc_info=True)
             raise e
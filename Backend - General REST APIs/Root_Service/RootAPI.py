@@ -1,6 +1,15 @@
 import os
+import sys
+import hashlib
 import logging
-from flask import Blueprint, Flask, Response
+import mimetypes
+from typing import Dict
+from urllib.parse import quote
+from flask import Blueprint, Flask, Response, request
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.EncodedResponse import EncodedBody
 
 # Set Up Logging
 logging.basicConfig(
@@ -12,22 +21,85 @@ logging.basicConfig(
 # Initialize SERVER PORT
 port = int(os.getenv('PORT', 5000))
 
+# Critical CSS of the Root Page, inlined in place of the Bootstrap and Google Fonts CDNs
+CRITICAL_CSS = """
+                        .btn {
+                            display: inline-block;
+                            padding: 0.5rem 1rem;
+                            font-family: system-ui, -apple-system, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+                            font-size: 1.25rem;
+                            line-height: 1.5;
+                            color: #0dcaf0;
+                            background-color: transparent;
+                            border: 1px solid #0dcaf0;
+                            border-radius: 0.5rem;
+                            cursor: pointer;
+                            transition: color .15s ease-in-out, background-color .15s ease-in-out;
+                        }
+                        
+                        .btn:hover {
+                            color: #000;
+                            background-color: #0dcaf0;
+                        }
+"""
+
+
 class Root:
-    def __init__(self) -> None:
-        pass
+    def __init__(self, static_folder: str) -> None:
+        """Fingerprints every Static Asset once.
+        
+        Args:
+            static_folder (str): Directory of the static assets.
+        """
+        self.assets: Dict[str, EncodedBody] = {}
+        self.asset_names: Dict[str, str] = {}
+        for name in sorted(os.listdir(static_folder)):
+            path = os.path.join(static_folder, name)
+            if not os.path.isfile(path):
+                continue
+            with open(path, "rb") as file:
+                data = file.read()
+            stem, extension = os.path.splitext(name)
+            fingerprinted = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{extension}"
+            mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            compress = mimetype.startswith("text/") or mimetype in ("application/javascript", "image/svg+xml")
+            self.assets[fingerprinted] = EncodedBody(data, mimetype, compress=compress)
+            self.asset_names[name] = fingerprinted
     
-    def RootTemplate(self) -> str:
-        """Generate the HTML content for the Root Page."""
+    def Asset_Url(self, name: str) -> str:
+        """Returns the Fingerprinted URL of a Static Asset."""
+        return f"assets/{quote(self.asset_names[name])}"
+    
+    def RootTemplate(self, inline_css: bool = False) -> str:
+        """Generate the HTML content for the Root Page.
+        
+        Args:
+            inline_css (bool): Inline the critical CSS instead of loading Bootstrap and Google Fonts from their CDNs.
+        """
         try:
+            if inline_css:
+                stylesheets, fonts, scripts = "", "", ""
+                critical_css = CRITICAL_CSS
+            else:
+                stylesheets = """<link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet"
+                        integrity="sha384-QWTKZyjpPEjISv5WaRU9OFeRpok6YctnYmDr5pNlyT2bRjXh0JMhjY6hW+ALEwIH" crossorigin="anonymous">"""
+                fonts = """@import url("https://fonts.googleapis.com/css2?family=Cinzel+Decorative:wght@400;700;900&family=Poetsen+One&display=swap");"""
+                scripts = """<script src="https://cdn.jsdelivr.net/npm/@popperjs/core@2.11.8/dist/umd/popper.min.js"
+                        integrity="sha384-I7E8VVD/ismYTF4hNIPjVp/Zjvgyol6VFvRkX/vR+Vc4jQkC+hVqc2pM8ODewa9r"
+                        crossorigin="anonymous"></script>
+                    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.min.js"
+                        integrity="sha384-0pUGZvbkm6XF6gxjEnlmuGrJXVbNuzT9qBBavbLwCsOGabYfZo0T0to5eqruptLy"
+                        crossorigin="anonymous"></script>"""
+                critical_css = ""
+            
             html_content = f"""
             <!DOCTYPE html>
             <html lang="en">
                 <head>
-                    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet"
-                        integrity="sha384-QWTKZyjpPEjISv5WaRU9OFeRpok6YctnYmDr5pNlyT2bRjXh0JMhjY6hW+ALEwIH" crossorigin="anonymous">
+                    {stylesheets}
                     <style>
-                        @import url("https://fonts.googleapis.com/css2?family=Cinzel+Decorative:wght@400;700;900&family=Poetsen+One&display=swap");
-                        
+                        {fonts}
+                        {critical_css}
                         body {{
                             background-color: #212529;
                             margin: 0;
@@ -46,7 +118,7 @@ class Root:
                         
                         .root-container h1 {{
                             display: block;
-                            font-family: "Cinzel Decorative", serif;
+                            font-family: "Cinzel Decorative", Georgia, serif;
                             font-size: 40px;
                             font-weight: 900;
                             color: white;
@@ -62,17 +134,12 @@ class Root:
                 <body>
                     <div class="root-container">
                         <div class="logo-container">
-                            <img src="static/AliveAI Logo.png" alt="Logo" width="200px" />
+                            <img src="{self.Asset_Url('AliveAI Logo.png')}" alt="Logo" width="200px" />
                         </div>
                         <h1>Welcome to Alive AI Backend</h1>
                         <button onclick="window.location.href='#'" type="button" class="btn btn-outline-info btn-lg">Getting Started</button>
                     </div>
-                    <script src="https://cdn.jsdelivr.net/npm/@popperjs/core@2.11.8/dist/umd/popper.min.js"
-                        integrity="sha384-I7E8VVD/ismYTF4hNIPjVp/Zjvgyol6VFvRkX/vR+Vc4jQkC+hVqc2pM8ODewa9r"
-                        crossorigin="anonymous"></script>
-                    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.min.js"
-                        integrity="sha384-0pUGZvbkm6XF6gxjEnlmuGrJXVbNuzT9qBBavbLwCsOGabYfZo0T0to5eqruptLy"
-                        crossorigin="anonymous"></script>
+                    {scripts}
                 </body>
             </html>
             """
@@ -83,8 +150,14 @@ class Root:
 
 class RootAPI:    
     def __init__(self) -> None:
+        """Renders the Root Page once and sets up the Blueprint.
+        
+        ROOT_INLINE_CSS set to "true" inlines the critical CSS instead of using the CDNs.
+        """
         self.app = Flask(__name__)
-        self.root = Root()
+        self.root = Root(self.app.static_folder)
+        inline_css = os.getenv("ROOT_INLINE_CSS", "false").lower() == "true"
+        self.page = EncodedBody(self.root.RootTemplate(inline_css=inline_css).encode("utf-8"), "text/html")
         self.blueprint = Blueprint('Root', __name__)
         self.blueprint.add_url_rule(
             rule='/',
@@ -92,17 +165,30 @@ class RootAPI:
             view_func=self.RootTemp,
             methods=['GET']
         )
+        self.blueprint.add_url_rule(
+            rule='/assets/<path:filename>',
+            endpoint='Assets',
+            view_func=self.Asset,
+            methods=['GET']
+        )
         self.app.register_blueprint(self.blueprint)
 
     def RootTemp(self) -> Response:
-        """Handle the Root request and return the HTML Response."""
+        """Handle the Root request and return the Pre-Rendered HTML Response."""
         try:
-            html_content = self.root.RootTemplate()
-            return Response(html_content, mimetype='text/html')
+            # Revalidated on every visit, so a redeploy is picked up at once.
+            return self.page.Serve(request, cache_control="no-cache")
         except Exception as e:
             logging.error("An Error Occurred in root_temp", exc_info=e)
             return Response("An Error Occurred while processing your request.", status=500)
 
+    def Asset(self, filename: str) -> Response:
+        """Serve a Fingerprinted Static Asset, Cacheable Forever."""
+        asset = self.root.assets.get(filename)
+        if asset is None:
+            return Response("Asset Not Found.", status=404)
+        return asset.Serve(request, cache_control="public, max-age=31536000, immutable")
+
     def run(self) -> None:
         """Run the Flask application."""
         try:
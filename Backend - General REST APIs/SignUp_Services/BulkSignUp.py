@@ -0,0 +1,293 @@
+import os
+import sys
+import csv
+import json
+import time
+import logging
+import pymysql
+import argparse
+from dotenv import load_dotenv
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.MembershipIndex import MembershipIndex, Get_Membership_Index
+from Common_Services.PasswordHasher import PasswordHasher, Get_Password_Hasher
+
+# Set Up Logging
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()]
+)
+
+# Load Environment Variables
+load_dotenv(dotenv_path='.env')
+
+
+class BulkSignUp:
+    """Handles Bulk Registration of Users streamed as NDJSON or CSV.
+
+    Rows use the same field names as the /SignUp request. Duplicates are found per chunk with
+    set logic, against the rest of the import and against UsersData, and the accepted rows of a
+    chunk are inserted with a single executemany inside one transaction.
+
+    Every row needs a plaintext ``userpassword``, which is hashed on the PasswordHasher pool, so
+    throughput is bounded by password hashing. Migrating users whose passwords are already
+    hashed is only possible from the command line, with --prehashed-passwords.
+    """
+
+    FIELDS = ["fullname", "username", "email", "userpassword", "country", "countrycode", "phone", "address"]
+    REQUIRED_FIELDS = ["fullname", "username", "email", "userpassword", "country", "countrycode", "phone", "address"]
+
+    def __init__(self) -> None:
+        """Initializes the Shared Connection Pool, Password Hasher and Membership Index."""
+        self.pool: ConnectionPool = Get_Pool("SignUp")
+        self.hasher: PasswordHasher = Get_Password_Hasher()
+        self.index: MembershipIndex = Get_Membership_Index()
+        self.chunk_size: int = int(os.getenv("BULK_SIGNUP_CHUNK_SIZE", 1000))
+
+    def Parse_Rows(self, lines: Iterable[str], data_format: str) -> Iterator[Optional[Dict[str, Any]]]:
+        """Parses a Stream of NDJSON or CSV Lines into Row Dictionaries.
+
+        Args:
+            lines (Iterable[str]): The text lines of the upload.
+            data_format (str): "ndjson" or "csv".
+
+        Yields:
+            Optional[Dict[str, Any]]: One row per record, or None for a malformed NDJSON line.
+        """
+        if data_format == "csv":
+            yield from csv.DictReader(lines)
+            return
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+                yield row if isinstance(row, dict) else None
+            except ValueError:
+                yield None
+
+    def _Validate_Row(self, row: Optional[Dict[str, Any]], prehashed: bool = False) -> Optional[str]:
+        """Returns an Error Message for a Row missing Required Fields, None if it is complete."""
+        if row is None:
+            return "Malformed Row."
+        missing = [field for field in self.REQUIRED_FIELDS if not row.get(field)]
+        if missing:
+            return f"Missing Fields: {', '.join(missing)}."
+        if prehashed and not self.hasher.Is_Hashed(row["userpassword"]):
+            return "Password is not a Supported Hash."
+        return None
+
+    def _Existing_Values(self, cursor: pymysql.cursors.Cursor, rows: List[Dict[str, Any]]) -> Dict[str, set]:
+        """Fetches the Email, Username and MobileNumber values of a Chunk already in UsersData,
+        and the Emails of Deleted Accounts not yet Purged.
+
+        Values the membership index rules out are left out of the UsersData query (its unique
+        keys catch a stale index); every Email is checked against DeletedAccounts.
+        """
+        candidates = {
+            "Email": {row["email"] for row in rows if self.index.Might_Exist("Email", row["email"])},
+            "Username": {row["username"] for row in rows if self.index.Might_Exist("Username", row["username"])},
+            "MobileNumber": {row["phone"] for row in rows if self.index.Might_Exist("MobileNumber", row["phone"])}
+        }
+        existing = {column: set() for column in candidates}
+
+        # The Email of a Deleted Account stays Reserved until it is Purged, which no Key enforces.
+        emails = {row["email"] for row in rows}
+        validate_query = f"""
+            SELECT Email, NULL, NULL FROM DeletedAccounts
+            WHERE PurgedAt IS NULL AND Email IN ({', '.join(['%s'] * len(emails))})
+        """
+        params = list(emails)
+
+        conditions = []
+        for column, values in candidates.items():
+            if values:
+                conditions.append(f"{column} IN ({', '.join(['%s'] * len(values))})")
+                params.extend(values)
+        if conditions:
+            validate_query += f" UNION ALL SELECT Email, Username, MobileNumber FROM UsersData WHERE {' OR '.join(conditions)}"
+        cursor.execute(validate_query, params)
+        for email, user_name, phone_number in cursor.fetchall():
+            existing["Email"].add(email)
+            existing["Username"].add(user_name)
+            existing["MobileNumber"].add(phone_number)
+        return existing
+
+    def _Password_Hashes(self, rows: List[Dict[str, Any]], prehashed: bool = False) -> List[str]:
+        """Hashes the Plaintext Passwords of a Chunk concurrently on the Hasher Pool.
+
+        With prehashed, the validated hashes of a migration are stored as they are.
+        """
+        if prehashed:
+            return [row["userpassword"] for row in rows]
+        futures = [self.hasher.Submit_Hash(row["userpassword"]) for row in rows]
+        return [future.result() for future in futures]
+
+    def _Insert_Chunk(self, connection, chunk: List[Dict[str, Any]], seen: Dict[str, set], results: List[Dict[str, Any]], prehashed: bool = False) -> int:
+        """Validates and Inserts one Chunk in a single Transaction.
+
+        Returns:
+            int: Number of users inserted.
+        """
+        with connection.cursor() as cursor:
+            existing = self._Existing_Values(cursor, [row for _, row in chunk])
+
+            accepted = []
+            for number, row in chunk:
+                if row["email"] in existing["Email"] or row["email"] in seen["Email"]:
+                    results.append({"row": number, "success": False, "message": "Email Already Registered."})
+                elif row["username"] in existing["Username"] or row["username"] in seen["Username"]:
+                    results.append({"row": number, "success": False, "message": "Username Already Registered."})
+                elif row["phone"] in existing["MobileNumber"] or row["phone"] in seen["MobileNumber"]:
+                    results.append({"row": number, "success": False, "message": "Phone Number Already Registered."})
+                else:
+                    seen["Email"].add(row["email"])
+                    seen["Username"].add(row["username"])
+                    seen["MobileNumber"].add(row["phone"])
+                    accepted.append((number, row))
+
+            if not accepted:
+                return 0
+
+            password_hashes = self._Password_Hashes([row for _, row in accepted], prehashed)
+            insert_query = """
+                INSERT INTO UsersData (
+                    FullName, Username, Email, `Password`, Country,
+                    CountryCode, MobileNumber, Address
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """
+            values = [
+                (row["fullname"], row["username"], row["email"], password_hash, row["country"],
+                 row["countrycode"], row["phone"], row["address"])
+                for (_, row), password_hash in zip(accepted, password_hashes)
+            ]
+            try:
+                cursor.executemany(insert_query, values)
+                connection.commit()
+            except pymysql.err.IntegrityError:
+                # A unique key caught a collision the set logic missed (e.g. a case-insensitive
+                # collation match), so retry the chunk row by row to report the offending rows.
+                connection.rollback()
+                inserted = 0
+                for (number, row), value in zip(accepted, values):
+                    try:
+                        cursor.execute(insert_query, value)
+                        connection.commit()
+                        self.index.Add_User(row["email"], row["username"], row["phone"])
+                        results.append({"row": number, "success": True, "message": "User Registered Successfully"})
+                        inserted += 1
+                    except pymysql.err.IntegrityError:
+                        connection.rollback()
+                        results.append({"row": number, "success": False, "message": "Email, Username or Phone Number Already Registered."})
+                return inserted
+
+        for number, row in accepted:
+            self.index.Add_User(row["email"], row["username"], row["phone"])
+            results.append({"row": number, "success": True, "message": "User Registered Successfully"})
+        return len(accepted)
+
+    def Users_Data_Batch(self, rows: Iterable[Optional[Dict[str, Any]]], prehashed: bool = False) -> Dict[str, Any]:
+        """Registers a Stream of Users in Chunks.
+
+        Args:
+            rows (Iterable[Optional[Dict[str, Any]]]): Rows as produced by Parse_Rows().
+            prehashed (bool): Store ``userpassword`` as an existing hash instead of hashing it,
+                for migrations run from the command line only.
+
+        A database error fails only the rows of its chunk that were not committed, so the
+        report is returned for every row.
+
+        Returns:
+            Dict[str, Any]: Totals and a per-row result report, with rows numbered from 1.
+        """
+        start = time.monotonic()
+        results: List[Dict[str, Any]] = []
+        seen: Dict[str, set] = {"Email": set(), "Username": set(), "MobileNumber": set()}
+        inserted, total = 0, 0
+
+        numbered = enumerate(rows, start=1)
+        connection = None
+        try:
+            while True:
+                batch = list(islice(numbered, self.chunk_size))
+                if not batch:
+                    break
+                total += len(batch)
+
+                chunk = []
+                for number, row in batch:
+                    error = self._Validate_Row(row, prehashed)
+                    if error:
+                        results.append({"row": number, "success": False, "message": error})
+                    else:
+                        chunk.append((number, {field: row.get(field) for field in self.FIELDS}))
+
+                if not chunk:
+                    continue
+                chunk_results: List[Dict[str, Any]] = []
+                try:
+                    if connection is None:
+                        connection = self.pool.Get_Connection()
+                    inserted += self._Insert_Chunk(connection, chunk, seen, chunk_results, prehashed)
+                except pymysql.MySQLError:
+                    # Report the Rows of the Chunk not yet Committed as Failed, and go on with
+                    # the next Chunk on a Fresh Connection.
+                    logging.error(f"Database Error Occurred Inserting the Chunk at Row {chunk[0][0]}: ", exc_info=True)
+                    inserted += sum(result["success"] for result in chunk_results)
+                    reported = {result["row"] for result in chunk_results}
+                    for number, row in chunk:
+                        if number in reported:
+                            continue
+                        seen["Email"].discard(row["email"])
+                        seen["Username"].discard(row["username"])
+                        seen["MobileNumber"].discard(row["phone"])
+                        chunk_results.append({"row": number, "success": False, "message": "Database Error Occurred. Please try again later."})
+                    if connection is not None:
+                        # The Pool rolls back, or drops a broken Connection, on close().
+                        connection.close()
+                        connection = None
+                results.extend(chunk_results)
+        finally:
+            if connection is not None:
+                connection.close()
+
+        results.sort(key=lambda result: result["row"])
+        elapsed = time.monotonic() - start
+        logging.info(f"Bulk Sign-Up Processed {total} Rows, Inserted {inserted} in {elapsed:.2f}s.")
+        return {
+            "total": total,
+            "inserted": inserted,
+            "rejected": total - inserted,
+            "seconds": round(elapsed, 3),
+            "results": results
+        }
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Bulk Register Users from an NDJSON or CSV File.")
+    parser.add_argument("path", help="Path of the NDJSON or CSV file, '-' for stdin.")
+    parser.add_argument("--format", choices=["ndjson", "csv"], help="Input format, inferred from the extension by default.")
+    parser.add_argument("--report", help="Write the per-row report as NDJSON to this path.")
+    parser.add_argument("--prehashed-passwords", action="store_true", help="Migrate userpassword values that are already hashed, rejecting plaintext ones.")
+    args = parser.parse_args()
+
+    data_format = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    bulk_sign_up = BulkSignUp()
+    bulk_sign_up.index.Load()
+
+    with (sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")) as file:
+        report = bulk_sign_up.Users_Data_Batch(bulk_sign_up.Parse_Rows(file, data_format), args.prehashed_passwords)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as file:
+            for result in report["results"]:
+                file.write(json.dumps(result) + "\n")
+    print(json.dumps({key: value for key, value in report.items() if key != "results"}))
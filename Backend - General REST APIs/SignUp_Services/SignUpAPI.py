@@ -1,10 +1,18 @@
+import io
 import os
+import sys
 import logging
 import pymysql
 from typing import Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+from BulkSignUp import BulkSignUp
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.MembershipIndex import MembershipIndex, Get_Membership_Index
+from Common_Services.PasswordHasher import PasswordHasher, Get_Password_Hasher
 
 # Set Up Logging
 logging.basicConfig(
@@ -24,27 +32,11 @@ class SignUp:
     """Handles Database Interaction for User Sign-Up."""
     
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
-        
-        Returns:
-            pymysql.connections.Connection: The database connection object.
-        """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        """Initializes the Shared Database Connection Pool, Password Hasher and Membership Index of the Service."""
+        self.pool: ConnectionPool = Get_Pool("SignUp")
+        self.hasher: PasswordHasher = Get_Password_Hasher()
+        self.index: MembershipIndex = Get_Membership_Index()
+        self.index.Load()
 
     def Users_Data_Table(self, full_name: str, user_name: str, email: str, password: str,
                       country: str, country_code: str, phone_number: str, address: str) -> Tuple[bool, str]:
@@ -65,15 +57,35 @@ class SignUp:
         """
         connection = None
         try:
-            connection = self.Database_Connection()
+            # Hash before Checking Out a Connection so the Pool is not held during the KDF
+            password_hash = self.hasher.Hash_Password(password)
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
-                # Validate if the Email, Username, or Phone number Already Exists
+                # Only Query UsersData if the Index cannot rule out every Value; the Index may be
+                # Stale, so the Unique Keys of UsersData have the last word on the Insert
+                possibly_registered = (
+                    self.index.Might_Exist("Email", email) or
+                    self.index.Might_Exist("Username", user_name) or
+                    self.index.Might_Exist("MobileNumber", phone_number)
+                )
+
+                # Validate if the Email, Username, or Phone number Already Exists; the Email
+                # of a Deleted Account stays Reserved until it is Purged, which no Key enforces
                 validate_query = """
-                    SELECT Email, Username, MobileNumber
-                    FROM UsersData
-                    WHERE Email = %s OR Username = %s OR MobileNumber = %s;
+                    SELECT Email, NULL, NULL
+                    FROM DeletedAccounts
+                    WHERE Email = %s AND PurgedAt IS NULL
                 """
-                cursor.execute(validate_query, (email, user_name, phone_number))
+                params = [email]
+                if possibly_registered:
+                    validate_query += """
+                        UNION ALL
+                        SELECT Email, Username, MobileNumber
+                        FROM UsersData
+                        WHERE Email = %s OR Username = %s OR MobileNumber = %s
+                    """
+                    params.extend([email, user_name, phone_number])
+                cursor.execute(validate_query, params)
                 existing_data = cursor.fetchall()
 
                 email_exists = any(row[0] == email for row in existing_data)
@@ -94,10 +106,15 @@ class SignUp:
                         CountryCode, MobileNumber, Address
                     ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);
                 """
-                cursor.execute(insert_query, (full_name, user_name, email, password, country, country_code, phone_number, address))
+                cursor.execute(insert_query, (full_name, user_name, email, password_hash, country, country_code, phone_number, address))
                 connection.commit()
+                self.index.Add_User(email, user_name, phone_number)
                 return True, "User Registered Successfully"
         
+        except pymysql.err.IntegrityError:
+            # A Unique Key caught a Value registered by another Process since the last Index Refresh
+            logging.warning("Sign-Up Rejected by a Unique Key: ", exc_info=True)
+            return False, "Email, Username or Phone Number Already Registered."
         except pymysql.MySQLError:
             logging.error("Database Error Occurred: ", exc_info=True)
             return False, "Database Error Occurred. Please try again later."
@@ -117,6 +134,7 @@ class SignUpAPI:
         """Initializes the Flask App and sets up the Blueprint."""
         self.app = Flask(__name__)
         self.sign_up = SignUp()
+        self.bulk_sign_up = BulkSignUp()
         self.blueprint = Blueprint('SignUp', __name__)
         self.blueprint.add_url_rule(
             rule='/SignUp',
@@ -124,6 +142,12 @@ class SignUpAPI:
             view_func=self.Sign_Up,
             methods=['POST']
         )
+        self.blueprint.add_url_rule(
+            rule='/SignUp/batch',
+            endpoint='SignUpBatch',
+            view_func=self.Sign_Up_Batch,
+            methods=['POST']
+        )
         self.app.register_blueprint(self.blueprint)
         
     def Authenticate_Request(self, req_data: dict) -> bool:
@@ -166,6 +190,39 @@ class SignUpAPI:
             logging.error("An Error Occurred during the Sign-Up Process", exc_info=True)
             return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
 
+    def Sign_Up_Batch(self) -> Response:
+        """Handles POST requests for Bulk User Sign-Up.
+        
+        The body is streamed as NDJSON, or as CSV when the Content-Type is text/csv. Since the
+        body is not JSON, the credentials are sent in the X-Auth-User, X-Auth-Password and
+        X-Auth-Token headers.
+        
+        Returns:
+            Response: A Flask Response object containing the per-row JSON Report.
+        """
+        try:
+            auth_data = {
+                "user": request.headers.get("X-Auth-User"),
+                "password": request.headers.get("X-Auth-Password"),
+                "token": request.headers.get("X-Auth-Token")
+            }
+
+            # Authenticate Request
+            if not self.Authenticate_Request(auth_data):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            # Register Users
+            data_format = "csv" if request.mimetype == "text/csv" else "ndjson"
+            lines = io.TextIOWrapper(request.stream, encoding="utf-8", newline="")
+            report = self.bulk_sign_up.Users_Data_Batch(self.bulk_sign_up.Parse_Rows(lines, data_format))
+            message = f"{report['inserted']} of {report['total']} Users Registered Successfully"
+            response = {"success": True, "data": report, "message": message}
+            return jsonify(response), 200
+
+        except Exception:
+            logging.error("An Error Occurred during the Bulk Sign-Up Process", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
     def run(self) -> None:
         """Runs the Flask App."""
         try:
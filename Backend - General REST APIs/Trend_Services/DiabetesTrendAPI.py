@@ -0,0 +1,218 @@
+import os
+import sys
+import logging
+import pymysql
+import numpy as np
+from datetime import date
+from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional, Tuple
+from flask import Blueprint, Flask, jsonify, request, Response
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.Downsample import Bucket_Average, LTTB
+
+# Set Up Logging
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    handlers=[logging.StreamHandler()]
+)
+
+# Load Environment Variables
+load_dotenv(dotenv_path='.env')
+
+# Initialize SERVER PORT
+port = int(os.getenv('PORT', 5000))
+
+
+class DiabetesTrend:
+    """Handles Database Interaction for the Diabetes Assessment Trends.
+
+    Reads the user's assessments from the UsersDiabetesHistory time series and downsamples
+    every metric on the server, with Largest-Triangle-Three-Buckets ("lttb", default) or
+    equal-width time buckets averaged ("buckets").
+    """
+
+    # Metric name, as sent to /UpdateDiabetesData, -> UsersDiabetesHistory column
+    METRICS = {
+        "Diabetes": "DiabetesStatus",
+        "HbA1c": "HbA1c",
+        "BMI": "BMI",
+        "Cholesterol Level": "CholesterolLevel",
+        "Fasting Blood Glucose": "FastingBloodGlucose",
+        "Weight": "Weight",
+        "Waist Circumference": "WaistCircumference",
+        "Hip Circumference": "HipCircumference",
+        "Waist-to-Hip Ratio": "WaistToHipRatio"
+    }
+
+    def __init__(self) -> None:
+        """Initializes the Shared Database Connection Pool and the Payload Limits of the Service."""
+        self.pool: ConnectionPool = Get_Pool("DiabetesTrend")
+        self.default_points: int = int(os.getenv("TREND_DEFAULT_POINTS", 100))
+        self.max_points: int = int(os.getenv("TREND_MAX_POINTS", 1000))
+
+    def Downsample(self, days: np.ndarray, values: np.ndarray, points: int, method: str) -> List[list]:
+        """Downsample one Metric Series to at most points Points.
+
+        Args:
+            days (np.ndarray): Date ordinals of the assessments, in order.
+            values (np.ndarray): Metric values, NaN where not recorded.
+            points (int): Maximum number of points returned.
+            method (str): "lttb" or "buckets".
+
+        Returns:
+            List[list]: [ISO date, value] pairs.
+        """
+        recorded = ~np.isnan(values)
+        days, values = days[recorded], values[recorded]
+        if method == "buckets":
+            days, values = Bucket_Average(days, values, points)
+        else:
+            kept = LTTB(days, values, points)
+            days, values = days[kept], values[kept]
+        return [[date.fromordinal(int(round(day))).isoformat(), round(float(value), 4)] for day, value in zip(days, values)]
+
+    def Trend_Data(self, email: str, metrics: Optional[List[str]] = None, points: Optional[int] = None,
+                   method: str = "lttb", start: Optional[str] = None, end: Optional[str] = None) -> Tuple[bool, Dict[str, Any], str]:
+        """Get the Downsampled Assessment Series of a User
+
+        Args:
+            email (str): User's email address.
+            metrics (Optional[List[str]]): Metric names, every metric by default.
+            points (Optional[int]): Maximum points per metric.
+            method (str): "lttb" or "buckets".
+            start (Optional[str]): First ISO date included, the partitions before it are not read.
+            end (Optional[str]): Last ISO date included.
+
+        Returns:
+            Tuple[bool, Dict[str, Any], str]: A tuple containing a boolean indicating success, the series per metric and a message.
+        """
+        metrics = metrics or list(self.METRICS)
+        unknown = [metric for metric in metrics if metric not in self.METRICS]
+        if unknown:
+            return False, {}, f"Unknown Metrics: {', '.join(unknown)}."
+        if method not in ("lttb", "buckets"):
+            return False, {}, "Method must be 'lttb' or 'buckets'."
+        points = min(max(int(points or self.default_points), 2), self.max_points)
+
+        connection = None
+        try:
+            columns = ", ".join(self.METRICS[metric] for metric in metrics)
+            conditions, params = ["Email = %s"], [email]
+            if start:
+                conditions.append("AssessmentDate >= %s")
+                params.append(date.fromisoformat(start))
+            if end:
+                conditions.append("AssessmentDate <= %s")
+                params.append(date.fromisoformat(end))
+
+            connection = self.pool.Get_Connection()
+            with connection.cursor() as cursor:
+                get_query = f"""
+                    SELECT AssessmentDate, {columns}
+                    FROM UsersDiabetesHistory
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY Version;
+                """
+                cursor.execute(get_query, params)
+                rows = cursor.fetchall()
+        except ValueError:
+            return False, {}, "Dates must be in YYYY-MM-DD Format."
+        except pymysql.MySQLError:
+            logging.error("Database Error Occurred: ", exc_info=True)
+            return False, {}, "Database Error Occurred. Please try again later."
+        except Exception:
+            logging.error("An Unexpected Error Occurred: ", exc_info=True)
+            return False, {}, "An Unexpected Error Occurred. Please try again later."
+        finally:
+            if connection:
+                connection.close()
+
+        if not rows:
+            return False, {}, "No Diabetes Assessments Recorded Yet."
+
+        try:
+            days = np.fromiter((row[0].toordinal() for row in rows), dtype=np.float64, count=len(rows))
+            table = np.array([[np.nan if value is None else float(value) for value in row[1:]] for row in rows], dtype=np.float64)
+            series = {
+                metric: self.Downsample(days, table[:, column], points, method)
+                for column, metric in enumerate(metrics)
+            }
+            return True, {"assessments": len(rows), "series": series}, "Successfully Fetched the Diabetes Trend."
+        except Exception:
+            logging.error("An Unexpected Error Occurred: ", exc_info=True)
+            return False, {}, "An Unexpected Error Occurred. Please try again later."
+
+
+class DiabetesTrendAPI:
+    """Flask API Class for Handling Diabetes Trend Requests."""
+
+    def __init__(self) -> None:
+        """Initializes the Flask App and sets up the Blueprint."""
+        self.app = Flask(__name__)
+        self.diabetes_trend = DiabetesTrend()
+        self.blueprint = Blueprint('DiabetesTrend', __name__)
+        self.blueprint.add_url_rule(
+            rule='/DiabetesTrend',
+            endpoint='DiabetesTrend',
+            view_func=self.Diabetes_Trend,
+            methods=['POST']
+        )
+        self.app.register_blueprint(self.blueprint)
+
+    def Authenticate_Request(self, req_data: dict) -> bool:
+        """Authenticates the Incoming Request based on Environment-Stored Credentials.
+
+        Args:
+            req_data (dict): The request data containing user, password, and token.
+
+        Returns:
+            bool: True if the request is authenticated, False otherwise.
+        """
+        return (
+            req_data.get("user") == os.getenv("AUTH_NAME") and
+            req_data.get("password") == os.getenv("AUTH_PASSWORD") and
+            req_data.get("token") == os.getenv("AUTH_TOKEN_TREND")
+        )
+
+    def Diabetes_Trend(self) -> Response:
+        """Handles POST requests for the Diabetes Trend of a User.
+
+        Returns:
+            Response: A Flask Response object containing the JSON Response.
+        """
+        try:
+            req_data = request.get_json()
+
+            # Authenticate Request
+            if not self.Authenticate_Request(req_data):
+                return jsonify({"success": False, "message": "Authentication failed"}), 403
+
+            success, data, message = self.diabetes_trend.Trend_Data(
+                email=req_data["email"],
+                metrics=req_data.get("metrics"),
+                points=req_data.get("points"),
+                method=req_data.get("method", "lttb"),
+                start=req_data.get("start"),
+                end=req_data.get("end")
+            )
+            return jsonify({"success": success, "data": data, "message": message}), 200
+        except Exception:
+            logging.error("An Error Occurred during the Fetching Diabetes Trend.", exc_info=True)
+            return jsonify({"success": False, "message": "An Error Occurred. Please try again later."}), 500
+
+    def run(self) -> None:
+        """Runs the Flask App."""
+        try:
+            self.app.run(debug=True, host='0.0.0.0', port=port)
+        except Exception:
+            logging.error("An Error Occurred while running the App", exc_info=True)
+
+
+if __name__ == "__main__":
+
+    diabetes_trend_api = DiabetesTrendAPI()
+    diabetes_trend_api.run()
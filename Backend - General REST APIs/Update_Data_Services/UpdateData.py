@@ -1,10 +1,18 @@
 import os
+import sys
 import logging
 import pymysql
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.FeatureRegistry import Enabled_Features
+from Common_Services.MembershipIndex import MembershipIndex, Get_Membership_Index
+from Common_Services.PasswordHasher import PasswordHasher, Get_Password_Hasher
+from Common_Services.ResultCache import Invalidate_User, Record_Invalidation
 
 # Set Up Logging
 logging.basicConfig(
@@ -21,72 +29,179 @@ port = int(os.getenv('PORT', 5000))
 
 
 class UpdateData:
-    """Handles Database Interaction for User Data Update."""
-    
+    """Handles Database Interaction for User Data Update.
+
+    Updates are partial: the submitted fields are compared with the current row and only the
+    columns that changed are written, uniqueness is re-validated only for changed unique keys,
+    and an Email change is carried over to the user's rows in the dependent tables in the same
+    transaction.
+    """
+
+    # Request Field -> UsersData Column
+    FIELDS = {
+        "fullname": "FullName",
+        "username": "Username",
+        "email": "Email",
+        "userpassword": "Password",
+        "country": "Country",
+        "countrycode": "CountryCode",
+        "phone": "MobileNumber",
+        "address": "Address"
+    }
+
+    UNIQUE_MESSAGES = {
+        "Email": "Email Already Registered.",
+        "Username": "Username Already Registered.",
+        "MobileNumber": "Phone Number Already Registered."
+    }
+
+    # Tables whose Rows are keyed by the User's Email, besides the Feature Tables
+    EMAIL_TABLES = ("UsersDiabetesHistory", "UsersQueries")
+
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
-        
+        """Initializes the Shared Database Connection Pool, Password Hasher and Membership Index of the Service."""
+        self.pool: ConnectionPool = Get_Pool("UpdateData")
+        self.hasher: PasswordHasher = Get_Password_Hasher()
+        self.index: MembershipIndex = Get_Membership_Index()
+
+    def _Current_Password(self, email: str) -> Tuple[bool, Optional[str]]:
+        """Reads the Stored Password of a User, without holding a Connection during the KDF."""
+        connection = self.pool.Get_Connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT `Password` FROM UsersData WHERE Email = %s", (email,))
+                row = cursor.fetchone()
+            connection.commit()
+        finally:
+            connection.close()
+        return row is not None, row[0] if row else None
+
+    def _Password_Change(self, password: str, stored: Optional[str]) -> Optional[str]:
+        """Returns the Hash to Store for a Submitted Plaintext Password, None if it is Unchanged."""
+        matches, needs_rehash = self.hasher.Verify_Password(password, stored)
+        if matches and not needs_rehash:
+            return None
+        return self.hasher.Hash_Password(password)
+
+    def _Taken_Values(self, cursor: pymysql.cursors.Cursor, old_email: str, changed: Dict[str, Any]) -> Optional[str]:
+        """Re-Validates the Changed Unique Keys, skipping the UsersData Values the Membership Index rules out.
+
+        A stale index is caught by the unique keys of UsersData; a new Email is always checked
+        against the Deleted Accounts not yet Purged, which no key covers.
+
         Returns:
-            pymysql.connections.Connection: The database connection object.
+            Optional[str]: The error message of the first key already registered, None if all are free.
         """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        candidates = {
+            column: value for column, value in changed.items()
+            if column in self.UNIQUE_MESSAGES and self.index.Might_Exist(column, value)
+        }
+        queries, params = [], []
+        if candidates:
+            conditions = " OR ".join(f"{column} = %s" for column in candidates)
+            queries.append(f"SELECT Email, Username, MobileNumber FROM UsersData WHERE Email <> %s AND ({conditions})")
+            params.extend([old_email, *candidates.values()])
+        if "Email" in changed:
+            # The Email of a Deleted Account stays Reserved until it is Purged.
+            queries.append("SELECT Email, NULL, NULL FROM DeletedAccounts WHERE Email = %s AND PurgedAt IS NULL")
+            params.append(changed["Email"])
+        if not queries:
+            return None
+        cursor.execute(" UNION ALL ".join(queries), params)
+        existing_data = cursor.fetchall()
+
+        for position, column in enumerate(("Email", "Username", "MobileNumber")):
+            if column in changed and any(row[position] == changed[column] for row in existing_data):
+                return self.UNIQUE_MESSAGES[column]
+        return None
+
+    def Users_Data_Table(self, old_email: str, fields: Dict[str, Any]) -> Tuple[bool, str]:
+        """Update Data of an User in the Database, writing only the Changed Columns
 
-    def Users_Data_Table(self, full_name: str, user_name: str, email: str, password: str,
-                      country: str, country_code: str, phone_number: str, address: str, old_email: str) -> Tuple[bool, str]:
-        """Update Data of an User in the Database
-        
         Args:
-            full_name (str): User's full name.
-            user_name (str): Desired username.
-            email (str): User's email address.
-            password (str): User's password.
-            country (str): Country of residence.
-            country_code (str): Country code.
-            phone_number (str): User's phone number.
-            address (str): User's address.
-        
+            old_email (str): Current email address of the user.
+            fields (Dict[str, Any]): Submitted fields by request name (fullname, username, email,
+                userpassword, country, countrycode, phone, address); fields left out are unchanged.
+
         Returns:
             Tuple[bool, str]: A tuple containing a boolean indicating success and a message.
         """
         connection = None
         try:
-            connection = self.Database_Connection()
+            submitted = {self.FIELDS[field]: value for field, value in fields.items() if field in self.FIELDS}
+
+            # Compare the Password before Checking Out the Transaction's Connection so the Pool is not held during the KDF
+            new_password, stored_password = None, None
+            if submitted.get("Password") is not None:
+                found, stored_password = self._Current_Password(old_email)
+                if not found:
+                    return False, "No User Found with the Given Email."
+                new_password = self._Password_Change(submitted["Password"], stored_password)
+            submitted.pop("Password", None)
+
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
-                # Update User Data in Database
-                update_query = """
-                    UPDATE UsersData
-                    SET 
-                        FullName = %s,
-                        Username = %s,
-                        Email = %s,
-                        Password = %s,
-                        Country = %s,
-                        CountryCode = %s,
-                        MobileNumber = %s,
-                        Address = %s
-                    WHERE 
-                        Email = %s;
+                cursor.execute(f"""
+                    SELECT `Password`, {', '.join(submitted) or 'Email'}
+                    FROM UsersData
+                    WHERE Email = %s
+                    FOR UPDATE;
+                """, (old_email,))
+                row = cursor.fetchone()
+                if row is None:
+                    connection.rollback()
+                    return False, "No User Found with the Given Email."
+                if new_password is not None and row[0] != stored_password:
+                    connection.rollback()
+                    return False, "User Data Changed Concurrently. Please try again."
+
+                # Compare as Text, as a JSON Number may be submitted for a VARCHAR Column
+                current = dict(zip(submitted, row[1:]))
+                changed = {
+                    column: value for column, value in submitted.items()
+                    if (None if value is None else str(value)) != (None if current[column] is None else str(current[column]))
+                }
+                if new_password is not None:
+                    changed["Password"] = new_password
+                if not changed:
+                    connection.rollback()
+                    return True, "No Changes to Update."
+
+                error = self._Taken_Values(cursor, old_email, changed)
+                if error:
+                    connection.rollback()
+                    return False, error
 
+                # Update only the Changed Columns of the User Data
+                update_query = f"""
+                    UPDATE UsersData
+                    SET {', '.join(f'`{column}` = %s' for column in changed)}
+                    WHERE Email = %s;
                 """
-                cursor.execute(update_query, (full_name, user_name, email, password, country, country_code, phone_number, address, old_email))
+                cursor.execute(update_query, (*changed.values(), old_email))
+
+                email = changed.get("Email", old_email)
+                if "Email" in changed:
+                    # Re-Key the User's Rows in the Dependent Tables with the UsersData Row
+                    tables = [table for table, _ in Enabled_Features().values()] + list(self.EMAIL_TABLES)
+                    for table in tables:
+                        cursor.execute(f"UPDATE {table} SET Email = %s WHERE Email = %s", (email, old_email))
+                    # Cached Dashboard Results are keyed by Email
+                    Record_Invalidation(cursor, old_email, email)
                 connection.commit()
 
+                if "Email" in changed:
+                    Invalidate_User(old_email, email)
+                for column in self.UNIQUE_MESSAGES:
+                    if column in changed:
+                        self.index.Remove(column, current[column])
+                self.index.Add_User(changed.get("Email"), changed.get("Username"), changed.get("MobileNumber"))
+                logging.info(f"Updated User Columns: {', '.join(changed)}")
                 return True, "User Data Updated Successfully"
+        except pymysql.err.IntegrityError:
+            # A Unique Key caught a Value registered by another Process since the last Index Refresh
+            logging.warning("User Data Update Rejected by a Unique Key: ", exc_info=True)
+            return False, "Email, Username or Phone Number Already Registered."
         except pymysql.MySQLError:
             logging.error("Database Error Occurred: ", exc_info=True)
             return False, "Database Error Occurred. Please try again later."
@@ -110,7 +225,7 @@ class UpdateDataAPI:
             rule='/UpdateData',
             endpoint='UpdateData',
             view_func=self.Update_Data,
-            methods=['POST']
+            methods=['POST', 'PATCH']
         )
         self.app.register_blueprint(self.blueprint)
         
@@ -130,7 +245,9 @@ class UpdateDataAPI:
         )
 
     def Update_Data(self) -> Response:
-        """Handles POST requests for User Update Data.
+        """Handles POST and PATCH requests for User Update Data.
+        
+        Only old_email is required; the user data fields left out of the request are unchanged.
         
         Returns:
             Response: A Flask Response object containing the JSON Response.
@@ -142,10 +259,10 @@ class UpdateDataAPI:
             if not self.Authenticate_Request(req_data):
                 return jsonify({"success": False, "message": "Authentication failed"}), 403
 
-            # Register User
+            # Update User
             success, message = self.update_data.Users_Data_Table(
-                req_data["fullname"], req_data["username"], req_data["email"], req_data["userpassword"],
-                req_data["country"], req_data["countrycode"], req_data["phone"], req_data["address"], req_data["old_email"]
+                req_data["old_email"],
+                {field: req_data[field] for field in UpdateData.FIELDS if field in req_data}
             )
             response = {"success": success, "message": message}
             return jsonify(response), 200
@@ -1,11 +1,19 @@
 import os
+import sys
 import logging
 import pymysql
 from typing import Tuple
 from datetime import date
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services import FeatureHistogram
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.FeatureChanges import Record_Change
+from Common_Services.QuantileSketch import SharedQuantileSketch, Get_Quantile_Sketch
+from Common_Services.ResultCache import Invalidate_User, Record_Invalidation
 
 # Set Up Logging
 logging.basicConfig(
@@ -24,28 +32,61 @@ port = int(os.getenv('PORT', 5000))
 class UpdateDiabetesData:
     """Handles Database Interaction for User Diabetes Data Update."""
     
+    UPDATE_QUERY = """
+        UPDATE UsersDiabetesData
+        SET 
+            Age = %s,
+            Gender = %s,
+            Weight = %s,
+            Height = %s,
+            FamilyHistory = %s,
+            PhysicalActivityLevel = %s,
+            DietaryHabits = %s,
+            EthnicityRace = %s,
+            MedicationUse = %s,
+            SleepDurationQuality = %s,
+            StressLevels = %s,
+            WaistCircumference = %s,
+            HipCircumference = %s,
+            SmokingStatus = %s,
+            FastingBloodGlucose = %s,
+            HbA1c = %s,
+            WaistToHipRatio = %s,
+            BMI = %s,
+            CholesterolLevel = %s,
+            DiabetesStatus = %s,
+            DiabetesCategory = %s,
+            OperationCount = COALESCE(OperationCount, 0) + 1,
+            LastDate = %s
+        WHERE
+            Email = %s AND OperationCount <=> %s
+    """
+    
+    # Copies the Row just Updated, so the Version is the one this Transaction wrote
+    HISTORY_QUERY = """
+        INSERT INTO UsersDiabetesHistory (
+            Email, Version, AssessmentDate, Weight, WaistCircumference, HipCircumference,
+            FastingBloodGlucose, HbA1c, WaistToHipRatio, BMI, CholesterolLevel, DiabetesStatus, DiabetesCategory
+        )
+        SELECT
+            Email, OperationCount, LastDate, Weight, WaistCircumference, HipCircumference,
+            FastingBloodGlucose, HbA1c, WaistToHipRatio, BMI, CholesterolLevel, DiabetesStatus, DiabetesCategory
+        FROM UsersDiabetesData
+        WHERE Email = %s
+    """
+    
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
-        
-        Returns:
-            pymysql.connections.Connection: The database connection object.
+        """Initializes the Shared Database Connection Pool and the Diabetes Quantile Sketch of the Service.
+
+        The histogram and the FeatureChanges feed are updated in the write's transaction, the
+        BarChart Order Statistics Index polls that feed, and the sketch is shared through the database.
         """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        self.pool: ConnectionPool = Get_Pool("UpdateDiabetesData")
+        self.max_retries: int = int(os.getenv("DIABETES_UPDATE_RETRIES", 3))
+        self.diabetes_sketch: SharedQuantileSketch = Get_Quantile_Sketch("Diabetes", "UsersDiabetesData", "DiabetesStatus")
+        if os.getenv("PERCENTILE_MODE", "exact").lower() == "approximate":
+            # Publishes the values written here as this worker's delta sketch.
+            self.diabetes_sketch.Start()
 
     def Users_Diabetes_Data_Table(self, email: str, data: dict) -> Tuple[bool, str]:
         """Update Diabetes Data of an User in the Database
@@ -59,91 +100,74 @@ class UpdateDiabetesData:
         """
         connection = None
         try:
-            connection = self.Database_Connection()
-            with connection.cursor() as cursor:
-                fetch_OprCount = """
-                  SELECT OperationCount
-                  FROM UsersDiabetesData
-                  WHERE Email = %s;
-                """
-                cursor.execute(fetch_OprCount, (email,))
+            LastDate = date.today()
+            
+            # Define the values to update
+            values = (
+                data["Age"],
+                data["Gender"],
+                data["Weight"],
+                data["Height"],
+                data["Family History"],
+                data["Physical Activity Level"],
+                data["Dietary Habits"],
+                data["Ethinicity/Race"],
+                data["Medication Use"],
+                data["Sleep Quality"],
+                data["Stress Levels"],
+                data["Waist Circumference"],
+                data["Hip Circumference"],
+                data["Smoking Status"],
+                data["Fasting Blood Glucose"],
+                data["HbA1c"],
+                data["Waist-to-Hip Ratio"],
+                data["BMI"],
+                data["Cholesterol Level"],
+                data["Diabetes"],
+                data["Diabetes Category"],
+                LastDate
+            )
+            
+            connection = self.pool.Get_Connection()
+            for attempt in range(self.max_retries):
+                with connection.cursor() as cursor:
+                    # Plain Consistent Read, no Row Lock is held until the Update
+                    fetch_OprCount = """
+                      SELECT OperationCount, DiabetesStatus
+                      FROM UsersDiabetesData
+                      WHERE Email = %s;
+                    """
+                    cursor.execute(fetch_OprCount, (email,))
+                    row = cursor.fetchone()
+                    if row is None:
+                        return False, "Email does not exists."
+                    
+                    OperationCount, OldDiabetesStatus = row
+                    None_Value = lambda d: any(value is None for value in d.values())
+                    if OperationCount is not None and None_Value(data):
+                        return False, "Missing Diabetes Data from the Table."
+                    
+                    # Update only if no other Write happened since the Read, Incrementing the Count Server-Side
+                    cursor.execute(self.UPDATE_QUERY, values + (email, OperationCount))
+                    if cursor.rowcount == 0:
+                        # Lost the Race: drop the Snapshot so the Retry reads the Latest Row
+                        connection.rollback()
+                        continue
+                    
+                    cursor.execute(self.HISTORY_QUERY, (email,))
+                    # Move the User between Histogram Buckets in the same Transaction as the Score.
+                    FeatureHistogram.Apply_Change(cursor, "Diabetes", OldDiabetesStatus, data["Diabetes"])
+                    Record_Change(cursor, "Diabetes", OldDiabetesStatus, data["Diabetes"])
+                    Record_Invalidation(cursor, email)
+                    connection.commit()
                 
-                try:
-                    OperationCount = cursor.fetchone()[0]
-                    if OperationCount == None:
-                        OperationCount = 1
-                    else:
-                        None_Value = lambda d: any(value is None for value in d.values())
-                        if None_Value(data):
-                            return False, "Missing Diabetes Data from the Table."
-                        OperationCount += 1
-                except:
-                    return False, "Email does not exists."
+                Invalidate_User(email)
+                self.diabetes_sketch.Update(data["Diabetes"])
                 
-                LastDate = date.today()
-                   
-                # Update User Diabetes Data in Database
-                update_query = """
-                 UPDATE UsersDiabetesData
-                 SET 
-                     Age = %s,
-                     Gender = %s,
-                     Weight = %s,
-                     Height = %s,
-                     FamilyHistory = %s,
-                     PhysicalActivityLevel = %s,
-                     DietaryHabits = %s,
-                     EthnicityRace = %s,
-                     MedicationUse = %s,
-                     SleepDurationQuality = %s,
-                     StressLevels = %s,
-                     WaistCircumference = %s,
-                     HipCircumference = %s,
-                     SmokingStatus = %s,
-                     FastingBloodGlucose = %s,
-                     HbA1c = %s,
-                     WaistToHipRatio = %s,
-                     BMI = %s,
-                     CholesterolLevel = %s,
-                     DiabetesStatus = %s,
-                     DiabetesCategory = %s,
-                     OperationCount = %s,
-                     LastDate = %s
-                WHERE
-                     Email = %s
-                """
-                
-                # Define the values to update
-                values = (
-                    data["Age"],
-                    data["Gender"],
-                    data["Weight"],
-                    data["Height"],
-                    data["Family History"],
-                    data["Physical Activity Level"],
-                    data["Dietary Habits"],
-                    data["Ethinicity/Race"],
-                    data["Medication Use"],
-                    data["Sleep Quality"],
-                    data["Stress Levels"],
-                    data["Waist Circumference"],
-                    data["Hip Circumference"],
-                    data["Smoking Status"],
-                    data["Fasting Blood Glucose"],
-                    data["HbA1c"],
-                    data["Waist-to-Hip Ratio"],
-                    data["BMI"],
-                    data["Cholesterol Level"],
-                    data["Diabetes"],
-                    data["Diabetes Category"],
-                    OperationCount,
-                    LastDate,
-                    email
-                )
-                cursor.execute(update_query, values)
-                connection.commit()
-
                 return True, "User Diabetes Data Updated Successfully"
+            
+            logging.warning(f"Gave up Updating Diabetes Data after {self.max_retries} Concurrent Writes.")
+            return False, "Diabetes Data is being Updated Concurrently. Please try again."
         except pymysql.MySQLError:
             logging.error("Database Error Occurred: ", exc_info=True)
             return False, "Database Error Occurred. Please try again later."
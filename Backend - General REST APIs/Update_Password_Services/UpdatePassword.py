@@ -1,10 +1,15 @@
 import os
+import sys
 import logging
 import pymysql
 from typing import Tuple
 from dotenv import load_dotenv
 from flask import Blueprint, Flask, jsonify, request, Response
-from google.cloud.sql.connector import Connector, IPTypes
+
+# Shared Modules of the General REST APIs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Common_Services.ConnectionPool import ConnectionPool, Get_Pool
+from Common_Services.PasswordHasher import PasswordHasher, Get_Password_Hasher
 
 # Set Up Logging
 logging.basicConfig(
@@ -24,27 +29,9 @@ class UpdatePassword:
     """Handles Database Interaction for Update Password."""
     
     def __init__(self) -> None:
-        """Initializes Database Connection parameters from Environment Variables."""
-        self.user: str = os.getenv("USER")
-        self.password: str = os.getenv("PASSWORD")
-        self.host: str = os.getenv("HOST")
-        self.port: str = int(os.getenv("PORT"))
-        self.database: str = os.getenv("DATABASE")
-
-    def Database_Connection(self) -> pymysql.connections.Connection:
-        """Establishes a Connection to the database using the Google Cloud SQL Connector.
-        
-        Returns:
-            pymysql.connections.Connection: The database connection object.
-        """
-        connector = Connector(IPTypes.PUBLIC)
-        return connector.connect(
-            self.host,
-            "pymysql",
-            user=self.user,
-            password=self.password,
-            db=self.database
-        )
+        """Initializes the Shared Database Connection Pool and Password Hasher of the Service."""
+        self.pool: ConnectionPool = Get_Pool("UpdatePassword")
+        self.hasher: PasswordHasher = Get_Password_Hasher()
 
     def Users_Data_Table(self, email: str, new_password: str, confirm_password: str) -> Tuple[bool, str]:
         """Update Account Password in the Database.
@@ -62,7 +49,8 @@ class UpdatePassword:
             if new_password != confirm_password:
                 return False, "Password and Confirm Password didn't matched."
             
-            connection = self.Database_Connection()
+            password_hash = self.hasher.Hash_Password(new_password)
+            connection = self.pool.Get_Connection()
             with connection.cursor() as cursor:
                 # Update Accouunt Password
                 update_query = """
@@ -70,7 +58,7 @@ class UpdatePassword:
                     SET Password = %s
                     WHERE Email = %s;
                 """
-                cursor.execute(update_query, (new_password, email))
+                cursor.execute(update_query, (password_hash, email))
                 connection.commit()
 
                 return True, "Password Updated Successfully."